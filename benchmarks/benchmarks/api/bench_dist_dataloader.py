@@ -0,0 +1,46 @@
+import time
+import dgl
+import torch
+import numpy as np
+
+from .. import utils
+
+NUM_SEEDS = 2000000
+BATCH_SIZE = 1000
+NUM_BATCHES = 200
+
+def _create_dataset(dataset_type):
+    seeds = torch.randperm(NUM_SEEDS)
+    half = NUM_SEEDS // 2
+    if dataset_type == 'tensor':
+        return seeds
+    elif dataset_type == 'list':
+        # item-by-item path
+        return seeds.tolist()
+    elif dataset_type == 'dict':
+        return {'user': seeds[:half], 'item': seeds[half:]}
+    else:
+        # item-by-item path with type-ID pairs
+        return [('user', i) for i in seeds[:half].tolist()] + \
+            [('item', i) for i in seeds[half:].tolist()]
+
+@utils.benchmark('time', timeout=600)
+@utils.parametrize('dataset_type', ['tensor', 'list', 'dict', 'pair_list'])
+@utils.parametrize('shuffle', [True, False])
+def track_time(dataset_type, shuffle):
+    dataset = _create_dataset(dataset_type)
+    dataloader = dgl.distributed.DistDataLoader(dataset, BATCH_SIZE, shuffle=shuffle,
+                                                collate_fn=lambda x: x)
+
+    # dry run
+    iter(dataloader)
+    for i in range(3):
+        dataloader._next_data()
+
+    # timing: per-batch dispatch latency
+    iter(dataloader)
+    with utils.Timer() as t:
+        for i in range(NUM_BATCHES):
+            dataloader._next_data()
+
+    return t.elapsed_secs / NUM_BATCHES
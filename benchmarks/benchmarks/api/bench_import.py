@@ -0,0 +1,25 @@
+import subprocess
+import sys
+
+from .. import utils
+
+NUM_RUNS = 5
+
+@utils.benchmark('time', timeout=600)
+@utils.parametrize('submodule', ['none', 'dataloading', 'distributed', 'data'])
+def track_time(submodule):
+    # Import in a fresh interpreter each time so that nothing is cached in sys.modules.
+    code = 'import dgl'
+    if submodule != 'none':
+        code += '; dgl.{}'.format(submodule)
+    cmd = [sys.executable, '-c', code]
+
+    # dry run
+    subprocess.check_call(cmd)
+
+    # timing
+    with utils.Timer() as t:
+        for i in range(NUM_RUNS):
+            subprocess.check_call(cmd)
+
+    return t.elapsed_secs / NUM_RUNS
@@ -0,0 +1,42 @@
+import dgl
+import torch
+from dgl.nn.pytorch import GraphConv, SAGEConv, GATConv, HeteroGraphConv
+from .. import utils
+
+
+@utils.benchmark('time')
+@utils.parametrize('module', ['graphconv', 'sageconv', 'gatconv'])
+@utils.parametrize('num_relations', [10, 100])
+@utils.parametrize('fused', [False, True])
+def track_time(module, num_relations, fused):
+    device = utils.get_bench_device()
+    feat_dim = 32
+    num_nodes = 2000
+    ntypes = ['n{}'.format(i) for i in range(4)]
+    data_dict = {}
+    mods = {}
+    for i in range(num_relations):
+        src = torch.randint(0, num_nodes, (5000,))
+        dst = torch.randint(0, num_nodes, (5000,))
+        data_dict[(ntypes[i % 4], 'e{}'.format(i), ntypes[(i // 4) % 4])] = (src, dst)
+        if module == 'graphconv':
+            mods['e{}'.format(i)] = GraphConv(feat_dim, feat_dim)
+        elif module == 'sageconv':
+            mods['e{}'.format(i)] = SAGEConv(feat_dim, feat_dim, 'mean')
+        else:
+            mods['e{}'.format(i)] = GATConv(feat_dim, feat_dim // 4, num_heads=4)
+    graph = dgl.heterograph(
+        data_dict, num_nodes_dict={ntype: num_nodes for ntype in ntypes}).to(device)
+    feats = {ntype: torch.randn(num_nodes, feat_dim, device=device) for ntype in ntypes}
+    conv = HeteroGraphConv(mods, fused=fused).to(device).eval()
+
+    with torch.no_grad():
+        # dry run
+        for i in range(3):
+            conv(graph, feats)
+        # timing
+        with utils.Timer() as t:
+            for i in range(10):
+                conv(graph, feats)
+
+    return t.elapsed_secs / 10
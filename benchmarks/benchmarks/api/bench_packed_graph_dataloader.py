@@ -0,0 +1,25 @@
+import dgl
+
+from .. import utils
+
+
+@utils.benchmark('time')
+@utils.parametrize('batch_size', [32, 256, 1024])
+@utils.parametrize('packed', [False, True])
+def track_time(batch_size, packed):
+    ds = dgl.data.QM7bDataset()
+    if packed:
+        ds = dgl.data.PackedGraphDataset(ds)
+    dataloader = dgl.dataloading.GraphDataLoader(ds, batch_size=batch_size, shuffle=True)
+
+    # dry run
+    for i, _ in enumerate(dataloader):
+        if i == 3:
+            break
+
+    # timing
+    with utils.Timer() as t:
+        for _ in dataloader:
+            pass
+
+    return t.elapsed_secs / len(dataloader)
@@ -0,0 +1,56 @@
+import time
+import dgl
+import torch
+import numpy as np
+
+from dgl.distributed.graph_partition_book import RangePartitionBook
+
+from .. import utils
+
+NUM_PARTS = 8
+NUM_NODES_PER_TYPE = 4000000
+NTYPES = ['n0', 'n1', 'n2']
+
+def _create_partition_book():
+    node_map = {}
+    size = NUM_NODES_PER_TYPE // NUM_PARTS
+    for i, ntype in enumerate(NTYPES):
+        starts = np.arange(NUM_PARTS) * size * len(NTYPES) + i * size
+        node_map[ntype] = np.stack([starts, starts + size], 1).astype(np.int64)
+    return RangePartitionBook(0, NUM_PARTS, node_map, {'e0': node_map['n0']},
+                              {ntype: i for i, ntype in enumerate(NTYPES)}, {'e0': 0})
+
+@utils.benchmark('time', timeout=600)
+@utils.parametrize('num_ids', [1000000, 4000000])
+@utils.parametrize('op', ['nid2partid', 'typed_nid2partid', 'nid2localnid',
+                          'map_to_homo_nid', 'map_to_homo_nids'])
+def track_time(num_ids, op):
+    gpb = _create_partition_book()
+    num_nodes = NUM_NODES_PER_TYPE * len(NTYPES)
+    homo_ids = torch.randint(0, num_nodes, (num_ids,), dtype=torch.int64)
+    typed_ids = {ntype: torch.randint(0, NUM_NODES_PER_TYPE, (num_ids // len(NTYPES),),
+                                      dtype=torch.int64) for ntype in NTYPES}
+    local_ids = torch.randint(0, NUM_NODES_PER_TYPE // NUM_PARTS, (num_ids,),
+                              dtype=torch.int64)
+
+    if op == 'nid2partid':
+        func = lambda: gpb.nid2partid(homo_ids)
+    elif op == 'typed_nid2partid':
+        func = lambda: [gpb.nid2partid(ids, ntype) for ntype, ids in typed_ids.items()]
+    elif op == 'nid2localnid':
+        func = lambda: gpb.nid2localnid(local_ids, 0)
+    elif op == 'map_to_homo_nid':
+        func = lambda: [gpb.map_to_homo_nid(ids, ntype) for ntype, ids in typed_ids.items()]
+    else:
+        func = lambda: gpb.map_to_homo_nids(typed_ids)
+
+    # dry run
+    for i in range(3):
+        func()
+
+    # timing
+    with utils.Timer() as t:
+        for i in range(10):
+            func()
+
+    return t.elapsed_secs / 10
@@ -0,0 +1,46 @@
+import dgl
+import torch
+from dgl.sampling.pinsage import _select_pinsage_neighbors
+
+from .. import utils
+
+def _random_walk_path(sampler, seeds):
+    # The path taken before the neighbors are selected natively.
+    seeds = torch.repeat_interleave(seeds, sampler.num_random_walks, 0)
+    paths, _ = dgl.sampling.random_walk(
+        sampler.G, seeds, metapath=sampler.full_metapath, restart_prob=sampler.restart_prob)
+    hops = sampler.metapath_hops
+    src = paths[:, hops::hops].reshape(-1)
+    dst = torch.repeat_interleave(paths[:, 0], sampler.num_traversals, 0)
+    src, dst, counts = _select_pinsage_neighbors(
+        src, dst, sampler.num_random_walks * sampler.num_traversals, sampler.num_neighbors)
+    neighbor_graph = dgl.graph((src, dst), num_nodes=sampler.G.num_nodes(sampler.ntype))
+    neighbor_graph.edata[sampler.weight_column] = counts
+    return neighbor_graph
+
+@utils.benchmark('time')
+@utils.parametrize('num_seeds', [1000, 10000])
+@utils.parametrize('num_random_walks', [10, 100])
+@utils.parametrize('native', [False, True])
+def track_time(num_seeds, num_random_walks, native):
+    num_users, num_items, num_edges = 100000, 50000, 2000000
+    users = torch.randint(0, num_users, (num_edges,))
+    items = torch.randint(0, num_items, (num_edges,))
+    g = dgl.heterograph({
+        ('user', 'clicks', 'item'): (users, items),
+        ('item', 'clicked-by', 'user'): (items, users)},
+        num_nodes_dict={'user': num_users, 'item': num_items})
+    sampler = dgl.sampling.PinSAGESampler(g, 'item', 'user', 3, 0.5, num_random_walks, 10)
+    seeds = torch.randint(0, num_items, (num_seeds,))
+    sample = sampler if native else lambda seeds: _random_walk_path(sampler, seeds)
+
+    # dry run
+    for i in range(3):
+        sample(seeds)
+
+    # timing
+    with utils.Timer() as t:
+        for i in range(10):
+            sample(seeds)
+
+    return t.elapsed_secs / 10
@@ -0,0 +1,29 @@
+import dgl
+
+from .. import utils
+
+@utils.benchmark('time')
+@utils.parametrize('batch_size', [32, 256, 1024])
+@utils.parametrize('lazy', [False, True])
+def track_time(batch_size, lazy):
+    device = utils.get_bench_device()
+    ds = dgl.data.QM7bDataset()
+    # prepare graph
+    graphs = ds[0:batch_size][0]
+    bg = dgl.batch(graphs).to(device)
+
+    def get_first_graphs():
+        # only a few graphs are needed, e.g. for scoring
+        glist = dgl.unbatch(bg, lazy=lazy)
+        return [glist[i] for i in range(4)]
+
+    # dry run
+    for i in range(10):
+        get_first_graphs()
+
+    # timing
+    with utils.Timer() as t:
+        for i in range(100):
+            get_first_graphs()
+
+    return t.elapsed_secs / 100
@@ -8,6 +8,7 @@ and transforming graphs.
 # Windows compatibility
 # This initializes Winsock and performs cleanup at termination as required
 import socket
+import importlib as _importlib
 
 # setup logging before everything
 from .logging import enable_verbose_logging
@@ -16,16 +17,12 @@ from .logging import enable_verbose_logging
 from .backend import load_backend, backend_name
 
 from . import function
-from . import contrib
 from . import container
-from . import distributed
 from . import random
 from . import sampling
 from . import storages
-from . import dataloading
 from . import ops
 from . import cuda
-from . import _dataloading  # legacy dataloading modules
 
 from ._ffi.runtime_ctypes import TypeCode
 from ._ffi.function import register_func, get_global_func, list_global_func_names, extract_ext_funcs
@@ -38,18 +35,45 @@ from .convert import *
 from .generators import *
 from .heterograph import DGLHeteroGraph
 from .heterograph import DGLHeteroGraph as DGLGraph  # pylint: disable=reimported
-from .dataloading import set_src_lazy_features, set_dst_lazy_features, set_edge_lazy_features, \
-    set_node_lazy_features
 from .merge import *
 from .subgraph import *
 from .traversal import *
 from .transforms import *
 from .propagate import *
 from .random import *
-from .data.utils import save_graphs, load_graphs
-from . import optim
 from .frame import LazyFeature
 from .utils import apply_each
 
-from ._deprecate.graph import DGLGraph as DGLGraphStale
-from ._deprecate.nodeflow import *
+# Heavy subpackages and the names re-exported from them are imported on first
+# access (PEP 562) to keep ``import dgl`` fast.  ``import dgl.distributed`` and
+# ``from dgl import distributed`` work as before.
+_LAZY_SUBMODULES = frozenset([
+    'contrib', 'data', 'dataloading', 'distributed', 'nn', 'optim',
+    '_dataloading',   # legacy dataloading modules
+    '_deprecate',
+])
+
+_LAZY_ATTRS = {
+    'set_src_lazy_features': ('dataloading', 'set_src_lazy_features'),
+    'set_dst_lazy_features': ('dataloading', 'set_dst_lazy_features'),
+    'set_edge_lazy_features': ('dataloading', 'set_edge_lazy_features'),
+    'set_node_lazy_features': ('dataloading', 'set_node_lazy_features'),
+    'save_graphs': ('data.utils', 'save_graphs'),
+    'load_graphs': ('data.utils', 'load_graphs'),
+    'DGLGraphStale': ('_deprecate.graph', 'DGLGraph'),
+    'NodeFlow': ('_deprecate.nodeflow', 'NodeFlow'),
+}
+
+def __getattr__(name):
+    if name in _LAZY_SUBMODULES:
+        return _importlib.import_module('.' + name, __name__)
+    if name in _LAZY_ATTRS:
+        mod_name, attr = _LAZY_ATTRS[name]
+        value = getattr(_importlib.import_module('.' + mod_name, __name__), attr)
+        # Cache it so that later lookups do not go through __getattr__.
+        globals()[name] = value
+        return value
+    raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+
+def __dir__():
+    return sorted(set(globals()) | _LAZY_SUBMODULES | set(_LAZY_ATTRS))
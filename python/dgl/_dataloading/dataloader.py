@@ -556,9 +556,9 @@ class NodeCollator(Collator):
 
         Parameters
         ----------
-        items : list[int] or list[tuple[str, int]]
-            Either a list of node IDs (for homogeneous graphs), or a list of node type-ID
-            pairs (for heterogeneous graphs).
+        items : list[int] or list[tuple[str, int]] or Tensor or dict[str, Tensor]
+            Either a list or tensor of node IDs (for homogeneous graphs), or a list of node
+            type-ID pairs or a dict of node IDs of each type (for heterogeneous graphs).
 
         Returns
         -------
@@ -575,7 +575,7 @@ class NodeCollator(Collator):
         MFGs : list[DGLGraph]
             The list of MFGs necessary for computing the representation.
         """
-        if isinstance(items[0], tuple):
+        if not isinstance(items, Mapping) and isinstance(items[0], tuple):
             # returns a list of pairs: group them by node types into a dict
             items = utils.group_as_dict(items)
         items = utils.prepare_tensor_or_dict(self.g, items, 'items')
@@ -793,7 +793,7 @@ class EdgeCollator(Collator):
         return self._dataset
 
     def _collate(self, items):
-        if isinstance(items[0], tuple):
+        if not isinstance(items, Mapping) and isinstance(items[0], tuple):
             # returns a list of pairs: group them by node types into a dict
             items = utils.group_as_dict(items)
         items = utils.prepare_tensor_or_dict(self.g_sampling, items, 'items')
@@ -814,7 +814,7 @@ class EdgeCollator(Collator):
         return input_nodes, pair_graph, blocks
 
     def _collate_with_negative_sampling(self, items):
-        if isinstance(items[0], tuple):
+        if not isinstance(items, Mapping) and isinstance(items[0], tuple):
             # returns a list of pairs: group them by node types into a dict
             items = utils.group_as_dict(items)
         items = utils.prepare_tensor_or_dict(self.g_sampling, items, 'items')
@@ -861,9 +861,9 @@ class EdgeCollator(Collator):
 
         Parameters
         ----------
-        items : list[int] or list[tuple[str, int]]
-            Either a list of edge IDs (for homogeneous graphs), or a list of edge type-ID
-            pairs (for heterogeneous graphs).
+        items : list[int] or list[tuple[str, int]] or Tensor or dict[str, Tensor]
+            Either a list or tensor of edge IDs (for homogeneous graphs), or a list of edge
+            type-ID pairs or a dict of edge IDs of each type (for heterogeneous graphs).
 
         Returns
         -------
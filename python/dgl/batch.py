@@ -1,5 +1,7 @@
 """Utilities for batching/unbatching graphs."""
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
+
+import numpy as np
 
 from . import backend as F
 from .base import ALL, is_all, DGLError, dgl_warning, NID, EID
@@ -245,7 +247,47 @@ def _batch_feat_dicts(frames, keys, feat_dict_name):
     ret_feat = {k : F.cat([fd[k] for fd in frames], 0) for k in keys}
     return ret_feat
 
-def unbatch(g, node_split=None, edge_split=None):
+def _parse_split(g, node_split, edge_split):
+    """Return the numbers of nodes and edges of each graph to unbatch from :attr:`g`
+    as dictionaries of lists, and the number of graphs."""
+    num_split = None
+    # Parse node_split
+    if node_split is None:
+        node_split = {ntype : g.batch_num_nodes(ntype) for ntype in g.ntypes}
+    elif not isinstance(node_split, Mapping):
+        if len(g.ntypes) != 1:
+            raise DGLError('Must provide a dictionary for argument node_split when'
+                           ' there are multiple node types.')
+        node_split = {g.ntypes[0] : node_split}
+    if node_split.keys() != set(g.ntypes):
+        raise DGLError('Must specify node_split for each node type.')
+    for split in node_split.values():
+        if num_split is not None and num_split != len(split):
+            raise DGLError('All node_split and edge_split must specify the same number'
+                           ' of split sizes.')
+        num_split = len(split)
+
+    # Parse edge_split
+    if edge_split is None:
+        edge_split = {etype : g.batch_num_edges(etype) for etype in g.canonical_etypes}
+    elif not isinstance(edge_split, Mapping):
+        if len(g.etypes) != 1:
+            raise DGLError('Must provide a dictionary for argument edge_split when'
+                           ' there are multiple edge types.')
+        edge_split = {g.canonical_etypes[0] : edge_split}
+    if edge_split.keys() != set(g.canonical_etypes):
+        raise DGLError('Must specify edge_split for each canonical edge type.')
+    for split in edge_split.values():
+        if num_split is not None and num_split != len(split):
+            raise DGLError('All edge_split and edge_split must specify the same number'
+                           ' of split sizes.')
+        num_split = len(split)
+
+    node_split = {k : F.asnumpy(split).tolist() for k, split in node_split.items()}
+    edge_split = {k : F.asnumpy(split).tolist() for k, split in edge_split.items()}
+    return node_split, edge_split, num_split
+
+def unbatch(g, node_split=None, edge_split=None, *, lazy=False):
     """Revert the batch operation by split the given graph into a list of small ones.
 
     This is the reverse operation of :func:``dgl.batch``. If the ``node_split``
@@ -270,11 +312,17 @@ def unbatch(g, node_split=None, edge_split=None):
         Number of nodes of each result graph.
     edge_split : Tensor, dict[str, Tensor], optional
         Number of edges of each result graph.
+    lazy : bool, optional
+        If True, return a sequence that only slices a graph out of :attr:`g` when it is
+        accessed, as :func:`slice_batch` does.  The structure of the graph is sliced
+        from the graph index of :attr:`g` and its features are views of the features
+        of :attr:`g` at the time of access.  This is much cheaper than unbatching all
+        the graphs when only a few of them are needed.  Default: False.
 
     Returns
     -------
-    list[DGLGraph]
-        Unbatched list of graphs.
+    list[DGLGraph] or Sequence[DGLGraph]
+        Unbatched list of graphs, or a sequence of them if :attr:`lazy` is True.
 
     Examples
     --------
@@ -324,6 +372,16 @@ def unbatch(g, node_split=None, edge_split=None):
           ndata_schemes={}
           edata_schemes={})
 
+    Only slice the graphs that are accessed
+
+    >>> gs = dgl.unbatch(bg, lazy=True)
+    >>> len(gs)
+    3
+    >>> gs[2]
+    Graph(num_nodes=2, num_edges=1,
+          ndata_schemes={}
+          edata_schemes={})
+
     Heterograph input
 
     >>> hg1 = dgl.heterograph({
@@ -344,42 +402,11 @@ def unbatch(g, node_split=None, edge_split=None):
     See Also
     --------
     batch
+    slice_batch
     """
-    num_split = None
-    # Parse node_split
-    if node_split is None:
-        node_split = {ntype : g.batch_num_nodes(ntype) for ntype in g.ntypes}
-    elif not isinstance(node_split, Mapping):
-        if len(g.ntypes) != 1:
-            raise DGLError('Must provide a dictionary for argument node_split when'
-                           ' there are multiple node types.')
-        node_split = {g.ntypes[0] : node_split}
-    if node_split.keys() != set(g.ntypes):
-        raise DGLError('Must specify node_split for each node type.')
-    for split in node_split.values():
-        if num_split is not None and num_split != len(split):
-            raise DGLError('All node_split and edge_split must specify the same number'
-                           ' of split sizes.')
-        num_split = len(split)
-
-    # Parse edge_split
-    if edge_split is None:
-        edge_split = {etype : g.batch_num_edges(etype) for etype in g.canonical_etypes}
-    elif not isinstance(edge_split, Mapping):
-        if len(g.etypes) != 1:
-            raise DGLError('Must provide a dictionary for argument edge_split when'
-                           ' there are multiple edge types.')
-        edge_split = {g.canonical_etypes[0] : edge_split}
-    if edge_split.keys() != set(g.canonical_etypes):
-        raise DGLError('Must specify edge_split for each canonical edge type.')
-    for split in edge_split.values():
-        if num_split is not None and num_split != len(split):
-            raise DGLError('All edge_split and edge_split must specify the same number'
-                           ' of split sizes.')
-        num_split = len(split)
-
-    node_split = {k : F.asnumpy(split).tolist() for k, split in node_split.items()}
-    edge_split = {k : F.asnumpy(split).tolist() for k, split in edge_split.items()}
+    node_split, edge_split, num_split = _parse_split(g, node_split, edge_split)
+    if lazy:
+        return _UnbatchedGraphs(g, node_split, edge_split, num_split)
 
     # Split edges for each relation
     edge_dict_per = [{} for i in range(num_split)]
@@ -417,14 +444,19 @@ def unbatch(g, node_split=None, edge_split=None):
     return gs
 
 def slice_batch(g, gid, store_ids=False):
-    """Get a particular graph from a batch of graphs.
+    """Get a particular graph, or a range of graphs, from a batch of graphs.
+
+    The structure of the result is sliced from the graph index of :attr:`g` and its
+    features are views of the features of :attr:`g`, so it is much cheaper than
+    :func:`unbatch` when only a few graphs are needed.
 
     Parameters
     ----------
     g : DGLGraph
         Input batched graph.
-    gid : int
-        The ID of the graph to retrieve.
+    gid : int or slice or range
+        The ID of the graph to retrieve, or the consecutive IDs of the graphs to
+        retrieve as a batched graph.
     store_ids : bool
         If True, it will store the raw IDs of the extracted nodes and edges in the ``ndata`` and
         ``edata`` of the resulting graph under name ``dgl.NID`` and ``dgl.EID``, respectively.
@@ -432,7 +464,8 @@ def slice_batch(g, gid, store_ids=False):
     Returns
     -------
     DGLGraph
-        Retrieved graph.
+        Retrieved graph.  If :attr:`gid` is a slice or a range, it is the batch of the
+        retrieved graphs.
 
     Examples
     --------
@@ -446,7 +479,8 @@ def slice_batch(g, gid, store_ids=False):
 
     >>> g1 = dgl.graph(([0, 1], [2, 3]))
     >>> g2 = dgl.graph(([1], [2]))
-    >>> bg = dgl.batch([g1, g2])
+    >>> g3 = dgl.graph(([0], [0]))
+    >>> bg = dgl.batch([g1, g2, g3])
 
     Get the second component graph.
 
@@ -455,27 +489,55 @@ def slice_batch(g, gid, store_ids=False):
     Graph(num_nodes=3, num_edges=1,
           ndata_schemes={}
           edata_schemes={})
+
+    Get the last two component graphs as a batched graph.
+
+    >>> g = dgl.slice_batch(bg, slice(1, 3))
+    >>> g.batch_num_nodes()
+    tensor([3, 1])
     """
+    if isinstance(gid, range):
+        gid = slice(gid.start, gid.stop, gid.step)
+    if isinstance(gid, slice):
+        start, stop, step = gid.indices(g.batch_size)
+        if step != 1:
+            raise DGLError('Expect the graph IDs to be consecutive, got step {}.'.format(step))
+        stop = max(start, stop)
+    else:
+        if gid < 0:
+            gid += g.batch_size
+        start, stop = gid, gid + 1
+
     start_nid = []
     num_nodes = []
     for ntype in g.ntypes:
-        batch_num_nodes = g.batch_num_nodes(ntype)
-        num_nodes.append(F.as_scalar(batch_num_nodes[gid]))
-        if gid == 0:
-            start_nid.append(0)
-        else:
-            start_nid.append(F.as_scalar(F.sum(F.slice_axis(batch_num_nodes, 0, 0, gid), 0)))
+        offsets = _offsets(F.asnumpy(g.batch_num_nodes(ntype)))
+        start_nid.append(int(offsets[start]))
+        num_nodes.append(int(offsets[stop] - offsets[start]))
 
     start_eid = []
     num_edges = []
     for etype in g.canonical_etypes:
-        batch_num_edges = g.batch_num_edges(etype)
-        num_edges.append(F.as_scalar(batch_num_edges[gid]))
-        if gid == 0:
-            start_eid.append(0)
-        else:
-            start_eid.append(F.as_scalar(F.sum(F.slice_axis(batch_num_edges, 0, 0, gid), 0)))
+        offsets = _offsets(F.asnumpy(g.batch_num_edges(etype)))
+        start_eid.append(int(offsets[start]))
+        num_edges.append(int(offsets[stop] - offsets[start]))
+
+    retg = _slice_graph(g, start_nid, num_nodes, start_eid, num_edges, store_ids)
+    if isinstance(gid, slice):
+        retg.set_batch_num_nodes({
+            ntype : F.slice_axis(g.batch_num_nodes(ntype), 0, start, stop)
+            for ntype in g.ntypes})
+        retg.set_batch_num_edges({
+            etype : F.slice_axis(g.batch_num_edges(etype), 0, start, stop)
+            for etype in g.canonical_etypes})
+    return retg
 
+def _offsets(split):
+    """Return the start offset of every segment followed by the total size."""
+    return np.concatenate([[0], np.cumsum(split, dtype=np.int64)])
+
+def _slice_graph(g, start_nid, num_nodes, start_eid, num_edges, store_ids=False):
+    """Return the chunk of :attr:`g` with the given nodes and edges of every type."""
     # Slice graph structure
     gidx = slice_gidx(g._graph, utils.toindex(num_nodes), utils.toindex(start_nid),
                       utils.toindex(num_edges), utils.toindex(start_eid))
@@ -505,6 +567,49 @@ def slice_batch(g, gid, store_ids=False):
 
     return retg
 
+class _UnbatchedGraphs(Sequence):
+    """The graphs unbatched from a batched graph by :func:`unbatch` with ``lazy=True``.
+
+    A graph is sliced out of the batched graph on its first access and kept for later
+    accesses.
+
+    Parameters
+    ----------
+    g : DGLGraph
+        The batched graph.
+    node_split : dict[str, list[int]]
+        Number of nodes of each graph per node type.
+    edge_split : dict[(str, str, str), list[int]]
+        Number of edges of each graph per canonical edge type.
+    num_split : int
+        Number of graphs.
+    """
+    def __init__(self, g, node_split, edge_split, num_split):
+        self._g = g
+        self._node_offsets = [_offsets(node_split[ntype]) for ntype in g.ntypes]
+        self._edge_offsets = [_offsets(edge_split[etype]) for etype in g.canonical_etypes]
+        self._num_split = num_split
+        self._graphs = {}
+
+    def __len__(self):
+        return self._num_split
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError('Graph index {} out of range.'.format(idx))
+        if idx not in self._graphs:
+            self._graphs[idx] = _slice_graph(
+                self._g,
+                [int(offsets[idx]) for offsets in self._node_offsets],
+                [int(offsets[idx + 1] - offsets[idx]) for offsets in self._node_offsets],
+                [int(offsets[idx]) for offsets in self._edge_offsets],
+                [int(offsets[idx + 1] - offsets[idx]) for offsets in self._edge_offsets])
+        return self._graphs[idx]
+
 #### DEPRECATED APIS ####
 def batch_hetero(*args, **kwargs):
     """DEPREACTED: please use dgl.batch """
@@ -6,7 +6,7 @@ from .base import DGLError, is_all, NID, EID, ALL, dgl_warning
 from . import backend as F
 from . import function as fn
 from .frame import Frame
-from .udf import NodeBatch, EdgeBatch
+from .udf import NodeBatch, EdgeBatch, PaddedReduceFunction
 from . import ops
 
 def is_builtin(func):
@@ -88,7 +88,8 @@ def invoke_udf_reduce(graph, func, msgdata, *, orig_nid=None):
     """Invoke user-defined reduce function on all the nodes in the graph.
 
     It analyzes the graph, groups nodes by their degrees and applies the UDF on each
-    group -- a strategy called *degree-bucketing*.
+    group -- a strategy called *degree-bucketing*. If the UDF is wrapped by
+    :func:`~dgl.udf.padded_reduce`, the UDF is applied on padded mailboxes instead.
 
     Parameters
     ----------
@@ -113,6 +114,9 @@ def invoke_udf_reduce(graph, func, msgdata, *, orig_nid=None):
     ntype = graph.dsttypes[0]
     ntid = graph.get_ntype_id_from_dst(ntype)
     dstdata = graph._node_frames[ntid]
+    if isinstance(func, PaddedReduceFunction):
+        return _invoke_udf_reduce_padded(graph, func, msgdata, degs, nodes, orig_nid,
+                                         ntype, dstdata)
     msgdata = Frame(msgdata)
 
     # degree bucketing
@@ -142,6 +146,10 @@ def invoke_udf_reduce(graph, func, msgdata, *, orig_nid=None):
         nbatch = NodeBatch(graph, orig_nid_bkt, ntype, ndata_bkt, msgs=maildata)
         bkt_rsts.append(func(nbatch))
 
+    return _merge_udf_reduce_results(nodes, dstdata, bkt_nodes, bkt_rsts)
+
+def _merge_udf_reduce_results(nodes, dstdata, bkt_nodes, bkt_rsts):
+    """Write the results of the reduce UDF on each bucket of nodes to a frame."""
     # prepare a result frame
     retf = Frame(num_rows=len(nodes))
     retf._initializers = dstdata._initializers
@@ -157,6 +165,63 @@ def invoke_udf_reduce(graph, func, msgdata, *, orig_nid=None):
 
     return retf
 
+def _invoke_udf_reduce_padded(graph, func, msgdata, degs, nodes, orig_nid, ntype, dstdata):
+    """Invoke a reduce UDF wrapped by :func:`~dgl.udf.padded_reduce`.
+
+    The nodes are grouped into a few buckets, and the messages of the nodes in a bucket are
+    padded with zeros to the maximum in-degree in the bucket.
+    """
+    ctx = F.context(nodes)
+    degs = F.asnumpy(degs).astype(np.int64)
+    # incoming edges grouped by destination node and ordered by edge ID
+    _, dst = graph.edges(order='eid')
+    dst = F.asnumpy(dst).astype(np.int64)
+    sorted_eids = np.argsort(dst, kind='stable')
+    edge_offsets = np.cumsum(degs) - degs
+
+    if func.bucketing == 'pow2':
+        # bucket k holds the nodes whose in-degrees are in (2^(k-1), 2^k]
+        node_bkts = np.zeros(len(degs), dtype=np.int64)
+        node_bkts[degs > 0] = np.ceil(np.log2(degs[degs > 0])).astype(np.int64) + 1
+    else:
+        node_bkts = (degs > 0).astype(np.int64)
+    num_edges = len(dst)
+    # Messages of the padding positions are gathered from an extra row of zeros.
+    padded_msgdata = {}
+    for k, msg in msgdata.items():
+        zero_row = F.zeros((1,) + F.shape(msg)[1:], F.dtype(msg), F.context(msg))
+        padded_msgdata[k] = F.cat([msg, zero_row], dim=0)
+
+    bkt_rsts = []
+    bkt_nodes = []
+    for bkt in np.unique(node_bkts):
+        if bkt == 0:
+            # skip reduce function for zero-degree nodes
+            continue
+        node_bkt = np.flatnonzero(node_bkts == bkt)
+        deg_bkt = degs[node_bkt]
+        width = int(deg_bkt.max())
+        # (num_nodes_bkt, width) positions of the messages, padded with num_edges
+        pos = np.arange(width)
+        mask = pos[None, :] < deg_bkt[:, None]
+        eid_idx = np.full(mask.shape, num_edges, dtype=np.int64)
+        rows, cols = np.nonzero(mask)
+        eid_idx[rows, cols] = sorted_eids[edge_offsets[node_bkt][rows] + cols]
+        eid_idx = F.copy_to(F.tensor(eid_idx.reshape(-1), F.int64), ctx)
+
+        node_bkt = F.copy_to(F.astype(F.tensor(node_bkt), F.dtype(nodes)), ctx)
+        bkt_nodes.append(node_bkt)
+        maildata = {}
+        for k, msg in padded_msgdata.items():
+            newshape = (len(deg_bkt), width) + F.shape(msg)[1:]
+            maildata[k] = F.reshape(F.gather_row(msg, eid_idx), newshape)
+        nbatch = NodeBatch(graph, F.gather_row(orig_nid, node_bkt), ntype,
+                           dstdata.subframe(node_bkt), msgs=maildata,
+                           msg_mask=F.copy_to(F.tensor(mask), ctx))
+        bkt_rsts.append(func(nbatch))
+
+    return _merge_udf_reduce_results(nodes, dstdata, bkt_nodes, bkt_rsts)
+
 def _bucketing(val):
     """Internal function to create groups on the values.
 
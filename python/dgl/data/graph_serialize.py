@@ -7,6 +7,8 @@ from .._ffi.object import ObjectBase, register_object
 from .._ffi.function import _init_api
 from .. import backend as F
 from .heterograph_serialize import save_heterographs
+from .mmap_serialize import save_mmap_graphs, load_mmap_graphs, load_mmap_labels, \
+    is_mmap_graph_file
 
 _init_api("dgl.data.graph_serialize")
 
@@ -75,7 +77,7 @@ class GraphData(ObjectBase):
         return g
 
 
-def save_graphs(filename, g_list, labels=None):
+def save_graphs(filename, g_list, labels=None, mmap=False):
     r"""Save graphs and optionally their labels to file.
 
     Besides saving to local files, DGL supports writing the graphs directly
@@ -94,6 +96,10 @@ def save_graphs(filename, g_list, labels=None):
         The graphs to be saved.
     labels: dict[str, Tensor]
         labels should be dict of tensors, with str as keys
+    mmap: bool, optional
+        If True, save to a local file in a layout that :func:`load_graphs` can memory-map
+        with ``mmap=True``: every index array and feature tensor is stored aligned and
+        uncompressed, and an offset table locates each graph. Default: False.
 
     Examples
     ----------
@@ -113,6 +119,10 @@ def save_graphs(filename, g_list, labels=None):
     >>> graph_labels = {"glabel": th.tensor([0, 1])}
     >>> save_graphs("./data.bin", [g1, g2], graph_labels)
 
+    Save Graphs into a file that can be memory-mapped
+
+    >>> save_graphs("./data_mmap.bin", [g1, g2], graph_labels, mmap=True)
+
     See Also
     --------
     load_graphs
@@ -125,16 +135,22 @@ def save_graphs(filename, g_list, labels=None):
         if f_path and not os.path.exists(f_path):
             os.makedirs(f_path)
 
+    elif mmap:
+        raise DGLError("Memory-mapped format only supports local files.")
+
     g_sample = g_list[0] if isinstance(g_list, list) else g_list
     if type(g_sample) == DGLHeteroGraph:  # Doesn't support DGLHeteroGraph's derived class
-        save_heterographs(filename, g_list, labels)
+        if mmap:
+            save_mmap_graphs(filename, g_list, labels)
+        else:
+            save_heterographs(filename, g_list, labels)
     else:
         raise DGLError(
             "Invalid argument g_list. Must be a DGLGraph or a list of DGLGraphs.")
 
 
 
-def load_graphs(filename, idx_list=None):
+def load_graphs(filename, idx_list=None, mmap=False):
     """Load graphs and optionally their labels from file saved by :func:`save_graphs`.
 
     Besides loading from local files, DGL supports loading the graphs directly
@@ -148,6 +164,11 @@ def load_graphs(filename, idx_list=None):
     idx_list: list[int], optional
         The indices of the graphs to be loaded if the file contains multiple graphs.
         Default is loading all the graphs stored in the file.
+    mmap: bool, optional
+        If True, memory-map a file saved by ``save_graphs(..., mmap=True)`` instead of
+        reading it. The graph structures and features are then read from disk on first
+        access and the pages are shared by all the processes mapping the same file, and
+        only the metadata of the graphs in ``idx_list`` is parsed. Default: False.
 
     Returns
     --------
@@ -165,6 +186,7 @@ def load_graphs(filename, idx_list=None):
     >>> from dgl.data.utils import load_graphs
     >>> glist, label_dict = load_graphs("./data.bin") # glist will be [g1, g2]
     >>> glist, label_dict = load_graphs("./data.bin", [0]) # glist will be [g1]
+    >>> glist, label_dict = load_graphs("./data_mmap.bin", [1], mmap=True) # glist will be [g2]
 
     See Also
     --------
@@ -172,6 +194,11 @@ def load_graphs(filename, idx_list=None):
     """
     # if it is local file, do some sanity check
     check_local_file_exists(filename)
+    if is_local_path(filename) and is_mmap_graph_file(filename):
+        return load_mmap_graphs(filename, idx_list, mmap)
+    elif mmap:
+        raise DGLError("File {} is not saved with save_graphs(..., mmap=True).".format(
+            filename))
     version = _CAPI_GetFileVersion(filename)
     if version == 1:
         dgl_warning(
@@ -231,6 +258,8 @@ def load_labels(filename):
     """
     # if it is local file, do some sanity check
     check_local_file_exists(filename)
+    if is_local_path(filename) and is_mmap_graph_file(filename):
+        return load_mmap_labels(filename, mmap=False)
 
     version = _CAPI_GetFileVersion(filename)
     if version == 1:
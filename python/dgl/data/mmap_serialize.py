@@ -0,0 +1,217 @@
+"""For memory-mapped graph serialization.
+
+The file starts with a fixed-size header followed by the raw bytes of every index
+array and feature tensor, each aligned to ``ALIGNMENT`` bytes so that it can be viewed
+in place from a memory map.  The metadata of every graph is a JSON blob whose offset
+and length are stored in an offset table, so a single graph can be opened without
+reading the others.
+
+.. code-block:: none
+
+    | header | arrays and JSON blobs of graph 0 | ... | offset table | labels JSON |
+"""
+from __future__ import absolute_import
+import json
+import os
+import struct
+
+import numpy as np
+
+from ..base import DGLError
+from ..frame import Frame
+from ..heterograph import DGLHeteroGraph
+from ..graph_index import from_coo
+from ..heterograph_index import create_unitgraph_from_coo, create_heterograph_from_relations
+from .. import backend as F
+from .. import utils
+
+__all__ = ['save_mmap_graphs', 'load_mmap_graphs', 'load_mmap_labels', 'is_mmap_graph_file']
+
+MAGIC = b'DGLMMAP\x00'
+VERSION = 1
+ALIGNMENT = 64
+# magic, version, number of graphs, offset of the offset table, offset and length of
+# the labels JSON blob
+_HEADER = struct.Struct('<8sQQQQQ')
+_ALL_FORMATS = ['coo', 'csc', 'csr']
+
+
+def is_mmap_graph_file(filename):
+    """Return whether the file is saved in the memory-mapped format."""
+    if not os.path.isfile(filename) or os.path.getsize(filename) < _HEADER.size:
+        return False
+    with open(filename, 'rb') as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+class _Writer(object):
+    """Append aligned arrays and blobs to a file."""
+    def __init__(self, f):
+        self._f = f
+
+    def _align(self):
+        pad = -self._f.tell() % ALIGNMENT
+        if pad > 0:
+            self._f.write(b'\x00' * pad)
+        return self._f.tell()
+
+    def write_array(self, arr):
+        """Write an array and return its reference in the JSON metadata."""
+        arr = np.ascontiguousarray(arr)
+        offset = self._align()
+        self._f.write(memoryview(arr.reshape(-1)).cast('B'))
+        return {'offset': offset, 'dtype': arr.dtype.str, 'shape': list(arr.shape)}
+
+    def write_tensor_dict(self, tensor_dict):
+        """Write a dict of tensors and return the dict of references."""
+        return {key: self.write_array(F.asnumpy(value)) for key, value in tensor_dict.items()}
+
+    def write_blob(self, obj):
+        """Write an object in JSON and return its offset and length."""
+        data = json.dumps(obj).encode('utf-8')
+        offset = self._align()
+        self._f.write(data)
+        return offset, len(data)
+
+
+def save_mmap_graphs(filename, g_list, labels=None):
+    """Save graphs and their labels in the memory-mapped format.
+
+    Parameters
+    ----------
+    filename : str
+        The local file name to store the graphs and labels.
+    g_list : list[DGLGraph]
+        The graphs to be saved.
+    labels : dict[str, Tensor], optional
+        The graph labels.
+    """
+    if isinstance(g_list, DGLHeteroGraph):
+        g_list = [g_list]
+    if labels is None:
+        labels = {}
+    with open(filename, 'wb') as f:
+        f.write(b'\x00' * _HEADER.size)
+        writer = _Writer(f)
+        table = []
+        for g in g_list:
+            formats = g.formats()
+            meta = {'ntypes': g.ntypes,
+                    'num_nodes': [g.number_of_nodes(ntype) for ntype in g.ntypes],
+                    'canonical_etypes': [list(etype) for etype in g.canonical_etypes],
+                    'formats': formats['created'] + formats['not created'],
+                    'edges': [],
+                    'ndata': [],
+                    'edata': []}
+            for etype in g.canonical_etypes:
+                src, dst = g.edges(order='eid', etype=etype)
+                meta['edges'].append([writer.write_array(F.asnumpy(src)),
+                                      writer.write_array(F.asnumpy(dst))])
+                meta['edata'].append(writer.write_tensor_dict(g.edges[etype].data))
+            for ntype in g.ntypes:
+                meta['ndata'].append(writer.write_tensor_dict(g.nodes[ntype].data))
+            table.append(writer.write_blob(meta))
+        table_offset = writer.write_array(np.array(table, dtype='<u8').reshape(-1, 2))['offset']
+        labels_offset, labels_len = writer.write_blob(writer.write_tensor_dict(labels))
+        f.seek(0)
+        f.write(_HEADER.pack(MAGIC, VERSION, len(g_list), table_offset,
+                             labels_offset, labels_len))
+
+
+class _Reader(object):
+    """Read graphs from a memory-mapped file."""
+    def __init__(self, filename, mmap):
+        # Copy-on-write keeps the pages shared between processes until they are written,
+        # and gives writable arrays that the backends accept without copying.
+        self._buf = np.memmap(filename, dtype=np.uint8, mode='c')
+        self._mmap = mmap
+        magic, version, self.num_graphs, table_offset, labels_offset, labels_len = \
+                _HEADER.unpack_from(self._buf, 0)
+        if magic != MAGIC:
+            raise DGLError('File {} is not a memory-mapped graph file.'.format(filename))
+        if version != VERSION:
+            raise DGLError('Unsupported memory-mapped graph file version {}.'.format(version))
+        self._table = np.ndarray((self.num_graphs, 2), dtype='<u8', buffer=self._buf,
+                                 offset=table_offset)
+        self._labels = self._read_blob(labels_offset, labels_len)
+
+    def _read_blob(self, offset, length):
+        return json.loads(self._buf[offset:offset + length].tobytes().decode('utf-8'))
+
+    def _read_tensor(self, ref):
+        arr = np.ndarray(tuple(ref['shape']), dtype=np.dtype(ref['dtype']), buffer=self._buf,
+                         offset=ref['offset'])
+        if not self._mmap:
+            arr = np.array(arr)
+        return F.zerocopy_from_numpy(arr)
+
+    def _read_tensor_dict(self, refs):
+        return {key: self._read_tensor(ref) for key, ref in refs.items()}
+
+    def labels(self):
+        """Return the graph labels."""
+        return self._read_tensor_dict(self._labels)
+
+    def graph(self, idx):
+        """Return the graph with the given index."""
+        if idx < 0 or idx >= self.num_graphs:
+            raise DGLError('Graph index {} is out of range (#graphs: {}).'.format(
+                idx, self.num_graphs))
+        offset, length = self._table[idx]
+        meta = self._read_blob(int(offset), int(length))
+        ntypes = meta['ntypes']
+        num_nodes = meta['num_nodes']
+        canonical_etypes = meta['canonical_etypes']
+        ntype_dict = {ntype: i for i, ntype in enumerate(ntypes)}
+        metagraph = from_coo(len(ntypes),
+                             [ntype_dict[etype[0]] for etype in canonical_etypes],
+                             [ntype_dict[etype[2]] for etype in canonical_etypes], True)
+        rel_graphs = []
+        for (srctype, _, dsttype), (src_ref, dst_ref) in zip(canonical_etypes, meta['edges']):
+            src_id, dst_id = ntype_dict[srctype], ntype_dict[dsttype]
+            rel_graphs.append(create_unitgraph_from_coo(
+                1 if src_id == dst_id else 2, num_nodes[src_id], num_nodes[dst_id],
+                self._read_tensor(src_ref), self._read_tensor(dst_ref), _ALL_FORMATS))
+        gidx = create_heterograph_from_relations(
+            metagraph, rel_graphs, utils.toindex(num_nodes, 'int64'))
+        nframes = [Frame(self._read_tensor_dict(refs), num_rows=num_nodes[ntid])
+                   for ntid, refs in enumerate(meta['ndata'])]
+        eframes = [Frame(self._read_tensor_dict(refs), num_rows=gidx.number_of_edges(etid))
+                   for etid, refs in enumerate(meta['edata'])]
+        g = DGLHeteroGraph(gidx, ntypes, [etype[1] for etype in canonical_etypes],
+                           nframes, eframes)
+        if sorted(meta['formats']) != _ALL_FORMATS:
+            g = g.formats(meta['formats'])
+        return g
+
+
+def load_mmap_graphs(filename, idx_list=None, mmap=True):
+    """Load graphs and their labels saved by :func:`save_mmap_graphs`.
+
+    Parameters
+    ----------
+    filename : str
+        The local file name to load graphs from.
+    idx_list : list[int], optional
+        The indices of the graphs to be loaded. Default is loading all the graphs.
+    mmap : bool, optional
+        If True, the graph structures and features are views of a copy-on-write memory
+        map of the file and are read from disk on first access. Otherwise, they are
+        copied into memory.
+
+    Returns
+    -------
+    list[DGLGraph]
+        The loaded graphs.
+    dict[str, Tensor]
+        The graph labels.
+    """
+    reader = _Reader(filename, mmap)
+    if idx_list is None:
+        idx_list = range(reader.num_graphs)
+    return [reader.graph(idx) for idx in idx_list], reader.labels()
+
+
+def load_mmap_labels(filename, mmap=True):
+    """Load the labels saved by :func:`save_mmap_graphs`."""
+    return _Reader(filename, mmap).labels()
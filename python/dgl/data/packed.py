@@ -0,0 +1,192 @@
+"""Dataset storing many small graphs in flat arrays for fast batching."""
+
+import numpy as np
+
+from .. import backend as F
+from ..base import DGLError
+from ..batch import batch as batch_graphs
+from ..convert import heterograph as create_heterograph
+from ..heterograph import DGLHeteroGraph
+from .dgl_dataset import DGLDataset
+
+__all__ = ['PackedGraphDataset']
+
+
+def _ranges(starts, counts):
+    """Return the concatenation of ``arange(s, s + c)`` for every ``s`` and ``c`` in
+    :attr:`starts` and :attr:`counts`."""
+    out_starts = np.cumsum(counts) - counts
+    return np.repeat(starts - out_starts, counts) + np.arange(counts.sum(), dtype=np.int64)
+
+def _stack(values):
+    if F.is_tensor(values[0]):
+        return F.stack(values, 0)
+    return F.tensor(values)
+
+class PackedGraphDataset(DGLDataset):
+    """Pack a dataset of small graphs into flat arrays for fast batching.
+
+    The class concatenates the structure and features of all the graphs into a single
+    set of arrays with per-graph node and edge offset tables, so that a minibatch of
+    graphs can be sliced out of them with a few vectorized operations instead of
+    creating a graph object per sample and calling :func:`dgl.batch`.
+
+    Indexing the dataset with a single integer returns the sample in the same format as
+    the original dataset.  Indexing it with a sequence or tensor of integers returns the
+    collated minibatch, i.e. the same as collating the samples with
+    :class:`~dgl.dataloading.GraphDataLoader`.  :class:`~dgl.dataloading.GraphDataLoader`
+    automatically fetches whole minibatches from a packed dataset when no custom
+    ``collate_fn`` is given.
+
+    Parameters
+    ----------
+    dataset : Dataset
+        The dataset to pack.  Each sample must either be a graph or a tuple whose first
+        element is a graph and whose other elements are tensors or numbers, such as
+        the graph labels.  All the graphs must be homogeneous graphs with the same
+        node type, edge type, ID type and features.
+
+    Attributes
+    ----------
+    node_offsets : numpy.ndarray
+        The first node of every graph in the packed node arrays, followed by the total
+        number of nodes.
+    edge_offsets : numpy.ndarray
+        The first edge of every graph in the packed edge arrays, followed by the total
+        number of edges.
+
+    Examples
+    --------
+    >>> dataset = dgl.data.PackedGraphDataset(dgl.data.GINDataset('MUTAG', False))
+    >>> g, label = dataset[0]
+    >>> bg, labels = dataset[[0, 5, 2]]
+    >>> bg.batch_size
+    3
+    >>> dataloader = dgl.dataloading.GraphDataLoader(
+    ...     dataset, batch_size=1024, shuffle=True, num_workers=8)
+    >>> for bg, labels in dataloader:
+    ...     train_on(bg, labels)
+    """
+    def __init__(self, dataset):
+        self._dataset = dataset
+        super().__init__(
+            'packed_' + getattr(dataset, 'name', type(dataset).__name__))
+
+    def process(self):
+        graphs = []
+        extras = []
+        self._is_graph_only = True
+        for i in range(len(self._dataset)):
+            item = self._dataset[i]
+            if isinstance(item, DGLHeteroGraph):
+                graphs.append(item)
+            else:
+                self._is_graph_only = False
+                graphs.append(item[0])
+                extras.append(item[1:])
+        if len(graphs) == 0:
+            raise DGLError('Cannot pack an empty dataset.')
+        if not self._is_graph_only and len(extras) != len(graphs):
+            raise DGLError('Expect every sample to be a tuple if any of them is.')
+        for g in graphs:
+            if len(g.ntypes) != 1 or len(g.etypes) != 1:
+                raise DGLError('PackedGraphDataset only supports homogeneous graphs.')
+
+        packed = batch_graphs(graphs)
+        self._canonical_etype = packed.canonical_etypes[0]
+        self._idtype = packed.idtype
+        self.node_offsets = np.concatenate(
+            [[0], np.cumsum(F.asnumpy(packed.batch_num_nodes()))]).astype(np.int64)
+        self.edge_offsets = np.concatenate(
+            [[0], np.cumsum(F.asnumpy(packed.batch_num_edges()))]).astype(np.int64)
+        src, dst = packed.edges(order='eid')
+        self._src = F.asnumpy(src).astype(np.int64)
+        self._dst = F.asnumpy(dst).astype(np.int64)
+        self._ndata = dict(packed.ndata)
+        self._edata = dict(packed.edata)
+        self._extras = [_stack(list(values)) for values in zip(*extras)]
+        # Only the packed arrays are needed from now on.
+        self._dataset = None
+
+    def __len__(self):
+        return self.node_offsets.shape[0] - 1
+
+    def __getitem__(self, idx):
+        if isinstance(idx, (int, np.integer)):
+            if idx < 0:
+                idx += len(self)
+            g = self._slice_graphs(np.array([idx], dtype=np.int64))
+            if self._is_graph_only:
+                return g
+            return (g,) + tuple(F.gather_row(x, F.tensor([idx]))[0] for x in self._extras)
+        return self.collate(idx)
+
+    def collate(self, indices):
+        """Return the minibatch of the given samples.
+
+        Parameters
+        ----------
+        indices : Tensor or iterable[int]
+            The indices of the samples.
+
+        Returns
+        -------
+        DGLGraph or list
+            The batched graph if the samples are graphs, or a list of the batched
+            graph and the stacked other elements otherwise.
+        """
+        if F.is_tensor(indices):
+            indices = F.asnumpy(indices)
+        indices = np.asarray(indices, dtype=np.int64)
+        g = self._slice_graphs(indices)
+        if self._is_graph_only:
+            return g
+        if _is_contiguous(indices):
+            start, end = int(indices[0]), int(indices[-1]) + 1
+            extras = [F.narrow_row(x, start, end) for x in self._extras]
+        else:
+            index = F.zerocopy_from_numpy(indices)
+            extras = [F.gather_row(x, index) for x in self._extras]
+        return [g] + extras
+
+    def _slice_graphs(self, indices):
+        """Return the batched graph of the given graphs."""
+        node_starts = self.node_offsets[indices]
+        edge_starts = self.edge_offsets[indices]
+        num_nodes = self.node_offsets[indices + 1] - node_starts
+        num_edges = self.edge_offsets[indices + 1] - edge_starts
+
+        if _is_contiguous(indices):
+            # Consecutive graphs only need slicing and shifting by the first node.
+            nstart = int(self.node_offsets[indices[0]])
+            nend = int(self.node_offsets[indices[-1] + 1])
+            estart = int(self.edge_offsets[indices[0]])
+            eend = int(self.edge_offsets[indices[-1] + 1])
+            src = self._src[estart:eend] - nstart
+            dst = self._dst[estart:eend] - nstart
+            ndata = {k: F.narrow_row(v, nstart, nend) for k, v in self._ndata.items()}
+            edata = {k: F.narrow_row(v, estart, eend) for k, v in self._edata.items()}
+        else:
+            nids = _ranges(node_starts, num_nodes)
+            eids = _ranges(edge_starts, num_edges)
+            shift = np.repeat(np.cumsum(num_nodes) - num_nodes - node_starts, num_edges)
+            src = self._src[eids] + shift
+            dst = self._dst[eids] + shift
+            nids = F.zerocopy_from_numpy(nids)
+            eids = F.zerocopy_from_numpy(eids)
+            ndata = {k: F.gather_row(v, nids) for k, v in self._ndata.items()}
+            edata = {k: F.gather_row(v, eids) for k, v in self._edata.items()}
+
+        ntype = self._canonical_etype[0]
+        g = create_heterograph(
+            {self._canonical_etype: (F.zerocopy_from_numpy(src), F.zerocopy_from_numpy(dst))},
+            num_nodes_dict={ntype: int(num_nodes.sum())}, idtype=self._idtype)
+        g.set_batch_num_nodes(F.tensor(num_nodes, self._idtype))
+        g.set_batch_num_edges(F.tensor(num_edges, self._idtype))
+        g.ndata.update(ndata)
+        g.edata.update(edata)
+        return g
+
+def _is_contiguous(indices):
+    return indices.shape[0] > 0 and (
+        indices.shape[0] == 1 or bool(np.all(indices[1:] == indices[:-1] + 1)))
@@ -1,6 +1,8 @@
 """DGL PyTorch DataLoaders"""
 from collections.abc import Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from queue import Queue, Empty, Full
+import contextlib
 import itertools
 import threading
 from distutils.version import LooseVersion
@@ -14,16 +16,17 @@ import psutil
 import numpy as np
 import torch
 import torch.distributed as dist
+from torch.utils.data import BatchSampler, RandomSampler, SequentialSampler
 from torch.utils.data.distributed import DistributedSampler
 
-from ..base import NID, EID, dgl_warning
+from ..base import NID, EID, dgl_warning, DGLError
 from ..batch import batch as batch_graphs
 from ..heterograph import DGLHeteroGraph
 from ..utils import (
     recursive_apply, ExceptionWrapper, recursive_apply_pair, set_num_threads,
     context_of, dtype_of)
 from ..frame import LazyFeature
-from ..storages import wrap_storage
+from ..storages import wrap_storage, CachedFeatureStorage, FetchGroup, StagingRing
 from .base import BlockSampler, as_edge_prediction_sampler
 from .. import backend as F
 from ..distributed import DistGraph
@@ -36,6 +39,9 @@ def _set_python_exit_flag():
 atexit.register(_set_python_exit_flag)
 
 prefetcher_timeout = int(os.environ.get('DGL_PREFETCHER_TIMEOUT', '30'))
+# One staging buffer for the minibatch being prefetched, one for the minibatch waiting
+# in the prefetcher queue and one for the minibatch whose copies may still be running.
+_NUM_STAGING_BUFFERS = 3
 
 class _TensorizedDatasetIter(object):
     def __init__(self, dataset, batch_size, drop_last, mapping_keys):
@@ -103,6 +109,52 @@ def _get_id_tensor_from_mapping(indices, device, keys):
     return id_tensor
 
 
+# Computes the permutations of the upcoming epochs in the background.
+_PERMUTATION_POOL = None
+_PERMUTATION_POOL_LOCK = threading.Lock()
+
+def _get_permutation_pool():
+    global _PERMUTATION_POOL
+    with _PERMUTATION_POOL_LOCK:
+        if _PERMUTATION_POOL is None:
+            _PERMUTATION_POOL = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix='dgl-epoch-permutation')
+        return _PERMUTATION_POOL
+
+
+class _EpochPermutations(object):
+    """Generates the permutation of every epoch from a seed, so that the order of an epoch
+    only depends on the seed and the epoch number.  The permutation of the next epoch is
+    computed in the background while the current epoch runs.
+    """
+    def __init__(self, num_items, seed):
+        self.num_items = num_items
+        self.seed = seed
+        self.epoch = 0
+        self._next = None
+
+    def _compute(self, epoch):
+        generator = torch.Generator()
+        generator.manual_seed(self.seed + epoch)
+        return torch.randperm(self.num_items, generator=generator)
+
+    def next(self):
+        """Return the permutation of the next epoch and start computing the one after."""
+        if self._next is not None:
+            perm = self._next.result()
+        else:
+            perm = self._compute(self.epoch)
+        self.epoch += 1
+        self._next = _get_permutation_pool().submit(self._compute, self.epoch)
+        return perm
+
+    def __getstate__(self):
+        # Futures cannot be pickled; worker processes never shuffle anyway.
+        state = self.__dict__.copy()
+        state['_next'] = None
+        return state
+
+
 def _divide_by_worker(dataset, batch_size, drop_last):
     num_samples = dataset.shape[0]
     worker_info = torch.utils.data.get_worker_info()
@@ -121,8 +173,12 @@ def _divide_by_worker(dataset, batch_size, drop_last):
 class TensorizedDataset(torch.utils.data.IterableDataset):
     """Custom Dataset wrapper that returns a minibatch as tensors or dicts of tensors.
     When the dataset is on the GPU, this significantly reduces the overhead.
+
+    If :attr:`overlap_epochs` is True, the permutation of every epoch is generated from
+    a seed drawn from PyTorch's random number generator at construction, and the next
+    epoch's permutation is computed in the background.
     """
-    def __init__(self, indices, batch_size, drop_last):
+    def __init__(self, indices, batch_size, drop_last, overlap_epochs=False):
         if isinstance(indices, Mapping):
             self._mapping_keys = list(indices.keys())
             self._device = next(iter(indices.values())).device
@@ -138,10 +194,17 @@ class TensorizedDataset(torch.utils.data.IterableDataset):
         self._indices = torch.arange(self._id_tensor.shape[0], dtype=torch.int64).share_memory_()
         self.batch_size = batch_size
         self.drop_last = drop_last
+        self._permutations = None
+        if overlap_epochs:
+            seed = int(torch.randint(0, 2 ** 31, ()).item())
+            self._permutations = _EpochPermutations(self._indices.shape[0], seed)
 
     def shuffle(self):
         """Shuffle the dataset."""
-        np.random.shuffle(self._indices.numpy())
+        if self._permutations is not None:
+            self._indices.copy_(self._permutations.next())
+        else:
+            np.random.shuffle(self._indices.numpy())
 
     def __iter__(self):
         indices = _divide_by_worker(self._indices, self.batch_size, self.drop_last)
@@ -159,8 +222,13 @@ class DDPTensorizedDataset(torch.utils.data.IterableDataset):
 
     This class additionally saves the index tensor in shared memory and therefore
     avoids duplicating the same index tensor during shuffling.
+
+    If :attr:`overlap_epochs` is True, every rank generates the permutation of every
+    epoch from :attr:`ddp_seed` by itself, computing the next epoch's permutation in the
+    background, instead of waiting for rank 0 to shuffle a shared index tensor.  The
+    index tensor is then private to each rank.
     """
-    def __init__(self, indices, batch_size, drop_last, ddp_seed):
+    def __init__(self, indices, batch_size, drop_last, ddp_seed, overlap_epochs=False):
         if isinstance(indices, Mapping):
             self._mapping_keys = list(indices.keys())
             len_indices = sum(len(v) for v in indices.values())
@@ -196,8 +264,15 @@ class DDPTensorizedDataset(torch.utils.data.IterableDataset):
             self._id_tensor = indices
             self._device = self._id_tensor.device
 
-        self._indices = call_once_and_share(
-            self._create_shared_indices, (self.shared_mem_size,), torch.int64)
+        self._permutations = None
+        if overlap_epochs:
+            # Every rank computes the same permutations, so there is no need to
+            # synchronize with rank 0 on a shared index tensor.
+            self._permutations = _EpochPermutations(self.num_indices, ddp_seed)
+            self._indices = self._create_shared_indices().share_memory_()
+        else:
+            self._indices = call_once_and_share(
+                self._create_shared_indices, (self.shared_mem_size,), torch.int64)
 
     def _create_shared_indices(self):
         indices = torch.empty(self.shared_mem_size, dtype=torch.int64)
@@ -208,6 +283,14 @@ class DDPTensorizedDataset(torch.utils.data.IterableDataset):
 
     def shuffle(self):
         """Shuffles the dataset."""
+        if self._permutations is not None:
+            self._indices[:self.num_indices] = self._permutations.next()
+            if not self.drop_last:
+                # pad extra
+                self._indices[self.num_indices:] = \
+                    self._indices[:self.total_size - self.num_indices]
+            return
+
         # Only rank 0 does the actual shuffling.  The other ranks wait for it.
         if self.rank == 0:
             if self._device == torch.device('cpu'):
@@ -235,6 +318,20 @@ class DDPTensorizedDataset(torch.utils.data.IterableDataset):
             self.batch_size
 
 
+def _top_in_degree_nodes(g, ntype, k):
+    if not isinstance(g, DGLHeteroGraph):
+        raise DGLError('The static feature cache policy requires a DGLGraph.')
+    in_degrees = None
+    for etype in g.canonical_etypes:
+        if etype[2] != ntype:
+            continue
+        deg = g.in_degrees(etype=etype)
+        in_degrees = deg if in_degrees is None else in_degrees + deg
+    if in_degrees is None:
+        return torch.arange(min(k, g.num_nodes(ntype)))
+    return torch.topk(in_degrees, min(k, in_degrees.shape[0])).indices.cpu()
+
+
 def _prefetch_update_feats(feats, frames, types, get_storage_func, id_name, device, pin_prefetcher):
     for tid, frame in enumerate(frames):
         type_ = types[tid]
@@ -263,7 +360,7 @@ class _PrefetchedGraphFeatures(object):
 def _prefetch_for_subgraph(subg, dataloader):
     node_feats, edge_feats = {}, {}
     _prefetch_update_feats(
-        node_feats, subg._node_frames, subg.ntypes, dataloader.graph.get_node_storage,
+        node_feats, subg._node_frames, subg.ntypes, dataloader._get_node_storage,
         NID, dataloader.device, dataloader.pin_prefetcher)
     _prefetch_update_feats(
         edge_feats, subg._edge_frames, subg.canonical_etypes, dataloader.graph.get_edge_storage,
@@ -292,7 +389,7 @@ def _await_or_return(x):
         return x
 
 
-def _prefetch(batch, dataloader, stream):
+def _prefetch(batch, dataloader, stream, fetch_group):
     # feats has the same nested structure of batch, except that
     # (1) each subgraph is replaced with a pair of node features and edge features, both
     #     being dictionaries whose keys are (type_id, column_name) and values are either
@@ -301,8 +398,15 @@ def _prefetch(batch, dataloader, stream):
     # (3) everything else are replaced with None.
     #
     # Once the futures are fetched, this function waits for them to complete by
-    # calling its wait() method.
-    with torch.cuda.stream(stream):
+    # calling its wait() method.  The futures are registered to fetch_group so that
+    # they can be cancelled when the iterator shuts down.
+    #
+    # The features are gathered into the next buffer of the staging ring if there is
+    # one, which is only reused after the copies to the device have finished.
+    staging = (
+        dataloader._staging_ring.next() if dataloader._staging_ring is not None
+        else contextlib.nullcontext())
+    with torch.cuda.stream(stream), fetch_group, staging:
         feats = recursive_apply(batch, _prefetch_for, dataloader)
         feats = recursive_apply(feats, _await_or_return)
     return feats
@@ -333,7 +437,7 @@ def _put_if_event_not_set(queue, result, event):
 
 def _prefetcher_entry(
         dataloader_it, dataloader, queue, num_threads, use_alternate_streams,
-        done_event):
+        done_event, fetch_group):
     # PyTorch will set the number of threads to 1 which slows down pin_memory() calls
     # in main process if a prefetching thread is created.
     if num_threads is not None:
@@ -350,9 +454,10 @@ def _prefetcher_entry(
             try:
                 batch = next(dataloader_it)
             except StopIteration:
+                dataloader._prepare_next_epoch()
                 break
             batch = recursive_apply(batch, restore_parent_storage_columns, dataloader.graph)
-            feats = _prefetch(batch, dataloader, stream)
+            feats = _prefetch(batch, dataloader, stream, fetch_group)
 
             _put_if_event_not_set(queue, (
                 # batch will be already in pinned memory as per the behavior of
@@ -432,12 +537,13 @@ class _PrefetchingIter(object):
         self.use_thread = use_thread
         self.use_alternate_streams = use_alternate_streams
         self._shutting_down = False
+        self._fetch_group = FetchGroup()
         if use_thread:
             self._done_event = threading.Event()
             thread = threading.Thread(
                 target=_prefetcher_entry,
                 args=(dataloader_it, dataloader, self.queue, num_threads,
-                      use_alternate_streams, self._done_event),
+                      use_alternate_streams, self._done_event, self._fetch_group),
                 daemon=True)
             thread.start()
             self.thread = thread
@@ -456,6 +562,8 @@ class _PrefetchingIter(object):
             try:
                 self._shutting_down = True
                 self._done_event.set()
+                # Drop the feature fetches that have not started yet.
+                self._fetch_group.cancel()
 
                 try:
                     self.queue.get_nowait()     # In case the thread is blocking on put().
@@ -471,14 +579,22 @@ class _PrefetchingIter(object):
             self._shutdown()
 
     def _next_non_threaded(self):
-        batch = next(self.dataloader_it)
+        if self.dataloader_it is None:
+            raise StopIteration
+        try:
+            batch = next(self.dataloader_it)
+        except StopIteration:
+            # The iterator may be reused by the next epoch.
+            self.dataloader_it = None
+            self.dataloader._prepare_next_epoch()
+            raise
         batch = recursive_apply(batch, restore_parent_storage_columns, self.dataloader.graph)
         device = self.dataloader.device
         if self.use_alternate_streams:
             stream = torch.cuda.Stream(device=device) if device.type == 'cuda' else None
         else:
             stream = None
-        feats = _prefetch(batch, self.dataloader, stream)
+        feats = _prefetch(batch, self.dataloader, stream, self._fetch_group)
         batch = recursive_apply(batch, lambda x: x.to(device, non_blocking=True))
         stream_event = stream.record_event() if stream is not None else None
         return batch, feats, stream_event
@@ -539,15 +655,16 @@ class WorkerInitWrapper(object):
             self.func(worker_id)
 
 
-def create_tensorized_dataset(indices, batch_size, drop_last, use_ddp, ddp_seed):
+def create_tensorized_dataset(indices, batch_size, drop_last, use_ddp, ddp_seed,
+                              overlap_epochs=False):
     """Converts a given indices tensor to a TensorizedDataset, an IterableDataset
     that returns views of the original tensor, to reduce overhead from having
     a list of scalar tensors in default PyTorch DataLoader implementation.
     """
     if use_ddp:
-        return DDPTensorizedDataset(indices, batch_size, drop_last, ddp_seed)
+        return DDPTensorizedDataset(indices, batch_size, drop_last, ddp_seed, overlap_epochs)
     else:
-        return TensorizedDataset(indices, batch_size, drop_last)
+        return TensorizedDataset(indices, batch_size, drop_last, overlap_epochs)
 
 
 def _get_device(device):
@@ -621,6 +738,64 @@ class DataLoader(torch.utils.data.DataLoader):
         Whether to pin the feature tensors into pinned memory.
 
         Default: True if the graph is on CPU and :attr:`device` is CUDA.  False otherwise.
+    use_staging_buffers : bool, optional
+        (Advanced option)
+        Whether to gather the prefetched features into a fixed ring of reusable
+        :class:`~dgl.storages.StagingBuffer` objects, which are pinned if
+        :attr:`pin_prefetcher` is True, instead of allocating new host tensors for
+        every minibatch.  A buffer is only reused after the copies of the features
+        gathered into it to :attr:`device` have finished.
+
+        Default: True if the graph is on CPU, :attr:`device` is CUDA, and :attr:`use_uva`
+        is False.  False otherwise.
+    staging_buffer_size : int, optional
+        (Advanced option)
+        The initial size in bytes of every staging buffer.  A buffer grows when the
+        features of a minibatch do not fit, so the buffers end up sized to the largest
+        minibatch.  Setting it to the expected size saves the reallocations of the first
+        iterations.
+
+        Only effective when :attr:`use_staging_buffers` is True.
+
+        Default: 0.
+    overlap_epochs : bool, optional
+        (Advanced option)
+        Whether to start the next epoch as soon as all the minibatches of the current
+        epoch have been sampled, instead of when the next epoch is iterated.  The worker
+        processes are kept alive across epochs (i.e. ``persistent_workers`` defaults to
+        True) and start sampling the next epoch while the last minibatches of the
+        current epoch are consumed.
+
+        If :attr:`indices` is a tensor or a dict of tensors, the shuffling order of
+        every epoch is generated from a seed (:attr:`ddp_seed` if :attr:`use_ddp` is
+        True, or a seed drawn from PyTorch's random number generator otherwise) and the
+        epoch number, and is computed in the background during the previous epoch.
+
+        An epoch that follows an epoch not iterated to the end starts when it is
+        iterated, as usual.
+
+        Default: False.
+    feature_cache_size : int, optional
+        (Advanced option)
+        If positive, keeps up to this many rows of every prefetched node feature in a
+        :class:`~dgl.storages.CachedFeatureStorage` so that frequently sampled nodes
+        (e.g. hub nodes of power-law graphs) are not gathered from the graph storage
+        again.  The hit rates can be inspected with :meth:`feature_cache_stats`.
+
+        The caches are built in the main process when an epoch starts, before any
+        worker process is started, and the features are always gathered in the main
+        process, so a single cache per feature serves the batches of all the workers.
+
+        Only effective for features prefetched with :class:`~dgl.LazyFeature`.  The
+        node features must not be modified while the DataLoader is in use.
+
+        Default: 0.
+    feature_cache_policy : str, optional
+        (Advanced option)
+        The replacement policy of the feature cache: ``'lru'``, ``'lfu'``, or ``'static'``,
+        which loads the nodes with the highest in-degrees once and never evicts them.
+
+        Default: ``'lru'``.
     kwargs : dict
         Key-word arguments to be passed to the parent PyTorch
         :py:class:`torch.utils.data.DataLoader` class. Common arguments are:
@@ -684,7 +859,9 @@ class DataLoader(torch.utils.data.DataLoader):
                  ddp_seed=0, batch_size=1, drop_last=False, shuffle=False,
                  use_prefetch_thread=None, use_alternate_streams=None,
                  pin_prefetcher=None, use_uva=False,
-                 use_cpu_worker_affinity=False, cpu_worker_affinity_cores=None, **kwargs):
+                 use_cpu_worker_affinity=False, cpu_worker_affinity_cores=None,
+                 use_staging_buffers=None, staging_buffer_size=0, overlap_epochs=False,
+                 feature_cache_size=0, feature_cache_policy='lru', **kwargs):
         # (BarclayII) PyTorch Lightning sometimes will recreate a DataLoader from an existing
         # DataLoader with modifications to the original arguments.  The arguments are retrieved
         # from the attributes with the same name, and because we change certain arguments
@@ -711,6 +888,14 @@ class DataLoader(torch.utils.data.DataLoader):
             self.use_alternate_streams = use_alternate_streams
             self.pin_prefetcher = pin_prefetcher
             self.use_uva = use_uva
+            self.use_staging_buffers = use_staging_buffers
+            self.staging_buffer_size = staging_buffer_size
+            self._staging_ring = self._create_staging_ring()
+            self.overlap_epochs = overlap_epochs
+            self._next_epoch_it = None
+            self.feature_cache_size = feature_cache_size
+            self.feature_cache_policy = feature_cache_policy
+            self._feature_caches = {}
             kwargs['batch_size'] = None
             super().__init__(**kwargs)
             return
@@ -789,6 +974,8 @@ class DataLoader(torch.utils.data.DataLoader):
                     pin_prefetcher = True
                 if use_prefetch_thread is None:
                     use_prefetch_thread = True
+                if use_staging_buffers is None:
+                    use_staging_buffers = True
             else:
                 if pin_prefetcher is True:
                     raise ValueError(
@@ -804,6 +991,13 @@ class DataLoader(torch.utils.data.DataLoader):
                 if use_prefetch_thread is None:
                     use_prefetch_thread = False
 
+                if use_staging_buffers is True:
+                    raise ValueError(
+                        'use_staging_buffers=True is only effective when device=cuda and '
+                        'sampling is performed on CPU.')
+                if use_staging_buffers is None:
+                    use_staging_buffers = False
+
             # Check use_alternate_streams
             if use_alternate_streams is None:
                 use_alternate_streams = (
@@ -814,7 +1008,7 @@ class DataLoader(torch.utils.data.DataLoader):
                 isinstance(indices, Mapping) and
                 all(torch.is_tensor(v) for v in indices.values()))):
             self.dataset = create_tensorized_dataset(
-                indices, batch_size, drop_last, use_ddp, ddp_seed)
+                indices, batch_size, drop_last, use_ddp, ddp_seed, overlap_epochs)
         else:
             self.dataset = indices
 
@@ -827,6 +1021,18 @@ class DataLoader(torch.utils.data.DataLoader):
         self.use_alternate_streams = use_alternate_streams
         self.pin_prefetcher = pin_prefetcher
         self.use_prefetch_thread = use_prefetch_thread
+        self.use_staging_buffers = use_staging_buffers
+        self.staging_buffer_size = staging_buffer_size
+        self._staging_ring = self._create_staging_ring()
+        self.overlap_epochs = overlap_epochs
+        self._next_epoch_it = None
+        self.feature_cache_size = feature_cache_size
+        self.feature_cache_policy = feature_cache_policy
+        self._feature_caches = {}
+
+        if overlap_epochs and num_workers > 0:
+            # Re-forking the workers at every epoch boundary would defeat the overlap.
+            kwargs.setdefault('persistent_workers', True)
 
         worker_init_fn = WorkerInitWrapper(kwargs.get('worker_init_fn', None))
 
@@ -861,15 +1067,30 @@ class DataLoader(torch.utils.data.DataLoader):
             **kwargs)
 
     def __iter__(self):
-        if self.shuffle:
-            self.dataset.shuffle()
+        # The next epoch may have been started by the prefetcher of the previous one.
+        dataloader_it = self._next_epoch_it
+        self._next_epoch_it = None
+        if dataloader_it is None:
+            self._build_feature_caches()
+            dataloader_it = self._start_epoch()
         # When using multiprocessing PyTorch sometimes set the number of PyTorch threads to 1
         # when spawning new Python threads.  This drastically slows down pinning features.
         num_threads = torch.get_num_threads() if self.num_workers > 0 else None
         return _PrefetchingIter(
-            self, super().__iter__(), use_thread=self.use_prefetch_thread,
+            self, dataloader_it, use_thread=self.use_prefetch_thread,
             use_alternate_streams=self.use_alternate_streams, num_threads=num_threads)
 
+    def _start_epoch(self):
+        if self.shuffle:
+            self.dataset.shuffle()
+        return super().__iter__()
+
+    def _prepare_next_epoch(self):
+        """Start the next epoch if :attr:`overlap_epochs` is True.  Called once all the
+        minibatches of the current epoch have been sampled."""
+        if self.overlap_epochs:
+            self._next_epoch_it = self._start_epoch()
+
     def worker_init_function(self, worker_id):
         """Worker init default function.
               Parameters
@@ -885,6 +1106,61 @@ class DataLoader(torch.utils.data.DataLoader):
             raise Exception('ERROR: cannot use affinity id={} cpu_cores={}'
                             .format(worker_id, self.cpu_cores))
 
+    def _create_staging_ring(self):
+        if not self.use_staging_buffers:
+            return None
+        return StagingRing(
+            _NUM_STAGING_BUFFERS, bool(self.pin_prefetcher), self.staging_buffer_size)
+
+    def _get_node_storage(self, key, ntype=None):
+        storage = self.graph.get_node_storage(key, ntype)
+        if self.feature_cache_size <= 0:
+            return storage
+        cache = self._feature_caches.get((ntype, key), None)
+        # Rebuild the cache if the feature column has been replaced.
+        if cache is None or cache.storage is not storage:
+            preload_ids = None
+            if self.feature_cache_policy == 'static':
+                preload_ids = _top_in_degree_nodes(self.graph, ntype, self.feature_cache_size)
+            cache = CachedFeatureStorage(
+                storage, self.graph.num_nodes(ntype), self.feature_cache_size,
+                self.feature_cache_policy, preload_ids)
+            self._feature_caches[ntype, key] = cache
+        return cache
+
+    def _build_feature_caches(self):
+        """Create the caches of the node features prefetched by the graph sampler in
+        the main process, before the worker processes are started."""
+        if self.feature_cache_size <= 0 or not isinstance(self.graph, DGLHeteroGraph):
+            return
+        prefetch_node_feats = getattr(self.graph_sampler, 'prefetch_node_feats', None) or []
+        for ntype in self.graph.ntypes:
+            if isinstance(prefetch_node_feats, Mapping):
+                keys = prefetch_node_feats.get(ntype, [])
+            else:
+                keys = prefetch_node_feats
+            for key in keys:
+                if key in self.graph.nodes[ntype].data:
+                    self._get_node_storage(key, ntype)
+
+    def feature_cache_stats(self):
+        """Return the hit and miss counters of the node feature caches enabled by
+        :attr:`feature_cache_size`.
+
+        The caches live in the main process, which gathers the features of the batches
+        sampled by all the worker processes.
+
+        Returns
+        -------
+        dict[str, dict[str, dict]]
+            A dictionary keyed by node type and then by feature name, whose values are
+            the dictionaries returned by :meth:`dgl.storages.CachedFeatureStorage.stats`.
+        """
+        stats = {}
+        for (ntype, key), cache in self._feature_caches.items():
+            stats.setdefault(ntype, {})[key] = cache.stats()
+        return stats
+
     # To allow data other than node/edge data to be prefetched.
     def attach_data(self, name, data):
         """Add a data other than node and edge features for prefetching."""
@@ -992,6 +1268,28 @@ def _create_dist_sampler(dataset, dataloader_kwargs, ddp_seed):
 
     return DistributedSampler(dataset, **dist_sampler_kwargs)
 
+def _batch_sampler_kwargs(dataset, dataloader_kwargs):
+    # Note: will change the content of dataloader_kwargs
+    batch_sampler = dataloader_kwargs.pop('batch_sampler', None)
+    if batch_sampler is None:
+        sampler = dataloader_kwargs.pop('sampler', None)
+        if sampler is None:
+            if dataloader_kwargs.get('shuffle', False):
+                sampler = RandomSampler(dataset, generator=dataloader_kwargs.get('generator'))
+            else:
+                sampler = SequentialSampler(dataset)
+        batch_sampler = BatchSampler(
+            sampler, dataloader_kwargs.get('batch_size', 1),
+            dataloader_kwargs.get('drop_last', False))
+    for k in ['shuffle', 'batch_size', 'drop_last']:
+        dataloader_kwargs.pop(k, None)
+    # Every index yielded by the sampler is a whole minibatch.
+    dataloader_kwargs['sampler'] = batch_sampler
+    dataloader_kwargs['batch_size'] = None
+
+def _collate_packed(batch):
+    return batch
+
 class GraphCollator(object):
     """Given a set of graphs as well as their graph-level data, the collate function will batch the
     graphs into a batched graph, and stack the tensors into a single bigger tensor.  If the
@@ -1103,6 +1401,14 @@ class GraphDataLoader(torch.utils.data.DataLoader):
           - ``drop_last`` (bool): Whether to drop the last incomplete batch.
           - ``shuffle`` (bool): Whether to randomly shuffle the indices at each epoch.
 
+    Notes
+    -----
+    If :attr:`dataset` is a :class:`~dgl.data.PackedGraphDataset` and :attr:`collate_fn`
+    is not given, the data loader fetches every minibatch from the dataset with a single
+    call to :meth:`~dgl.data.PackedGraphDataset.collate` instead of fetching the samples
+    one by one and batching them.  This is much faster for datasets of many small
+    graphs such as molecules.
+
     Examples
     --------
     To train a GNN for graph classification on a set of graphs in ``dataset``:
@@ -1136,7 +1442,12 @@ class GraphDataLoader(torch.utils.data.DataLoader):
             else:
                 dataloader_kwargs[k] = v
 
-        if collate_fn is None:
+        # Imported here to keep dgl.data out of importing dgl.dataloading.
+        from ..data.packed import PackedGraphDataset
+        packed = collate_fn is None and isinstance(dataset, PackedGraphDataset)
+        if packed:
+            self.collate = _collate_packed
+        elif collate_fn is None:
             self.collate = GraphCollator(**collator_kwargs).collate
         else:
             self.collate = collate_fn
@@ -1145,6 +1456,8 @@ class GraphDataLoader(torch.utils.data.DataLoader):
         if use_ddp:
             self.dist_sampler = _create_dist_sampler(dataset, dataloader_kwargs, ddp_seed)
             dataloader_kwargs['sampler'] = self.dist_sampler
+        if packed:
+            _batch_sampler_kwargs(dataset, dataloader_kwargs)
 
         super().__init__(dataset=dataset, collate_fn=self.collate, **dataloader_kwargs)
 
@@ -1,6 +1,10 @@
 """Data loading components for neighbor sampling"""
+from .. import backend as F
 from ..base import NID, EID
+from ..heterograph import DGLHeteroGraph
+from ..sampling import sample_neighbor_blocks
 from ..transforms import to_block
+from ..utils import context_of
 from .base import BlockSampler
 
 class NeighborSampler(BlockSampler):
@@ -103,8 +107,21 @@ class NeighborSampler(BlockSampler):
         self.prob = prob
         self.replace = replace
 
+    def _can_fuse(self, g, seed_nodes):
+        # Sampling all the layers in one native call is only implemented for
+        # inbound neighbors of graphs and seed nodes on CPU.
+        return isinstance(g, DGLHeteroGraph) and self.edge_dir == 'in' and \
+            F.device_type(g.device) == 'cpu' and not g.is_pinned() and \
+            F.device_type(context_of(seed_nodes)) == 'cpu'
+
     def sample_blocks(self, g, seed_nodes, exclude_eids=None):
         output_nodes = seed_nodes
+        if self._can_fuse(g, seed_nodes):
+            blocks = sample_neighbor_blocks(
+                g, seed_nodes, self.fanouts, prob=self.prob, replace=self.replace,
+                exclude_edges=exclude_eids, output_device=self.output_device)
+            return blocks[0].srcdata[NID], output_nodes, blocks
+
         blocks = []
         for fanout in reversed(self.fanouts):
             frontier = g.sample_neighbors(
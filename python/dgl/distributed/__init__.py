@@ -16,7 +16,8 @@ import sys
 
 from .dist_graph import DistGraphServer, DistGraph, node_split, edge_split
 from .dist_tensor import DistTensor
-from .partition import partition_graph, load_partition, load_partition_book
+from .partition import partition_graph, partition_graph_streaming, load_partition, \
+    load_partition_book
 from .graph_partition_book import GraphPartitionBook, PartitionPolicy
 from .nn import *
 from . import optim
@@ -0,0 +1,170 @@
+"""Codecs for compressing the tensor payloads of RPC messages.
+
+Each codec encodes a numpy array into a picklable meta object and a list of numpy
+arrays, and decodes them back.  The codecs applied to a payload are recorded in the
+message itself, so the receiver does not need to know which codecs the sender uses.
+"""
+import zlib
+
+import numpy as np
+
+from ..base import DGLError
+
+__all__ = ['ID_CODECS', 'FEAT_CODECS', 'encode_array', 'decode_array']
+
+def _zigzag(values):
+    values = values.astype(np.int64)
+    return ((values << 1) ^ (values >> 63)).astype(np.uint64)
+
+def _unzigzag(values):
+    return (values >> np.uint64(1)).astype(np.int64) ^ -(values & np.uint64(1)).astype(np.int64)
+
+class DeltaVarintCodec(object):
+    """Lossless codec for integer (e.g. ID) arrays.
+
+    Stores the differences between consecutive elements, zigzag-encoded and packed
+    into little-endian base-128 varints.  Sorted or clustered IDs need one or two
+    bytes per element instead of eight.
+    """
+    name = 'delta_varint'
+
+    @staticmethod
+    def encode(arr):
+        flat = arr.reshape(-1)
+        deltas = np.diff(flat, prepend=0) if flat.shape[0] > 0 else flat
+        values = _zigzag(deltas)
+        nbytes = np.ones(values.shape[0], dtype=np.int64)
+        for i in range(1, 10):
+            nbytes += values >= np.uint64(1 << (7 * i))
+        starts = np.cumsum(nbytes) - nbytes
+        owner = np.repeat(np.arange(values.shape[0]), nbytes)
+        byte_idx = np.arange(owner.shape[0]) - starts[owner]
+        out = (values[owner] >> (7 * byte_idx).astype(np.uint64)) & np.uint64(0x7f)
+        out |= np.where(byte_idx < nbytes[owner] - 1, np.uint64(0x80), np.uint64(0))
+        return (arr.dtype.str, arr.shape), [out.astype(np.uint8)]
+
+    @staticmethod
+    def decode(meta, arrays):
+        dtype, shape = meta
+        buf = arrays[0].astype(np.uint64)
+        if buf.shape[0] == 0:
+            return np.empty(shape, dtype=dtype)
+        ends = np.flatnonzero((buf & np.uint64(0x80)) == 0)
+        starts = np.concatenate([[0], ends[:-1] + 1])
+        owner = np.repeat(np.arange(ends.shape[0]), ends - starts + 1)
+        byte_idx = np.arange(buf.shape[0]) - starts[owner]
+        shifted = (buf & np.uint64(0x7f)) << (7 * byte_idx).astype(np.uint64)
+        values = np.bitwise_or.reduceat(shifted, starts)
+        return np.cumsum(_unzigzag(values)).astype(dtype).reshape(shape)
+
+class Float16Codec(object):
+    """Lossy codec casting floating-point arrays to IEEE half precision."""
+    name = 'fp16'
+
+    @staticmethod
+    def encode(arr):
+        return arr.dtype.str, [arr.astype(np.float16)]
+
+    @staticmethod
+    def decode(meta, arrays):
+        return arrays[0].astype(meta)
+
+class BFloat16Codec(object):
+    """Lossy codec keeping the upper 16 bits (with rounding) of float32 arrays,
+    which preserves the range of float32 unlike fp16."""
+    name = 'bf16'
+
+    @staticmethod
+    def encode(arr):
+        arr32 = np.ascontiguousarray(arr, dtype=np.float32)
+        bits = arr32.view(np.uint32)
+        # round to nearest even
+        rounded = bits + (np.uint32(0x7fff) + ((bits >> np.uint32(16)) & np.uint32(1)))
+        # Rounding would turn NaNs into infinities or wrap them to zero, so keep them
+        # as quiet NaNs instead.
+        bits = np.where(np.isnan(arr32), bits | np.uint32(0x400000), rounded)
+        return arr.dtype.str, [(bits >> np.uint32(16)).astype(np.uint16).view(np.int16)]
+
+    @staticmethod
+    def decode(meta, arrays):
+        bits = arrays[0].view(np.uint16).astype(np.uint32) << np.uint32(16)
+        return bits.view(np.float32).astype(meta)
+
+class Int8Codec(object):
+    """Lossy codec quantizing each row of a floating-point array to int8 with a
+    per-row symmetric scale."""
+    name = 'int8'
+
+    @staticmethod
+    def encode(arr):
+        rows = arr.reshape(arr.shape[0], -1) if arr.ndim > 0 and arr.shape[0] > 0 \
+            else arr.reshape(-1, 1)
+        scale = np.abs(rows).max(axis=1, initial=0).astype(np.float32) / 127
+        scale[scale == 0] = 1
+        quantized = np.rint(rows / scale[:, None]).astype(np.int8)
+        return (arr.dtype.str, arr.shape), [quantized, scale]
+
+    @staticmethod
+    def decode(meta, arrays):
+        dtype, shape = meta
+        quantized, scale = arrays
+        return (quantized.astype(np.float32) * scale[:, None]).astype(dtype).reshape(shape)
+
+class ZlibCodec(object):
+    """Lossless generic codec using zlib at its fastest level."""
+    name = 'zlib'
+
+    @staticmethod
+    def encode(arr):
+        data = zlib.compress(np.ascontiguousarray(arr).tobytes(), 1)
+        return (arr.dtype.str, arr.shape), [np.frombuffer(bytearray(data), dtype=np.uint8)]
+
+    @staticmethod
+    def decode(meta, arrays):
+        dtype, shape = meta
+        data = zlib.decompress(arrays[0].tobytes())
+        return np.frombuffer(bytearray(data), dtype=dtype).reshape(shape)
+
+ID_CODECS = {codec.name: codec for codec in [DeltaVarintCodec, ZlibCodec]}
+FEAT_CODECS = {codec.name: codec for codec in [Float16Codec, BFloat16Codec, Int8Codec,
+                                               ZlibCodec]}
+_ALL_CODECS = dict(ID_CODECS, **FEAT_CODECS)
+
+def encode_array(arr, id_codec=None, feat_codec=None):
+    """Encode an array with the codec for its data type.
+
+    Parameters
+    ----------
+    arr : numpy.ndarray
+        The array.
+    id_codec : str, optional
+        The codec for integer arrays.  One of :data:`ID_CODECS`.
+    feat_codec : str, optional
+        The codec for floating-point arrays.  One of :data:`FEAT_CODECS`.
+
+    Returns
+    -------
+    tuple or None
+        The codec name and meta, or None if the array is not encoded.
+    list[numpy.ndarray]
+        The encoded arrays.
+    """
+    if np.issubdtype(arr.dtype, np.integer):
+        name = id_codec
+    elif np.issubdtype(arr.dtype, np.floating):
+        name = feat_codec
+    else:
+        name = None
+    if name is None:
+        return None, [arr]
+    if name not in _ALL_CODECS:
+        raise DGLError('Unknown codec {}.'.format(name))
+    meta, arrays = _ALL_CODECS[name].encode(arr)
+    return (name, meta), arrays
+
+def decode_array(header, arrays):
+    """Decode the arrays encoded by :func:`encode_array`."""
+    if header is None:
+        return arrays[0]
+    name, meta = header
+    return _ALL_CODECS[name].decode(meta, arrays)
@@ -9,14 +9,22 @@ import os
 import sys
 import queue
 import gc
+import io
+import collections
+import pickle
+import weakref
 from enum import Enum
 
+import numpy as np
+
 from . import rpc
 from .constants import MAX_QUEUE_SIZE
 from .kvstore import init_kvstore, close_kvstore
 from .rpc_client import connect_to_server
 from .role import init_role
 from .. import utils
+from .. import backend as F
+from ..ndarray import create_shared_mem_array, get_shared_mem_array
 
 SAMPLER_POOL = None
 NUM_SAMPLER_WORKERS = 0
@@ -49,6 +57,155 @@ def _init_rpc(ip_config, num_servers, max_queue_size, net_type, role, num_thread
         raise e
 
 
+class _SlotFull(Exception):
+    """Raised when a result does not fit in a shared-memory slot."""
+
+
+class _ShmResult:
+    """Handle of a result whose tensors are stored in a shared-memory slot."""
+    def __init__(self, slot_id, payload):
+        self.slot_id = slot_id
+        self.payload = payload
+
+
+class _SlotLease:
+    """Expose a shared-memory slot to numpy and give the slot back to the ring
+    once no array refers to it any more."""
+    def __init__(self, slot, release_fn, slot_id):
+        self._slot = slot
+        self.__array_interface__ = {'shape': slot.shape, 'typestr': '|u1',
+                                    'data': (slot.ctypes.data, False), 'version': 3}
+        finalizer = weakref.finalize(self, release_fn, slot_id)
+        finalizer.atexit = False
+
+
+class _SlotPickler(pickle.Pickler):
+    """Pickler that copies CPU tensors and numpy arrays into a slot and only
+    pickles their location."""
+    ALIGNMENT = 64
+
+    def __init__(self, file, slot):
+        super(_SlotPickler, self).__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._slot = slot
+        self._offset = 0
+
+    def persistent_id(self, obj):  # pylint: disable=method-hidden
+        is_tensor = F.is_tensor(obj)
+        if is_tensor:
+            if F.device_type(F.context(obj)) != 'cpu':
+                return None
+            try:
+                arr = F.zerocopy_to_numpy(obj)
+            except (TypeError, RuntimeError):
+                # e.g., dtypes that numpy does not support
+                return None
+        elif isinstance(obj, np.ndarray) and obj.dtype != np.object_:
+            arr = obj
+        else:
+            return None
+        shape = arr.shape
+        # ascontiguousarray turns 0-d arrays into 1-d ones
+        arr = np.ascontiguousarray(arr)
+        start = -(-self._offset // self.ALIGNMENT) * self.ALIGNMENT
+        end = start + arr.nbytes
+        if end > len(self._slot):
+            raise _SlotFull()
+        self._slot[start:end] = arr.reshape(-1).view(np.uint8)
+        self._offset = end
+        return (is_tensor, start, arr.dtype.str, shape)
+
+
+class _SlotUnpickler(pickle.Unpickler):
+    """Unpickler that creates zero-copy views of the arrays in a slot."""
+    def __init__(self, file, slot):
+        super(_SlotUnpickler, self).__init__(file)
+        self._slot = slot
+
+    def persistent_load(self, pid):  # pylint: disable=method-hidden
+        is_tensor, start, dtype, shape = pid
+        dtype = np.dtype(dtype)
+        nbytes = int(np.prod(shape, dtype=np.int64)) * dtype.itemsize
+        arr = self._slot[start:start + nbytes].view(dtype).reshape(shape)
+        return F.zerocopy_from_numpy(arr) if is_tensor else arr
+
+
+class SharedMemRing:
+    """A ring of reusable shared-memory slots that carries the results of the
+    sampler workers to the trainer.
+
+    A worker takes a free slot, copies the tensors of a result into it and only
+    sends the slot ID and a small pickle of the rest of the result through the
+    result queue. The trainer rebuilds the result with tensors that are views of
+    the slot, and the slot goes back to the ring when all of them are freed. When
+    no slot is free or a result does not fit in a slot, the result is sent
+    through the queue as usual.
+
+    Parameters
+    ----------
+    ctx : multiprocessing context
+        The context to create the queue of free slots.
+    num_slots : int
+        The number of slots.
+    slot_size : int
+        The size of a slot in bytes.
+    """
+    def __init__(self, ctx, num_slots, slot_size):
+        self.num_slots = num_slots
+        self.slot_size = slot_size
+        self._prefix = 'dgl_sampler_{}_{}'.format(os.getpid(), id(self))
+        self._free_slots = ctx.Queue(num_slots)
+        self._slots = [create_shared_mem_array(self._slot_name(i), (slot_size,), F.uint8)
+                       for i in range(num_slots)]
+        self._views = [None] * num_slots
+        for i in range(num_slots):
+            self._free_slots.put(i)
+
+    def __getstate__(self):
+        return self._prefix, self.num_slots, self.slot_size, self._free_slots
+
+    def __setstate__(self, state):
+        self._prefix, self.num_slots, self.slot_size, self._free_slots = state
+        # Workers attach to the slots on first use.
+        self._slots = [None] * self.num_slots
+        self._views = [None] * self.num_slots
+
+    def _slot_name(self, slot_id):
+        return '{}_{}'.format(self._prefix, slot_id)
+
+    def _get_slot(self, slot_id):
+        if self._views[slot_id] is None:
+            if self._slots[slot_id] is None:
+                self._slots[slot_id] = get_shared_mem_array(self._slot_name(slot_id),
+                                                            (self.slot_size,), F.uint8)
+            self._views[slot_id] = F.zerocopy_to_numpy(self._slots[slot_id])
+        return self._views[slot_id]
+
+    def dump(self, result):
+        """Store a result in a free slot and return its handle. Called by workers.
+
+        Return the result itself if it cannot be stored in shared memory.
+        """
+        try:
+            slot_id = self._free_slots.get_nowait()
+        except queue.Empty:
+            return result
+        buf = io.BytesIO()
+        try:
+            _SlotPickler(buf, self._get_slot(slot_id)).dump(result)
+        except _SlotFull:
+            self._free_slots.put(slot_id)
+            return result
+        return _ShmResult(slot_id, buf.getvalue())
+
+    def load(self, result):
+        """Rebuild a result stored by :func:`dump`. Called by the trainer."""
+        if not isinstance(result, _ShmResult):
+            return result
+        slot = np.asarray(_SlotLease(self._get_slot(result.slot_id), self._free_slots.put,
+                                     result.slot_id))
+        return _SlotUnpickler(io.BytesIO(result.payload), slot).load()
+
+
 class MpCommand(Enum):
     """Enum class for multiprocessing command"""
     INIT_RPC = 0  # Not used in the task queue
@@ -60,12 +217,12 @@ class MpCommand(Enum):
     FINALIZE_POOL = 6
 
 
-def init_process(rpc_config, mp_contexts):
+def init_process(rpc_config, mp_contexts, worker_id=0):
     """Work loop in the worker"""
     try:
         _init_rpc(*rpc_config)
         keep_polling = True
-        data_queue, task_queue, barrier = mp_contexts
+        data_queue, task_queue, barrier, shm_ring = mp_contexts
         collate_fn_dict = {}
 
         while keep_polling:
@@ -84,8 +241,12 @@ def init_process(rpc_config, mp_contexts):
                 del collate_fn_dict[dataloader_name]
             elif command == MpCommand.CALL_COLLATE_FN:
                 dataloader_name, collate_args = args
-                data_queue.put(
-                    (dataloader_name, collate_fn_dict[dataloader_name](collate_args)))
+                start = time.time()
+                result = collate_fn_dict[dataloader_name](collate_args)
+                elapsed = time.time() - start
+                if shm_ring is not None:
+                    result = shm_ring.dump(result)
+                data_queue.put((dataloader_name, worker_id, elapsed, result))
             elif command == MpCommand.CALL_FN_ALL_WORKERS:
                 func, func_args = args
                 func(func_args)
@@ -100,7 +261,21 @@ def init_process(rpc_config, mp_contexts):
 
 
 class CustomPool:
-    """Customized worker pool"""
+    """Customized worker pool
+
+    The results of the workers are passed through a :class:`SharedMemRing` with
+    ``DGL_SAMPLER_SHM_SLOTS`` slots of ``DGL_SAMPLER_SHM_SLOT_SIZE`` bytes each.
+    Setting ``DGL_SAMPLER_SHM_SLOTS`` to 0 pickles the results through the queue instead.
+
+    Tasks are dispatched to the worker with the smallest expected wait, i.e., the number
+    of its pending tasks times its average sampling time, so that a worker slowed down by
+    expensive batches gets fewer new tasks. Setting ``DGL_SAMPLER_SCHEDULE`` to
+    ``'round_robin'`` dispatches tasks in turn instead. Results are routed to the
+    dataloader that submitted them, so multiple dataloaders can share the pool.
+    """
+    # The weight of the latest sampling time in the average sampling time of a worker.
+    LATENCY_DECAY = 0.2
+
     def __init__(self, num_workers, rpc_config):
         """
         Customized worker pool init function
@@ -109,32 +284,66 @@ class CustomPool:
         self.num_workers = num_workers
         self.queue_size = num_workers * 4
         self.result_queue = ctx.Queue(self.queue_size)
+        # The result queue, one result being consumed and one being produced by each
+        # worker can hold a slot at the same time.
+        num_slots = int(os.environ.get('DGL_SAMPLER_SHM_SLOTS',
+                                       self.queue_size + num_workers + 1))
+        slot_size = int(os.environ.get('DGL_SAMPLER_SHM_SLOT_SIZE', 64 * 1024 * 1024))
+        if num_slots > 0 and os.name != 'nt':
+            self.shm_ring = SharedMemRing(ctx, num_slots, slot_size)
+        else:
+            self.shm_ring = None
         self.task_queues = []
         self.process_list = []
         self.current_proc_id = 0
+        self.schedule = os.environ.get('DGL_SAMPLER_SCHEDULE', 'least_loaded')
+        assert self.schedule in ('least_loaded', 'round_robin'), \
+                'Unknown sampler schedule {}'.format(self.schedule)
+        # Results that arrive while another dataloader is waiting for its result.
         self.cache_result_dict = {}
+        self.dataloader_names = set()
+        self.num_pending = [0] * num_workers
+        self.num_completed = [0] * num_workers
+        self.avg_latency = [None] * num_workers
         self.barrier = ctx.Barrier(num_workers)
-        for _ in range(num_workers):
+        for worker_id in range(num_workers):
             task_queue = ctx.Queue(self.queue_size)
             self.task_queues.append(task_queue)
             proc = ctx.Process(target=init_process, args=(
-                rpc_config, (self.result_queue, task_queue, self.barrier)))
+                rpc_config, (self.result_queue, task_queue, self.barrier, self.shm_ring),
+                worker_id))
             proc.daemon = True
             proc.start()
             self.process_list.append(proc)
 
     def set_collate_fn(self, func, dataloader_name):
         """Set collate function in subprocess"""
+        self.dataloader_names.add(dataloader_name)
         for i in range(self.num_workers):
             self.task_queues[i].put(
                 (MpCommand.SET_COLLATE_FN, (dataloader_name, func)))
 
+    def _select_worker(self):
+        """Select the worker to run the next task."""
+        # Scan from the worker after the last selected one so that ties are broken
+        # in a round-robin manner.
+        order = [(self.current_proc_id + i) % self.num_workers for i in range(self.num_workers)]
+        if self.schedule == 'round_robin':
+            return order[0]
+        known = [latency for latency in self.avg_latency if latency is not None]
+        default_latency = sum(known) / len(known) if known else 1.
+        def _expected_wait(i):
+            latency = self.avg_latency[i] if self.avg_latency[i] is not None else default_latency
+            return (self.num_pending[i] + 1) * latency
+        return min(order, key=_expected_wait)
+
     def submit_task(self, dataloader_name, args):
         """Submit task to workers"""
-        # Round robin
-        self.task_queues[self.current_proc_id].put(
+        worker_id = self._select_worker()
+        self.task_queues[worker_id].put(
             (MpCommand.CALL_COLLATE_FN, (dataloader_name, args)))
-        self.current_proc_id = (self.current_proc_id + 1) % self.num_workers
+        self.num_pending[worker_id] += 1
+        self.current_proc_id = (worker_id + 1) % self.num_workers
 
     def submit_task_to_all_workers(self, func, args):
         """Submit task to all workers"""
@@ -144,12 +353,58 @@ class CustomPool:
 
     def get_result(self, dataloader_name, timeout=1800):
         """Get result from result queue"""
-        result_dataloader_name, result = self.result_queue.get(timeout=timeout)
-        assert result_dataloader_name == dataloader_name
+        cached = self.cache_result_dict.get(dataloader_name)
+        if cached:
+            result = cached.popleft()
+        else:
+            while True:
+                result_dataloader_name, worker_id, elapsed, result = \
+                        self.result_queue.get(timeout=timeout)
+                self._update_stats(worker_id, elapsed)
+                if result_dataloader_name == dataloader_name:
+                    break
+                if result_dataloader_name in self.dataloader_names:
+                    self.cache_result_dict.setdefault(
+                        result_dataloader_name, collections.deque()).append(result)
+                elif self.shm_ring is not None:
+                    # The dataloader has been deleted. Loading and dropping the result
+                    # gives its slot back.
+                    self.shm_ring.load(result)
+        if self.shm_ring is not None:
+            result = self.shm_ring.load(result)
         return result
 
+    def _update_stats(self, worker_id, elapsed):
+        self.num_pending[worker_id] -= 1
+        self.num_completed[worker_id] += 1
+        if self.avg_latency[worker_id] is None:
+            self.avg_latency[worker_id] = elapsed
+        else:
+            self.avg_latency[worker_id] += \
+                    self.LATENCY_DECAY * (elapsed - self.avg_latency[worker_id])
+
+    def worker_stats(self):
+        """Return the scheduling metrics of the workers.
+
+        Returns
+        -------
+        list[dict]
+            For each worker, the number of tasks in its queue or running (``'pending'``),
+            the number of finished tasks (``'completed'``) and the moving average of the
+            time (in seconds) spent in the collate function (``'avg_latency'``).
+        """
+        return [{'pending': self.num_pending[i],
+                 'completed': self.num_completed[i],
+                 'avg_latency': self.avg_latency[i]} for i in range(self.num_workers)]
+
     def delete_collate_fn(self, dataloader_name):
         """Delete collate function"""
+        self.dataloader_names.discard(dataloader_name)
+        cached = self.cache_result_dict.pop(dataloader_name, None)
+        if cached and self.shm_ring is not None:
+            # Loading and dropping the unconsumed results gives their slots back.
+            for result in cached:
+                self.shm_ring.load(result)
         for i in range(self.num_workers):
             self.task_queues[i].put(
                 (MpCommand.DELETE_COLLATE_FN, (dataloader_name, )))
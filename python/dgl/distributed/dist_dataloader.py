@@ -1,13 +1,54 @@
 # pylint: disable=global-variable-undefined, invalid-name
 """Multiprocess dataloader for distributed training"""
+from collections.abc import Mapping
+
+import numpy as np
+
 from .dist_context import get_sampler_pool
 from .. import backend as F
+from ..utils import FlattenedDict
 
 __all__ = ["DistDataLoader"]
 
 DATALOADER_ID = 0
 
 
+def _to_id_array(data):
+    """Return a 1-D numpy array of the IDs, or None if the data are not IDs."""
+    if F.is_tensor(data):
+        data = F.asnumpy(data)
+    elif not isinstance(data, np.ndarray):
+        data = np.asarray(data)
+    if data.ndim != 1 or (len(data) > 0 and not np.issubdtype(data.dtype, np.integer)):
+        return None
+    return data
+
+def _flatten_dataset(dataset):
+    """Flatten an ID tensor or a dict of ID tensors for slicing batches.
+
+    Returns
+    -------
+    numpy.ndarray or None
+        The IDs, or None if the dataset is neither an ID tensor nor a dict of them.
+    numpy.ndarray or None
+        The type of each ID for a dict of ID tensors.
+    list or None
+        The keys of the dict.
+    """
+    if isinstance(dataset, FlattenedDict):
+        dataset = dataset._groups
+    if isinstance(dataset, Mapping):
+        keys = list(dataset.keys())
+        arrays = [_to_id_array(dataset[key]) for key in keys]
+        if len(keys) == 0 or any(arr is None for arr in arrays):
+            return None, None, None
+        types = np.repeat(np.arange(len(keys)), [len(arr) for arr in arrays])
+        return np.concatenate(arrays), types, keys
+    if F.is_tensor(dataset) or isinstance(dataset, np.ndarray):
+        return _to_id_array(dataset), None, None
+    return None, None, None
+
+
 class DistDataLoader:
     """DGL customized multiprocessing dataloader.
 
@@ -17,8 +58,11 @@ class DistDataLoader:
 
     Parameters
     ----------
-    dataset: a tensor
-        Tensors of node IDs or edge IDs.
+    dataset: a tensor or dict of tensors
+        Tensors of node IDs or edge IDs. For a tensor, every batch is a numpy array
+        of the IDs; for a dict of tensors (e.g., node IDs of each node type), every batch
+        is a dict of numpy arrays. Other datasets are indexed item by item and every
+        batch is a list of the items.
     batch_size: int
         The number of samples per batch to load.
     shuffle: bool, optional
@@ -78,9 +122,13 @@ class DistDataLoader:
         self.is_closed = False
 
         self.dataset = dataset
-        self.data_idx = F.arange(0, len(dataset))
-        self.expected_idxs = len(dataset) // self.batch_size
-        if not self.drop_last and len(dataset) % self.batch_size != 0:
+        # ID tensors are sliced batch by batch instead of being indexed item by item.
+        self._ids, self._id_types, self._id_keys = _flatten_dataset(dataset)
+        self._num_items = len(self._ids) if self._ids is not None else len(dataset)
+        self.data_idx = F.arange(0, self._num_items)
+        self._perm = None
+        self.expected_idxs = self._num_items // self.batch_size
+        if not self.drop_last and self._num_items % self.batch_size != 0:
             self.expected_idxs += 1
 
         # We need to have a unique ID for each data loader to identify itself
@@ -125,6 +173,8 @@ class DistDataLoader:
     def __iter__(self):
         if self.shuffle:
             self.data_idx = F.rand_shuffle(self.data_idx)
+            if self._ids is not None:
+                self._perm = F.asnumpy(self.data_idx)
         self.recv_idxs = 0
         self.current_pos = 0
         self.num_pending = 0
@@ -142,17 +192,21 @@ class DistDataLoader:
         self.num_pending += 1
 
     def _next_data(self):
-        if self.current_pos == len(self.dataset):
+        if self.current_pos == self._num_items:
             return None
 
         end_pos = 0
-        if self.current_pos + self.batch_size > len(self.dataset):
+        if self.current_pos + self.batch_size > self._num_items:
             if self.drop_last:
                 return None
             else:
-                end_pos = len(self.dataset)
+                end_pos = self._num_items
         else:
             end_pos = self.current_pos + self.batch_size
+        if self._ids is not None:
+            ret = self._slice_ids(self.current_pos, end_pos)
+            self.current_pos = end_pos
+            return ret
         idx = self.data_idx[self.current_pos:end_pos].tolist()
         ret = [self.dataset[i] for i in idx]
         # Sharing large number of tensors between processes will consume too many
@@ -163,3 +217,19 @@ class DistDataLoader:
             ret = [F.as_scalar(id) for id in ret]
         self.current_pos = end_pos
         return ret
+
+    def _slice_ids(self, start, end):
+        """Return the IDs of a batch from the flattened ID tensors."""
+        if self._perm is not None and self.shuffle:
+            pos = self._perm[start:end]
+        else:
+            pos = slice(start, end)
+        ids = self._ids[pos]
+        if self._id_keys is None:
+            return ids
+        types = self._id_types[pos]
+        order = np.argsort(types, kind='stable')
+        sections = np.cumsum(np.bincount(types, minlength=len(self._id_keys)))[:-1]
+        return {key: type_ids for key, type_ids in zip(self._id_keys,
+                                                       np.split(ids[order], sections))
+                if len(type_ids) > 0}
@@ -513,11 +513,8 @@ class DistGraph:
 
         # Get canonical edge types.
         # TODO(zhengda) this requires the server to store the graph with coo format.
-        eid = []
-        for etype in self.etypes:
-            type_eid = F.zeros((1,), F.int64, F.cpu())
-            eid.append(self._gpb.map_to_homo_eid(type_eid, etype))
-        eid = F.cat(eid, 0)
+        eid = self._gpb.map_to_homo_eids(
+            {etype: F.zeros((1,), F.int64, F.cpu()) for etype in self.etypes})
         src, dst = dist_find_edges(self, eid)
         src_tids, _ = self._gpb.map_to_per_ntype(src)
         dst_tids, _ = self._gpb.map_to_per_ntype(dst)
@@ -238,6 +238,43 @@ class DistTensor:
         '''
         return self._detach_group_id(self._tensor_name)
 
+    def enable_cache(self, cache_size, max_staleness=None):
+        '''Cache up to ``cache_size`` rows stored on other machines in this trainer
+        process, so that reading them again does not go over the network.
+
+        Rows written by this process are invalidated immediately, while rows written by
+        other processes are only refreshed after ``max_staleness`` seconds or
+        :meth:`invalidate_cache`.  The cache is therefore best suited for read-only
+        data such as input node features.
+
+        Parameters
+        ----------
+        cache_size : int
+            The maximum number of cached rows.
+        max_staleness : float, optional
+            The number of seconds a cached row stays valid.  None means forever.
+        '''
+        self.kvstore.enable_cache(self._name, cache_size, max_staleness)
+
+    def disable_cache(self):
+        '''Drop the cache created by :meth:`enable_cache`.'''
+        self.kvstore.disable_cache(self._name)
+
+    def invalidate_cache(self):
+        '''Remove all the rows in the cache created by :meth:`enable_cache`.'''
+        self.kvstore.invalidate_cache(self._name)
+
+    def cache_stats(self):
+        '''Return the statistics of the cache created by :meth:`enable_cache`.
+
+        Returns
+        -------
+        dict or None
+            The number of hits, misses, the hit rate and the number of cached rows,
+            or None if the cache is not enabled.
+        '''
+        return self.kvstore.cache_stats(self._name)
+
     def count_nonzero(self):
         '''Count and return the number of nonzero value
 
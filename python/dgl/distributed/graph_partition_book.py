@@ -1,11 +1,12 @@
 """Define graph partition book."""
 
+import os
 import pickle
 from abc import ABC
 import numpy as np
 
 from .. import backend as F
-from ..base import NID, EID
+from ..base import NID, EID, DGLError
 from .. import utils
 from .shared_mem_utils import _to_shared_mem, _get_ndata_path, _get_edata_path, DTYPE_DICT
 from .._ffi.ndarray import empty_shared_mem
@@ -13,6 +14,55 @@ from ..ndarray import exist_shared_mem_array
 from ..partition import NDArrayPartition
 from .id_map import IdMap
 
+# Range indices over at most this many IDs also build a table that maps every ID
+# directly to its partition, which is faster than a binary search.
+LOOKUP_TABLE_MAX_IDS = int(os.environ.get('DGL_PARTITION_BOOK_TABLE_SIZE', str(1 << 24)))
+
+def _ids_to_numpy(ids):
+    """Convert IDs in any format accepted by ``utils.toindex`` to a numpy array without
+    going through ``utils.Index`` for tensors."""
+    if F.is_tensor(ids):
+        return F.asnumpy(ids)
+    return utils.toindex(ids).tonumpy()
+
+class _RangeIndex:
+    """Map IDs to the positions of the contiguous ID ranges containing them.
+
+    Parameters
+    ----------
+    ends : numpy.ndarray
+        The sorted (exclusive) ends of the ranges.  The first range starts at 0 and
+        each following range starts at the end of the previous one.
+    """
+    def __init__(self, ends):
+        self.ends = np.asarray(ends, dtype=np.int64)
+        self._table = None
+
+    def _get_table(self):
+        num_ids = int(self.ends[-1]) if len(self.ends) > 0 else 0
+        if self._table is None and 0 < num_ids <= LOOKUP_TABLE_MAX_IDS:
+            sizes = np.diff(self.ends, prepend=0)
+            dtype = np.uint8 if len(self.ends) <= 256 else np.int32
+            self._table = np.repeat(np.arange(len(self.ends), dtype=dtype), sizes)
+        return self._table
+
+    def __call__(self, ids):
+        """Return the range positions of the numpy array ``ids`` as int64.
+
+        Raises DGLError if any ID is negative or not less than the end of the last
+        range.
+        """
+        if len(ids) > 0:
+            num_ids = int(self.ends[-1]) if len(self.ends) > 0 else 0
+            min_id, max_id = ids.min(), ids.max()
+            if min_id < 0 or max_id >= num_ids:
+                raise DGLError('ID {} is out of range [0, {}).'.format(
+                    min_id if min_id < 0 else max_id, num_ids))
+        table = self._get_table()
+        if table is not None:
+            return table[ids].astype(np.int64)
+        return np.searchsorted(self.ends, ids, side='right')
+
 def _move_metadata_to_shared_mem(graph_name, num_nodes, num_edges, part_id,
                                  num_partitions, node_map, edge_map, is_range_part):
     ''' Move all metadata of the partition book to the shared memory.
@@ -433,6 +483,38 @@ class GraphPartitionBook(ABC):
             Homogeneous edge IDs.
         """
 
+    def map_to_homo_nids(self, ids):
+        """Map the type-wise node IDs of several node types to homogeneous node IDs.
+
+        Parameters
+        ----------
+        ids : dict[str, tensor]
+            Type-wise node IDs of each node type.
+
+        Returns
+        -------
+        Tensor
+            Homogeneous node IDs, concatenated in the order of the dictionary.
+        """
+        return F.cat([self.map_to_homo_nid(utils.toindex(typed_ids).tousertensor(), ntype)
+                      for ntype, typed_ids in ids.items()], 0)
+
+    def map_to_homo_eids(self, ids):
+        """Map the type-wise edge IDs of several edge types to homogeneous edge IDs.
+
+        Parameters
+        ----------
+        ids : dict[str, tensor]
+            Type-wise edge IDs of each edge type.
+
+        Returns
+        -------
+        Tensor
+            Homogeneous edge IDs, concatenated in the order of the dictionary.
+        """
+        return F.cat([self.map_to_homo_eid(utils.toindex(typed_ids).tousertensor(), etype)
+                      for etype, typed_ids in ids.items()], 0)
+
 class BasicPartitionBook(GraphPartitionBook):
     """This provides the most flexible way to store parition information.
 
@@ -721,6 +803,25 @@ class RangePartitionBook(GraphPartitionBook):
         self._nid_map = IdMap(self._typed_nid_range)
         self._eid_map = IdMap(self._typed_eid_range)
 
+        # Indices from homogeneous and per-type IDs to partition IDs.
+        self._nid_index = self._build_range_indices(self._max_node_ids,
+                                                    self._typed_max_node_ids, '_N')
+        self._eid_index = self._build_range_indices(self._max_edge_ids,
+                                                    self._typed_max_edge_ids, '_E')
+        # Per-type IDs plus these offsets (indexed by partition) are homogeneous IDs.
+        self._typed_nid_offsets = {key: self._typed_nid_range[key][:, 1]
+                                        - self._typed_max_node_ids[key]
+                                   for key in self._typed_nid_range}
+        self._typed_eid_offsets = {key: self._typed_eid_range[key][:, 1]
+                                        - self._typed_max_edge_ids[key]
+                                   for key in self._typed_eid_range}
+        # Flat indices over the per-type IDs of all types shifted by the number of IDs
+        # of the preceding types, for mapping several types in one pass.
+        self._flat_nid_index = self._build_flat_index(self._ntypes, self._typed_max_node_ids,
+                                                      self._typed_nid_offsets)
+        self._flat_eid_index = self._build_flat_index(self._etypes, self._typed_max_edge_ids,
+                                                      self._typed_eid_offsets)
+
         # Get meta data of the partition book
         self._partition_meta_data = []
         for partid in range(self._num_partitions):
@@ -738,6 +839,25 @@ class RangePartitionBook(GraphPartitionBook):
             part_info['num_edges'] = int(num_edges)
             self._partition_meta_data.append(part_info)
 
+    @staticmethod
+    def _build_range_indices(max_ids, typed_max_ids, homo_key):
+        indices = {key: _RangeIndex(ends) for key, ends in typed_max_ids.items()}
+        indices[homo_key] = _RangeIndex(max_ids)
+        return indices
+
+    def _build_flat_index(self, types, typed_max_ids, typed_offsets):
+        """Return the flat index, the ID shift of each type, and the offsets that map
+        shifted IDs in each flat range to homogeneous IDs."""
+        types = [key for key in types if key in typed_max_ids]
+        if len(types) == 0:
+            return None
+        totals = np.array([typed_max_ids[key][-1] for key in types], dtype=np.int64)
+        shifts = np.concatenate([[0], np.cumsum(totals)[:-1]])
+        ends = np.concatenate([typed_max_ids[key] + shift for key, shift in zip(types, shifts)])
+        offsets = np.concatenate([typed_offsets[key] - shift
+                                  for key, shift in zip(types, shifts)])
+        return _RangeIndex(ends), dict(zip(types, shifts.tolist())), offsets
+
     def shared_memory(self, graph_name):
         """Move data to shared memory.
         """
@@ -805,44 +925,45 @@ class RangePartitionBook(GraphPartitionBook):
     def map_to_homo_nid(self, ids, ntype):
         """Map per-node-type IDs to global node IDs in the homogeneous format.
         """
-        ids = utils.toindex(ids).tousertensor()
-        partids = self.nid2partid(ids, ntype)
-        typed_max_nids = F.zerocopy_from_numpy(self._typed_max_node_ids[ntype])
-        end_diff = F.gather_row(typed_max_nids, partids) - ids
-        typed_nid_range = F.zerocopy_from_numpy(self._typed_nid_range[ntype][:, 1])
-        return F.gather_row(typed_nid_range, partids) - end_diff
+        ids = _ids_to_numpy(ids).astype(np.int64)
+        partids = self._nid_index[ntype](ids)
+        return F.zerocopy_from_numpy(ids + self._typed_nid_offsets[ntype][partids])
 
     def map_to_homo_eid(self, ids, etype):
         """Map per-edge-type IDs to global edge IDs in the homoenegeous format.
         """
-        ids = utils.toindex(ids).tousertensor()
-        partids = self.eid2partid(ids, etype)
-        typed_max_eids = F.zerocopy_from_numpy(self._typed_max_edge_ids[etype])
-        end_diff = F.gather_row(typed_max_eids, partids) - ids
-        typed_eid_range = F.zerocopy_from_numpy(self._typed_eid_range[etype][:, 1])
-        return F.gather_row(typed_eid_range, partids) - end_diff
+        ids = _ids_to_numpy(ids).astype(np.int64)
+        partids = self._eid_index[etype](ids)
+        return F.zerocopy_from_numpy(ids + self._typed_eid_offsets[etype][partids])
+
+    @staticmethod
+    def _map_to_homo_flat(ids, flat_index):
+        index, shifts, offsets = flat_index
+        shifted = np.concatenate([_ids_to_numpy(typed_ids).astype(np.int64) + shifts[key]
+                                  for key, typed_ids in ids.items()])
+        return F.zerocopy_from_numpy(shifted + offsets[index(shifted)])
+
+    def map_to_homo_nids(self, ids):
+        """Map the type-wise node IDs of several node types to homogeneous node IDs
+        with a single lookup.
+        """
+        return self._map_to_homo_flat(ids, self._flat_nid_index)
+
+    def map_to_homo_eids(self, ids):
+        """Map the type-wise edge IDs of several edge types to homogeneous edge IDs
+        with a single lookup.
+        """
+        return self._map_to_homo_flat(ids, self._flat_eid_index)
 
     def nid2partid(self, nids, ntype='_N'):
         """From global node IDs to partition IDs
         """
-        nids = utils.toindex(nids)
-        if ntype == '_N':
-            ret = np.searchsorted(self._max_node_ids, nids.tonumpy(), side='right')
-        else:
-            ret = np.searchsorted(self._typed_max_node_ids[ntype], nids.tonumpy(), side='right')
-        ret = utils.toindex(ret)
-        return ret.tousertensor()
+        return F.zerocopy_from_numpy(self._nid_index[ntype](_ids_to_numpy(nids)))
 
     def eid2partid(self, eids, etype='_E'):
         """From global edge IDs to partition IDs
         """
-        eids = utils.toindex(eids)
-        if etype == '_E':
-            ret = np.searchsorted(self._max_edge_ids, eids.tonumpy(), side='right')
-        else:
-            ret = np.searchsorted(self._typed_max_edge_ids[etype], eids.tonumpy(), side='right')
-        ret = utils.toindex(ret)
-        return ret.tousertensor()
+        return F.zerocopy_from_numpy(self._eid_index[etype](_ids_to_numpy(eids)))
 
 
     def partid2nids(self, partid, ntype='_N'):
@@ -876,12 +997,8 @@ class RangePartitionBook(GraphPartitionBook):
     def nid2localnid(self, nids, partid, ntype='_N'):
         """Get local node IDs within the given partition.
         """
-        if partid != self._partid:
-            raise RuntimeError('Now RangePartitionBook does not support \
-                getting remote tensor of nid2localnid.')
-
-        nids = utils.toindex(nids)
-        nids = nids.tousertensor()
+        if not F.is_tensor(nids):
+            nids = utils.toindex(nids).tousertensor()
         if ntype == '_N':
             start = self._max_node_ids[partid - 1] if partid > 0 else 0
         else:
@@ -892,12 +1009,8 @@ class RangePartitionBook(GraphPartitionBook):
     def eid2localeid(self, eids, partid, etype='_E'):
         """Get the local edge IDs within the given partition.
         """
-        if partid != self._partid:
-            raise RuntimeError('Now RangePartitionBook does not support \
-                getting remote tensor of eid2localeid.')
-
-        eids = utils.toindex(eids)
-        eids = eids.tousertensor()
+        if not F.is_tensor(eids):
+            eids = utils.toindex(eids).tousertensor()
         if etype == '_E':
             start = self._max_edge_ids[partid - 1] if partid > 0 else 0
         else:
@@ -995,23 +1108,27 @@ class PartitionPolicy(object):
         is_node = NODE_PART_POLICY in self._policy_str
         return HeteroDataName(is_node, self._policy_str[5:], name)
 
-    def to_local(self, id_tensor):
+    def to_local(self, id_tensor, part_id=None):
         """Mapping global ID to local ID.
 
         Parameters
         ----------
         id_tensor : tensor
             Gloabl ID tensor
+        part_id : int, optional
+            The partition the IDs belong to.  Default: the partition of this policy.
+            Only the range partition book supports other partitions.
 
         Return
         ------
         tensor
             local ID tensor
         """
+        part_id = self._part_id if part_id is None else part_id
         if EDGE_PART_POLICY in self._policy_str:
-            return self._partition_book.eid2localeid(id_tensor, self._part_id, self._policy_str[5:])
+            return self._partition_book.eid2localeid(id_tensor, part_id, self._policy_str[5:])
         elif NODE_PART_POLICY in self._policy_str:
-            return self._partition_book.nid2localnid(id_tensor, self._part_id, self._policy_str[5:])
+            return self._partition_book.nid2localnid(id_tensor, part_id, self._policy_str[5:])
         else:
             raise RuntimeError('Cannot support policy: %s ' % self._policy_str)
 
@@ -1035,18 +1152,24 @@ class PartitionPolicy(object):
         else:
             raise RuntimeError('Cannot support policy: %s ' % self._policy_str)
 
-    def get_part_size(self):
+    def get_part_size(self, part_id=None):
         """Get data size of current partition.
 
+        Parameters
+        ----------
+        part_id : int, optional
+            The partition.  Default: the partition of this policy.
+
         Returns
         -------
         int
             data size
         """
+        part_id = self._part_id if part_id is None else part_id
         if EDGE_PART_POLICY in self._policy_str:
-            return len(self._partition_book.partid2eids(self._part_id, self._policy_str[5:]))
+            return len(self._partition_book.partid2eids(part_id, self._policy_str[5:]))
         elif NODE_PART_POLICY in self._policy_str:
-            return len(self._partition_book.partid2nids(self._part_id, self._policy_str[5:]))
+            return len(self._partition_book.partid2nids(part_id, self._policy_str[5:]))
         else:
             raise RuntimeError('Cannot support policy: %s ' % self._policy_str)
 
@@ -487,16 +487,10 @@ def sample_etype_neighbors(g, nodes, etype_field, fanout, edge_dir='in', prob=No
 
     gpb = g.get_partition_book()
     if isinstance(nodes, dict):
-        homo_nids = []
         for ntype in nodes.keys():
             assert ntype in g.ntypes, \
                 'The sampled node type {} does not exist in the input graph'.format(ntype)
-            if F.is_tensor(nodes[ntype]):
-                typed_nodes = nodes[ntype]
-            else:
-                typed_nodes = toindex(nodes[ntype]).tousertensor()
-            homo_nids.append(gpb.map_to_homo_nid(typed_nodes, ntype))
-        nodes = F.cat(homo_nids, 0)
+        nodes = gpb.map_to_homo_nids(nodes)
     def issue_remote_req(node_ids):
         return SamplingRequestEtype(node_ids, etype_field, fanout, edge_dir=edge_dir,
                                     prob=prob, replace=replace)
@@ -561,15 +555,9 @@ def sample_neighbors(g, nodes, fanout, edge_dir='in', prob=None, replace=False):
     gpb = g.get_partition_book()
     if not gpb.is_homogeneous:
         assert isinstance(nodes, dict)
-        homo_nids = []
         for ntype in nodes:
             assert ntype in g.ntypes, 'The sampled node type does not exist in the input graph'
-            if F.is_tensor(nodes[ntype]):
-                typed_nodes = nodes[ntype]
-            else:
-                typed_nodes = toindex(nodes[ntype]).tousertensor()
-            homo_nids.append(gpb.map_to_homo_nid(typed_nodes, ntype))
-        nodes = F.cat(homo_nids, 0)
+        nodes = gpb.map_to_homo_nids(nodes)
     elif isinstance(nodes, dict):
         assert len(nodes) == 1
         nodes = list(nodes.values())[0]
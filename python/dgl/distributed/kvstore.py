@@ -1,18 +1,26 @@
 """Define distributed kvstore"""
 
 import os
+import time
 import numpy as np
 
 from . import rpc
-from .graph_partition_book import NodePartitionPolicy, EdgePartitionPolicy
+from .codec import ID_CODECS, FEAT_CODECS
+from .graph_partition_book import NodePartitionPolicy, EdgePartitionPolicy, RangePartitionBook
 from .standalone_kvstore import KVClient as SA_KVClient
 
 from .. import backend as F
 from .. import utils
 from .._ffi.ndarray import empty_shared_mem
+from ..ndarray import exist_shared_mem_array
 
 ############################ Register KVStore Requsts and Responses ###############################
 
+def _get_shm_name(name, part_id):
+    """Name of the shared-memory tensor of the data in the given partition.  The
+    partition ID keeps the partitions hosted by the same machine apart."""
+    return '{}-kvdata-{}'.format(name, part_id)
+
 KVSTORE_PULL = 901231
 
 class PullResponse(rpc.Response):
@@ -477,7 +485,8 @@ class SendMetaToBackupRequest(rpc.Request):
         kv_store = server_state.kv_store
         assert kv_store.is_backup_server()
         if self.name not in kv_store.data_store:
-            shared_data = empty_shared_mem(self.name+'-kvdata-', False, self.shape, self.dtype)
+            shared_data = empty_shared_mem(_get_shm_name(self.name, kv_store.part_id), False,
+                                           self.shape, self.dtype)
             dlpack = shared_data.to_dlpack()
             kv_store.data_store[self.name] = F.zerocopy_from_dlpack(dlpack)
             kv_store.part_policy[self.name] = kv_store.find_policy(self.policy_str)
@@ -653,7 +662,8 @@ class KVServer(object):
                              InitDataResponse)
         rpc.register_service(BARRIER,
                              BarrierRequest,
-                             BarrierResponse)
+                             BarrierResponse,
+                             batchable=False)
         rpc.register_service(REGISTER_PUSH,
                              RegisterPushHandlerRequest,
                              RegisterPushHandlerResponse)
@@ -784,7 +794,8 @@ class KVServer(object):
         self._part_policy[name] = self.find_policy(policy_str)
         if data_tensor is not None: # Create shared-tensor
             data_type = F.reverse_data_type_dict[F.dtype(data_tensor)]
-            shared_data = empty_shared_mem(name+'-kvdata-', True, data_tensor.shape, data_type)
+            shared_data = empty_shared_mem(_get_shm_name(name, self._part_id), True,
+                                           data_tensor.shape, data_type)
             dlpack = shared_data.to_dlpack()
             self._data_store[name] = F.zerocopy_from_dlpack(dlpack)
             rpc.copy_data_to_shared_memory(self._data_store[name], data_tensor)
@@ -866,7 +877,8 @@ class KVClient(object):
                              InitDataResponse)
         rpc.register_service(BARRIER,
                              BarrierRequest,
-                             BarrierResponse)
+                             BarrierResponse,
+                             batchable=False)
         rpc.register_service(REGISTER_PUSH,
                              RegisterPushHandlerRequest,
                              RegisterPushHandlerResponse)
@@ -914,6 +926,28 @@ class KVClient(object):
         self._push_handlers = {}
         # register role on server-0
         self._role = role
+        # Pulls issued by pull_async() but not sent yet, keyed by data name
+        self._pending_pulls = {}
+        self._num_pending_pulls = 0
+        self._pull_window = 1
+        # Merged pulls sent but not received yet
+        self._inflight_pulls = []
+        # Client-side caches of remote rows, keyed by data name
+        self._pull_caches = {}
+        # Shared-memory tensors of the other partitions on this host, keyed by data
+        # name and partition ID.  They are read directly instead of through RPC.
+        local_ip = self._server_namebook[self._main_server_id][1]
+        self._colocated_parts = set()
+        if os.environ.get('DGL_KVSTORE_SHM_PULL', '1') != '0':
+            self._colocated_parts = {
+                machine_id for machine_id, ip, _, _ in self._server_namebook.values()
+                if ip == local_ip and machine_id != self._machine_id}
+        self._colocated_data = {}
+        # Number of rows pulled through each path
+        self._pull_stats = {'local': 0, 'shared_mem': 0, 'rpc': 0}
+        # Compression of pull/push payloads
+        self.set_codec(os.environ.get('DGL_KVSTORE_ID_CODEC', None),
+                       os.environ.get('DGL_KVSTORE_FEAT_CODEC', None))
 
     @property
     def all_possible_part_policy(self):
@@ -940,6 +974,28 @@ class KVClient(object):
         """Get the number of servers"""
         return self._server_count
 
+    def set_codec(self, id_codec=None, feat_codec=None):
+        """Compress the ID and data tensors of pull and push messages.
+
+        The servers encode the pull responses with the same codecs.  When a codec is
+        set, pulls go through the Python RPC path instead of fast-pull so that the
+        responses can be decoded.  The defaults can also be set with the environment
+        variables ``DGL_KVSTORE_ID_CODEC`` and ``DGL_KVSTORE_FEAT_CODEC``.
+
+        Parameters
+        ----------
+        id_codec : str, optional
+            The lossless codec for ID tensors: ``'delta_varint'`` or ``'zlib'``.
+        feat_codec : str, optional
+            The codec for data tensors: ``'fp16'``, ``'bf16'``, ``'int8'`` (lossy),
+            or ``'zlib'`` (lossless).
+        """
+        for codec, codecs in [(id_codec, ID_CODECS), (feat_codec, FEAT_CODECS)]:
+            assert codec is None or codec in codecs, \
+                'Unknown codec {}. Expect one of {}.'.format(codec, list(codecs))
+        rpc.set_service_codec(KVSTORE_PULL, id_codec, feat_codec)
+        rpc.set_service_codec(KVSTORE_PUSH, id_codec, feat_codec)
+
     def barrier(self):
         """Barrier for all client nodes.
 
@@ -1069,7 +1125,7 @@ class KVClient(object):
             raise RuntimeError("Data shape %s has already exists!" % name)
         self._part_policy[name] = part_policy
         self._all_possible_part_policy[part_policy.policy_str] = part_policy
-        shared_data = empty_shared_mem(name+'-kvdata-', False, \
+        shared_data = empty_shared_mem(_get_shm_name(name, self._part_id), False, \
             local_shape, F.reverse_data_type_dict[dtype])
         dlpack = shared_data.to_dlpack()
         self._data_store[name] = F.zerocopy_from_dlpack(dlpack)
@@ -1079,6 +1135,7 @@ class KVClient(object):
         self._full_data_shape[name] = tuple(shape)
         self._pull_handlers[name] = default_pull_handler
         self._push_handlers[name] = default_push_handler
+        self._map_colocated_data(name)
 
         # Now we need to tell the backup server the new tensor.
         request = SendMetaToBackupRequest(name, F.reverse_data_type_dict[dtype],
@@ -1126,6 +1183,8 @@ class KVClient(object):
         del self._full_data_shape[name]
         del self._part_policy[name]
         del self._pull_handlers[name]
+        self._pull_caches.pop(name, None)
+        self._colocated_data.pop(name, None)
         del self._push_handlers[name]
         self.barrier()
 
@@ -1154,7 +1213,8 @@ class KVClient(object):
             if name not in self._data_name_list:
                 shape, dtype, policy_str = meta
                 assert policy_str in self._all_possible_part_policy
-                shared_data = empty_shared_mem(name+'-kvdata-', False, shape, dtype)
+                shared_data = empty_shared_mem(_get_shm_name(name, self._part_id), False,
+                                               shape, dtype)
                 dlpack = shared_data.to_dlpack()
                 self._data_store[name] = F.zerocopy_from_dlpack(dlpack)
                 self._part_policy[name] = self._all_possible_part_policy[policy_str]
@@ -1176,6 +1236,7 @@ class KVClient(object):
                     res = rpc.recv_response()
                     data_shape[0] += res.shape[0]
                 self._full_data_shape[name] = tuple(data_shape)
+                self._map_colocated_data(name)
         # Send meta data to backup servers
         for name, meta in response.meta.items():
             shape, dtype, policy_str = meta
@@ -1196,6 +1257,62 @@ class KVClient(object):
             self._gdata_name_list.add(name)
         self.barrier()
 
+    def _map_colocated_data(self, name):
+        """Map the shared-memory tensors of the data created by the servers of the
+        other partitions on this host."""
+        policy = self._part_policy[name]
+        # Only the range partition book maps the IDs of other partitions locally.
+        if not self._colocated_parts or \
+                not isinstance(policy.partition_book, RangePartitionBook):
+            return
+        dtype = F.reverse_data_type_dict[F.dtype(self._data_store[name])]
+        shape = list(self._full_data_shape[name])
+        tensors = {}
+        for part_id in self._colocated_parts:
+            shm_name = _get_shm_name(name, part_id)
+            if not exist_shared_mem_array(shm_name):
+                continue
+            shape[0] = policy.get_part_size(part_id)
+            shared_data = empty_shared_mem(shm_name, False, tuple(shape), dtype)
+            tensors[part_id] = F.zerocopy_from_dlpack(shared_data.to_dlpack())
+        if tensors:
+            self._colocated_data[name] = tensors
+
+    def _read_direct(self, name, part_id, partial_id):
+        """Read the rows of the given partition from this process if it is local or
+        co-located, or return None if they have to be pulled through RPC."""
+        policy = self._part_policy[name]
+        if part_id == self._machine_id:
+            local_id = policy.to_local(partial_id)
+            data = self._pull_handlers[name](self._data_store, name, local_id)
+            self._pull_stats['local'] += len(partial_id)
+            return data
+        colocated = self._colocated_data.get(name, None)
+        if colocated is None or part_id not in colocated or \
+                self._pull_handlers[name] is not default_pull_handler:
+            return None
+        local_id = policy.to_local(partial_id, part_id)
+        self._pull_stats['shared_mem'] += len(partial_id)
+        return F.gather_row(colocated[part_id], local_id)
+
+    def pull_stats(self):
+        """Return the number of rows pulled through each path.
+
+        Returns
+        -------
+        dict
+            ``'local'``: rows of the local partition; ``'shared_mem'``: rows of other
+            partitions on the same host read from their shared memory; ``'rpc'``: rows
+            pulled from remote servers.  Rows served by the client-side cache are not
+            counted.
+        """
+        return dict(self._pull_stats)
+
+    def reset_pull_stats(self):
+        """Reset the counters of :meth:`pull_stats`."""
+        for key in self._pull_stats:
+            self._pull_stats[key] = 0
+
     def gdata_name_list(self):
         """Get all the graph data name"""
         return list(self._gdata_name_list)
@@ -1252,6 +1369,10 @@ class KVClient(object):
         assert F.ndim(id_tensor) == 1, 'ID must be a vector.'
         assert F.shape(id_tensor)[0] == F.shape(data_tensor)[0], \
         'The data must has the same row size with ID.'
+        # Keep the queued pulls ordered before this push.
+        self.flush_pulls()
+        if name in self._pull_caches:
+            self._pull_caches[name].remove(F.asnumpy(id_tensor))
         # partition data
         machine_id = self._part_policy[name].to_partid(id_tensor)
         # sort index by machine id
@@ -1300,15 +1421,90 @@ class KVClient(object):
         id_tensor = utils.toindex(id_tensor)
         id_tensor = id_tensor.tousertensor()
         assert F.ndim(id_tensor) == 1, 'ID must be a vector.'
-        if self._pull_handlers[name] is default_pull_handler: # Use fast-pull
+        self.flush_pulls()
+        if name in self._pull_caches:
+            return self._pull_with_cache(name, id_tensor, self._pull_caches[name])
+        return self._pull(name, id_tensor)
+
+    def _pull_with_cache(self, name, id_tensor, cache):
+        """Serve the cached remote rows from the cache and pull the rest."""
+        ids = F.asnumpy(id_tensor)
+        part_id = F.asnumpy(self._part_policy[name].to_partid(id_tensor))
+        remote = part_id != self._machine_id
+        for colocated_part in self._colocated_data.get(name, {}):
+            remote &= part_id != colocated_part
+        remote_pos = np.flatnonzero(remote)
+        hit, hit_slots = cache.lookup(ids[remote_pos])
+        hit_pos = remote_pos[hit]
+        cache.hits += hit_pos.shape[0]
+        cache.misses += remote_pos.shape[0] - hit_pos.shape[0]
+        if hit_pos.shape[0] == 0:
+            data = self._pull(name, id_tensor)
+            miss_pos = np.arange(ids.shape[0])
+        else:
+            miss_mask = np.ones(ids.shape[0], dtype=bool)
+            miss_mask[hit_pos] = False
+            miss_pos = np.flatnonzero(miss_mask)
+            miss_data = self._pull(name, F.tensor(ids[miss_pos]))
+            order = np.concatenate([hit_pos, miss_pos])
+            data = F.cat([cache.gather(hit_slots), miss_data], 0)
+            data = F.gather_row(data, F.tensor(np.argsort(order)))
+        # Cache the remote rows just pulled.
+        new_pos = miss_pos[remote[miss_pos]]
+        if new_pos.shape[0] > 0:
+            new_ids, first = np.unique(ids[new_pos], return_index=True)
+            cache.insert(new_ids, F.gather_row(data, F.tensor(new_pos[first])))
+        return data
+
+    def enable_cache(self, name, cache_size, max_staleness=None):
+        """Cache up to ``cache_size`` rows of the data owned by other machines so that
+        repeated pulls of them (e.g. features of remote high-degree nodes) do not go
+        over the network.
+
+        Rows pushed by this client are invalidated immediately.  Rows pushed by other
+        clients are only refreshed after ``max_staleness`` seconds or
+        :meth:`invalidate_cache`, so the cache is meant for read-only or rarely
+        updated data.
+
+        Parameters
+        ----------
+        name : str
+            data name
+        cache_size : int
+            The maximum number of cached rows.
+        max_staleness : float, optional
+            The number of seconds a cached row stays valid.  None means forever.
+        """
+        dtype, shape, _ = self.get_data_meta(name)
+        self._pull_caches[name] = _PullCache(cache_size, shape, dtype, max_staleness)
+
+    def disable_cache(self, name):
+        """Drop the cache of the data."""
+        self._pull_caches.pop(name, None)
+
+    def invalidate_cache(self, name=None):
+        """Remove all the cached rows of the data, or of all data if name is None."""
+        for cache_name, cache in self._pull_caches.items():
+            if name is None or cache_name == name:
+                cache.clear()
+
+    def cache_stats(self, name):
+        """Return the hit and miss counters of the cache of the data, or None if the
+        data is not cached."""
+        cache = self._pull_caches.get(name, None)
+        return cache.stats() if cache is not None else None
+
+    def _pull(self, name, id_tensor):
+        """Pull data from KVServer without consulting the cache."""
+        # Fast-pull receives the responses in C++, which cannot decode compressed ones.
+        if self._pull_handlers[name] is default_pull_handler and \
+                rpc.get_service_codec(KVSTORE_PULL) is None: # Use fast-pull
+            if self._inflight_pulls:
+                self._sync_pulls()
             part_id = self._part_policy[name].to_partid(id_tensor)
-            return rpc.fast_pull(name, id_tensor, part_id, KVSTORE_PULL,
-                                 self._machine_count,
-                                 self._group_count,
-                                 self._machine_id,
-                                 self._client_id,
-                                 self._data_store[name],
-                                 self._part_policy[name])
+            if name in self._colocated_data:
+                return self._fast_pull_colocated(name, id_tensor, part_id)
+            return self._fast_pull(name, id_tensor, part_id)
         else:
             # partition data
             machine_id = self._part_policy[name].to_partid(id_tensor)
@@ -1320,28 +1516,35 @@ class KVClient(object):
             # pull data from server by order
             start = 0
             pull_count = 0
-            local_id = None
+            direct_ids = []
             for idx, machine_idx in enumerate(machine):
                 end = start + count[idx]
                 if start == end: # No data for target machine
                     continue
                 partial_id = id_tensor[start:end]
-                if machine_idx == self._machine_id: # local pull
-                    # Note that DO NOT pull local data right now because we can overlap
-                    # communication-local_pull here
-                    local_id = self._part_policy[name].to_local(partial_id)
+                if machine_idx == self._machine_id or \
+                        machine_idx in self._colocated_data.get(name, {}):
+                    # Note that DO NOT read local or co-located data right now because
+                    # we can overlap communication-local_pull here
+                    direct_ids.append((machine_idx, partial_id))
                 else: # pull data from remote server
                     request = PullRequest(name, partial_id)
                     rpc.send_request_to_machine(machine_idx, request)
+                    self._pull_stats['rpc'] += len(partial_id)
                     pull_count += 1
                 start += count[idx]
             # recv response
             response_list = []
-            if local_id is not None: # local pull
-                local_data = self._pull_handlers[name](self._data_store, name, local_id)
-                server_id = self._main_server_id
-                local_response = PullResponse(server_id, local_data)
-                response_list.append(local_response)
+            for machine_idx, partial_id in direct_ids: # local pull
+                data = self._read_direct(name, machine_idx, partial_id)
+                if data is None: # custom pull handler on a co-located partition
+                    request = PullRequest(name, partial_id)
+                    rpc.send_request_to_machine(machine_idx, request)
+                    self._pull_stats['rpc'] += len(partial_id)
+                    pull_count += 1
+                else:
+                    server_id = machine_idx * self._group_count
+                    response_list.append(PullResponse(server_id, data))
             # wait response from remote server nodes
             for _ in range(pull_count):
                 remote_response = rpc.recv_response()
@@ -1351,6 +1554,118 @@ class KVClient(object):
             data_tensor = F.cat(seq=[response.data_tensor for response in response_list], dim=0)
             return data_tensor[back_sorted_id] # return data with original index order
 
+    def _fast_pull(self, name, id_tensor, part_id):
+        num_local = int(np.sum(F.asnumpy(part_id) == self._machine_id))
+        self._pull_stats['local'] += num_local
+        self._pull_stats['rpc'] += len(id_tensor) - num_local
+        return rpc.fast_pull(name, id_tensor, part_id, KVSTORE_PULL,
+                             self._machine_count,
+                             self._group_count,
+                             self._machine_id,
+                             self._client_id,
+                             self._data_store[name],
+                             self._part_policy[name])
+
+    def _fast_pull_colocated(self, name, id_tensor, part_id):
+        """Read the rows of co-located partitions from shared memory and fast-pull
+        the rest."""
+        ids = F.asnumpy(id_tensor)
+        part_id = F.asnumpy(part_id)
+        parts = []
+        rest = np.ones(ids.shape[0], dtype=bool)
+        for colocated_part in self._colocated_data[name]:
+            pos = np.flatnonzero(part_id == colocated_part)
+            if pos.shape[0] > 0:
+                rest[pos] = False
+                parts.append((pos, self._read_direct(name, colocated_part, F.tensor(ids[pos]))))
+        if not parts:
+            return self._fast_pull(name, id_tensor, F.tensor(part_id))
+        rest_pos = np.flatnonzero(rest)
+        if rest_pos.shape[0] > 0:
+            parts.append((rest_pos, self._fast_pull(name, F.tensor(ids[rest_pos]),
+                                                    F.tensor(part_id[rest_pos]))))
+        pos = np.concatenate([pos for pos, _ in parts])
+        data = F.cat([data for _, data in parts], 0)
+        return F.gather_row(data, F.tensor(np.argsort(pos)))
+
+    def pull_async(self, name, id_tensor):
+        """Pull data from KVServer without blocking.
+
+        The IDs are queued in a coalescing window (see :meth:`set_pull_window`).  When
+        the window is flushed, the IDs of all the queued pulls of the same data are
+        deduplicated and sent as one request per machine.  The local partition is read
+        directly from shared memory.
+
+        Parameters
+        ----------
+        name : str
+            data name
+        id_tensor : tensor
+            a vector storing the ID list
+
+        Returns
+        -------
+        PullFuture
+            A future whose ``wait()`` method returns a data tensor with the same row
+            size of id_tensor.
+        """
+        assert len(name) > 0, 'name cannot be empty.'
+        id_tensor = utils.toindex(id_tensor)
+        id_tensor = id_tensor.tousertensor()
+        assert F.ndim(id_tensor) == 1, 'ID must be a vector.'
+        future = PullFuture(self)
+        self._pending_pulls.setdefault(name, []).append((id_tensor, future))
+        self._num_pending_pulls += 1
+        if self._num_pending_pulls >= self._pull_window:
+            self.flush_pulls()
+        return future
+
+    def set_pull_window(self, window):
+        """Set the number of :meth:`pull_async` calls queued before their requests
+        are merged and sent.
+
+        The default window is 1, i.e. every call is sent immediately.  Queued calls are
+        also sent by :meth:`flush_pulls`, by waiting on any of their futures, and
+        before any :meth:`push` or :meth:`pull`.
+
+        Parameters
+        ----------
+        window : int
+            The window size.
+        """
+        assert window > 0, 'The pull window must be positive.'
+        self._pull_window = window
+        if self._num_pending_pulls >= window:
+            self.flush_pulls()
+
+    def flush_pulls(self):
+        """Merge and send the pulls queued by :meth:`pull_async`."""
+        pending = self._pending_pulls
+        self._pending_pulls = {}
+        self._num_pending_pulls = 0
+        self._inflight_pulls = [merged for merged in self._inflight_pulls if not merged.done()]
+        for name, pulls in pending.items():
+            ids = F.asnumpy(F.cat([id_tensor for id_tensor, _ in pulls], 0))
+            uniq_ids, inverse = np.unique(ids, return_inverse=True)
+            merged = _MergedPull(self, name, F.tensor(uniq_ids))
+            self._inflight_pulls.append(merged)
+            start = 0
+            for id_tensor, future in pulls:
+                end = start + F.shape(id_tensor)[0]
+                future._bind(merged, F.tensor(inverse[start:end]))
+                start = end
+
+    def _sync_pulls(self):
+        """Send the queued pulls and receive all the responses of the sent ones.
+
+        Needed before operations whose responses are received inside C++ (i.e.
+        fast-pull), which cannot tell them apart from the asynchronous responses.
+        """
+        self.flush_pulls()
+        for merged in self._inflight_pulls:
+            merged.result()
+        self._inflight_pulls = []
+
     def _take_id(self, elem):
         """Used by sort response list
         """
@@ -1385,6 +1700,172 @@ class KVClient(object):
             total += res.num_local_nonzero
         return total
 
+class _MergedPull(object):
+    """A pull of unique IDs merged from one or more :meth:`KVClient.pull_async` calls.
+
+    The requests are sent to the servers upon construction, and the responses are
+    received when :meth:`result` is called for the first time.
+    """
+    def __init__(self, client, name, id_tensor):
+        self._parts = []            # list of (positions in id_tensor, data tensor)
+        self._msg_seqs = {}         # msg_seq -> positions in id_tensor
+        self._result = None
+        if F.shape(id_tensor)[0] == 0:
+            dtype, shape, _ = client.get_data_meta(name)
+            self._result = F.zeros((0,) + tuple(shape[1:]), dtype, F.cpu())
+            return
+        policy = client._part_policy[name]
+        machine_id = F.asnumpy(policy.to_partid(id_tensor))
+        sorted_idx = np.argsort(machine_id, kind='stable')
+        machine, count = np.unique(machine_id, return_counts=True)
+        start = 0
+        for machine_idx, cnt in zip(machine, count):
+            pos = sorted_idx[start:start + cnt]
+            start += cnt
+            partial_id = F.gather_row(id_tensor, F.tensor(pos))
+            data = client._read_direct(name, machine_idx, partial_id)
+            if data is not None:
+                self._parts.append((pos, data))
+            else:
+                client._pull_stats['rpc'] += len(partial_id)
+                msg_seq = rpc.send_request_to_machine(machine_idx, PullRequest(name, partial_id))
+                rpc.register_async_response(msg_seq)
+                self._msg_seqs[msg_seq] = pos
+
+    def done(self):
+        """Whether the responses have been received."""
+        return self._result is not None
+
+    def result(self):
+        """Wait for the responses and return the data in the order of the IDs."""
+        if self._result is None:
+            for msg_seq, pos in self._msg_seqs.items():
+                self._parts.append((pos, rpc.recv_async_response(msg_seq).data_tensor))
+            pos = np.concatenate([pos for pos, _ in self._parts])
+            data = F.cat([data for _, data in self._parts], 0)
+            self._result = F.gather_row(data, F.tensor(np.argsort(pos)))
+            self._parts = None
+        return self._result
+
+class _PullCache(object):
+    """Client-side cache of the remote rows of one kvstore tensor.
+
+    The cached IDs are kept in a sorted array so that lookups are a single
+    ``searchsorted`` pass; the rows are kept in a contiguous buffer.  When full, the
+    least recently used rows are evicted.
+
+    Parameters
+    ----------
+    capacity : int
+        The maximum number of rows in the cache.
+    shape : tuple
+        The shape of the whole tensor.
+    dtype : dtype
+        The data type of the tensor.
+    max_staleness : float, optional
+        The number of seconds a row stays valid after it is pulled.  None means that
+        the rows never expire, which is only safe for tensors not updated by other
+        clients.
+    """
+    def __init__(self, capacity, shape, dtype, max_staleness=None):
+        self.capacity = capacity
+        self.max_staleness = max_staleness
+        self.hits = 0
+        self.misses = 0
+        self._keys = np.empty(0, dtype=np.int64)    # sorted cached IDs
+        self._slots = np.empty(0, dtype=np.int64)   # buffer slots aligned with _keys
+        self._used = np.zeros(capacity, dtype=bool)
+        self._last_use = np.zeros(capacity, dtype=np.int64)
+        self._insert_time = np.zeros(capacity, dtype=np.float64)
+        self._clock = 0
+        self._buffer = F.zeros((capacity,) + tuple(shape[1:]), dtype, F.cpu())
+
+    def lookup(self, ids):
+        """Return a mask of the cached IDs in ``ids`` and their buffer slots."""
+        self._clock += 1
+        if self._keys.shape[0] == 0:
+            return np.zeros(ids.shape[0], dtype=bool), np.empty(0, dtype=np.int64)
+        pos = np.minimum(np.searchsorted(self._keys, ids), self._keys.shape[0] - 1)
+        hit = self._keys[pos] == ids
+        slots = self._slots[pos]
+        if self.max_staleness is not None:
+            hit &= (time.time() - self._insert_time[slots]) <= self.max_staleness
+        slots = slots[hit]
+        self._last_use[slots] = self._clock
+        return hit, slots
+
+    def gather(self, slots):
+        """Return the cached rows in the given slots."""
+        return F.gather_row(self._buffer, F.tensor(slots))
+
+    def _remove_positions(self, pos):
+        self._used[self._slots[pos]] = False
+        self._keys = np.delete(self._keys, pos)
+        self._slots = np.delete(self._slots, pos)
+
+    def remove(self, ids):
+        """Remove the given IDs from the cache if they are cached."""
+        if self._keys.shape[0] == 0:
+            return
+        pos = np.minimum(np.searchsorted(self._keys, ids), self._keys.shape[0] - 1)
+        self._remove_positions(np.unique(pos[self._keys[pos] == ids]))
+
+    def clear(self):
+        """Remove all the rows."""
+        self._remove_positions(np.arange(self._keys.shape[0]))
+
+    def insert(self, ids, data):
+        """Insert the unique IDs ``ids`` with rows ``data``, replacing stale copies."""
+        self.remove(ids)
+        num = min(ids.shape[0], self.capacity)
+        if num == 0:
+            return
+        ids = ids[:num]
+        num_evict = num - (self.capacity - self._keys.shape[0])
+        if num_evict > 0:
+            victims = np.argpartition(self._last_use[self._slots], num_evict - 1)[:num_evict]
+            self._remove_positions(victims)
+        slots = np.flatnonzero(~self._used)[:num]
+        F.scatter_row_inplace(self._buffer, F.tensor(slots), data[:num])
+        self._used[slots] = True
+        self._last_use[slots] = self._clock
+        self._insert_time[slots] = time.time()
+        order = np.argsort(ids)
+        ins = np.searchsorted(self._keys, ids[order])
+        self._keys = np.insert(self._keys, ins, ids[order])
+        self._slots = np.insert(self._slots, ins, slots[order])
+
+    def stats(self):
+        """Return the cache counters as a dictionary."""
+        total = self.hits + self.misses
+        return {'hits': self.hits, 'misses': self.misses,
+                'hit_rate': self.hits / total if total > 0 else 0.,
+                'cached_rows': self._keys.shape[0]}
+
+class PullFuture(object):
+    """The future returned by :meth:`KVClient.pull_async`."""
+    def __init__(self, client):
+        self._client = client
+        self._merged = None
+        self._index = None
+
+    def _bind(self, merged, index):
+        self._merged = merged
+        self._index = index
+
+    def done(self):
+        """Whether the data has arrived."""
+        return self._merged is not None and self._merged.done()
+
+    def wait(self):
+        """Block until the data arrives and return it.
+
+        Sends the request first if it is still waiting in the coalescing window.
+        """
+        if self._merged is None:
+            self._client.flush_pulls()
+        return F.gather_row(self._merged.result(), self._index)
+
 KVCLIENT = None
 
 def init_kvstore(ip_config, num_servers, role):
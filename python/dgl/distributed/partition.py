@@ -7,7 +7,7 @@ import numpy as np
 
 from .. import backend as F
 from ..base import NID, EID, NTYPE, ETYPE, dgl_warning
-from ..convert import to_homogeneous
+from ..convert import to_homogeneous, graph as dgl_graph
 from ..random import choice as random_choice
 from ..data.utils import load_graphs, save_graphs, load_tensors, save_tensors
 from ..partition import metis_partition_assignment, partition_graph_with_halo, get_peak_mem
@@ -869,3 +869,261 @@ def partition_graph(g, graph_name, num_parts, out_path, num_hops=1, part_method=
 
     if return_mapping:
         return orig_nids, orig_eids
+
+def _as_array(data):
+    '''Open a numpy file as a read-only memory map, or return the array-like as is.'''
+    if isinstance(data, str):
+        return np.load(data, mmap_mode='r')
+    return data
+
+def _append_spill(path, arr):
+    with open(path, 'ab') as f:
+        np.ascontiguousarray(arr).tofile(f)
+
+def _read_spill(path, dtype, shape=()):
+    if not os.path.exists(path):
+        return np.empty((0,) + tuple(shape), dtype=dtype)
+    arr = np.fromfile(path, dtype=dtype)
+    return arr.reshape((-1,) + tuple(shape))
+
+def partition_graph_streaming(edges, num_nodes, graph_name, num_parts, out_path,
+                              node_feats=None, edge_feats=None, node_parts=None,
+                              part_method='random', chunk_size=1 << 22):
+    ''' Partition a graph that does not fit in memory and store the partitions on files.
+
+    This is an out-of-core variant of :func:`partition_graph` for homogeneous graphs.
+    The edges and the features are read in chunks of ``chunk_size`` rows, e.g., from numpy
+    arrays opened with ``mmap_mode='r'``. The edges of each partition are spilled to disk
+    while the input is scanned and every partition is then built and saved on its own, so
+    the peak memory is bounded by a few arrays of ``num_nodes`` elements, one chunk of the
+    input and the largest partition.
+
+    The output is organized exactly as the output of :func:`partition_graph` with
+    ``reshuffle=True`` and ``num_hops=1`` and can be loaded with :func:`load_partition`.
+    Node IDs are reshuffled so that the nodes of a partition get contiguous IDs; an edge is
+    assigned to the partition of its destination node.
+
+    Parameters
+    ----------
+    edges : tuple of (numpy.ndarray or str, numpy.ndarray or str)
+        The source and destination node IDs of the edges. Each of them can be an array-like
+        supporting slicing (e.g., ``numpy.memmap``) or the path of a ``.npy`` file, which is
+        opened as a memory map.
+    num_nodes : int
+        The number of nodes in the graph.
+    graph_name : str
+        The name of the graph. The name will be used to construct
+        :py:meth:`~dgl.distributed.DistGraph`.
+    num_parts : int
+        The number of partitions.
+    out_path : str
+        The path to store the files for all partitioned data.
+    node_feats : dict[str, numpy.ndarray or str], optional
+        The node features, in the same formats as ``edges``.
+    edge_feats : dict[str, numpy.ndarray or str], optional
+        The edge features, in the same formats as ``edges``.
+    node_parts : numpy.ndarray or str, optional
+        The partition ID of each node. If not given, the nodes are assigned to partitions
+        randomly.
+    part_method : str, optional
+        The partition method recorded in the partition configuration when ``node_parts`` is
+        given. Only ``'random'`` is supported otherwise because Metis needs the whole graph
+        in memory.
+    chunk_size : int, optional
+        The number of edges (or node/edge feature rows) processed at a time.
+
+    Examples
+    --------
+    >>> src = np.load('src.npy', mmap_mode='r')
+    >>> dst = np.load('dst.npy', mmap_mode='r')
+    >>> dgl.distributed.partition_graph_streaming((src, dst), num_nodes, 'test', 4,
+    ...                                           'output/', node_feats={'feat': 'feat.npy'})
+    >>> g, node_feats, edge_feats, gpb, graph_name, ntypes, etypes = \\
+    ...     dgl.distributed.load_partition('output/test.json', 0)
+    '''
+    src, dst = [_as_array(arr) for arr in edges]
+    assert len(src) == len(dst), 'The source and destination arrays have different lengths.'
+    num_edges = len(src)
+    node_feats = {name: _as_array(data) for name, data in (node_feats or {}).items()}
+    edge_feats = {name: _as_array(data) for name, data in (edge_feats or {}).items()}
+    for name, data in node_feats.items():
+        assert len(data) == num_nodes, 'Node feature {} has a wrong size.'.format(name)
+    for name, data in edge_feats.items():
+        assert len(data) == num_edges, 'Edge feature {} has a wrong size.'.format(name)
+
+    start = time.time()
+    if node_parts is None:
+        if part_method != 'random':
+            raise Exception('Only random partitioning is supported without node_parts')
+        node_parts = F.asnumpy(random_choice(num_parts, num_nodes))
+    else:
+        node_parts = np.asarray(_as_array(node_parts))
+        assert len(node_parts) == num_nodes, 'node_parts has a wrong size.'
+    node_parts = node_parts.astype(np.int64)
+    assert num_nodes == 0 or (node_parts.min() >= 0 and node_parts.max() < num_parts), \
+            'node_parts contains invalid partition IDs.'
+
+    # Reshuffle the nodes so that the nodes in a partition have contiguous IDs.
+    orig_nids = np.argsort(node_parts, kind='stable')
+    new_nids = np.empty(num_nodes, dtype=np.int64)
+    new_nids[orig_nids] = np.arange(num_nodes, dtype=np.int64)
+    node_offsets = np.concatenate([[0], np.cumsum(np.bincount(node_parts, minlength=num_parts))])
+
+    # The first pass counts the edges of each partition to assign contiguous edge IDs.
+    edge_counts = np.zeros(num_parts, dtype=np.int64)
+    for chunk_start in range(0, num_edges, chunk_size):
+        chunk_dst = np.asarray(dst[chunk_start:chunk_start + chunk_size])
+        edge_counts += np.bincount(node_parts[chunk_dst], minlength=num_parts)
+    edge_offsets = np.concatenate([[0], np.cumsum(edge_counts)])
+    print('Assign nodes and edges to partitions: {:.3f} seconds'.format(time.time() - start))
+
+    # The second pass spills the in-edges (inner edges) and the out-edges to other
+    # partitions (HALO edges) of each partition to disk.
+    start = time.time()
+    part_dirs = [os.path.join(out_path, "part" + str(part_id)) for part_id in range(num_parts)]
+    for part_dir in part_dirs:
+        os.makedirs(part_dir, mode=0o775, exist_ok=True)
+    spill_fields = ['src', 'dst', 'eid', 'orig_eid']
+    def _spill_path(part_id, kind, field):
+        return os.path.join(part_dirs[part_id], '.spill_{}_{}'.format(kind, field))
+    for part_id in range(num_parts):
+        for path in os.listdir(part_dirs[part_id]):
+            if path.startswith('.spill_'):
+                os.remove(os.path.join(part_dirs[part_id], path))
+
+    next_eids = edge_offsets[:-1].copy()
+    num_cuts = 0
+    for chunk_start in range(0, num_edges, chunk_size):
+        chunk_src = np.asarray(src[chunk_start:chunk_start + chunk_size])
+        chunk_dst = np.asarray(dst[chunk_start:chunk_start + chunk_size])
+        num_chunk_edges = len(chunk_src)
+        src_parts = node_parts[chunk_src]
+        dst_parts = node_parts[chunk_dst]
+        fields = {'src': new_nids[chunk_src],
+                  'dst': new_nids[chunk_dst],
+                  'orig_eid': np.arange(chunk_start, chunk_start + num_chunk_edges,
+                                        dtype=np.int64)}
+        # Edges get new IDs in the order they appear within their partition.
+        order = np.argsort(dst_parts, kind='stable')
+        counts = np.bincount(dst_parts, minlength=num_parts)
+        count_offsets = np.concatenate([[0], np.cumsum(counts)])
+        sorted_parts = dst_parts[order]
+        fields['eid'] = np.empty(num_chunk_edges, dtype=np.int64)
+        fields['eid'][order] = next_eids[sorted_parts] \
+                + np.arange(num_chunk_edges) - count_offsets[sorted_parts]
+        next_eids += counts
+        feat_chunks = {name: np.asarray(data[chunk_start:chunk_start + chunk_size])
+                       for name, data in edge_feats.items()}
+
+        halo_idx = np.flatnonzero(src_parts != dst_parts)
+        num_cuts += len(halo_idx)
+        halo_order = halo_idx[np.argsort(src_parts[halo_idx], kind='stable')]
+        halo_offsets = np.concatenate(
+            [[0], np.cumsum(np.bincount(src_parts[halo_idx], minlength=num_parts))])
+        for part_id in range(num_parts):
+            inner = order[count_offsets[part_id]:count_offsets[part_id + 1]]
+            halo = halo_order[halo_offsets[part_id]:halo_offsets[part_id + 1]]
+            for field in spill_fields:
+                if len(inner) > 0:
+                    _append_spill(_spill_path(part_id, 'inner', field), fields[field][inner])
+                if len(halo) > 0:
+                    _append_spill(_spill_path(part_id, 'halo', field), fields[field][halo])
+            if len(inner) > 0:
+                for name, feat in feat_chunks.items():
+                    _append_spill(_spill_path(part_id, 'feat', name), feat[inner])
+    print('Split edges into partitions: {:.3f} seconds, peak memory: {:.3f} GB'.format(
+        time.time() - start, get_peak_mem()))
+
+    start = time.time()
+    part_metadata = {'graph_name': graph_name,
+                     'num_nodes': num_nodes,
+                     'num_edges': num_edges,
+                     'part_method': part_method,
+                     'num_parts': num_parts,
+                     'halo_hops': 1,
+                     'node_map': {'_N': [[int(node_offsets[i]), int(node_offsets[i + 1])]
+                                         for i in range(num_parts)]},
+                     'edge_map': {'_E': [[int(edge_offsets[i]), int(edge_offsets[i + 1])]
+                                         for i in range(num_parts)]},
+                     'ntypes': {'_N': 0},
+                     'etypes': {'_E': 0}}
+    for part_id in range(num_parts):
+        inner = {field: _read_spill(_spill_path(part_id, 'inner', field), np.int64)
+                 for field in spill_fields}
+        halo = {field: _read_spill(_spill_path(part_id, 'halo', field), np.int64)
+                for field in spill_fields}
+        # Inner edges are spilled in the order of their new IDs, HALO edges are not.
+        halo_order = np.argsort(halo['eid'], kind='stable')
+        part_edges = {field: np.concatenate([inner[field], halo[field][halo_order]])
+                      for field in spill_fields}
+        num_inner_edges = len(inner['eid'])
+        del inner, halo
+
+        # Inner nodes come first so that their local IDs are contiguous.
+        node_start, node_end = node_offsets[part_id], node_offsets[part_id + 1]
+        num_inner_nodes = node_end - node_start
+        end_nids = np.concatenate([part_edges['src'], part_edges['dst']])
+        halo_nids = np.unique(end_nids[(end_nids < node_start) | (end_nids >= node_end)])
+        del end_nids
+        def _to_local(nids):
+            is_inner = (nids >= node_start) & (nids < node_end)
+            return np.where(is_inner, nids - node_start,
+                            num_inner_nodes + np.searchsorted(halo_nids, nids))
+        part_nids = np.concatenate([np.arange(node_start, node_end, dtype=np.int64), halo_nids])
+        part = dgl_graph((F.zerocopy_from_numpy(_to_local(part_edges['src'])),
+                          F.zerocopy_from_numpy(_to_local(part_edges['dst']))),
+                         num_nodes=len(part_nids), idtype=F.int64)
+        inner_node = np.zeros(len(part_nids), dtype=np.int32)
+        inner_node[:num_inner_nodes] = 1
+        inner_edge = np.zeros(len(part_edges['eid']), dtype=np.int8)
+        inner_edge[:num_inner_edges] = 1
+        part_orig_nids = orig_nids[part_nids]
+        part.ndata[NID] = F.zerocopy_from_numpy(part_nids)
+        part.ndata['inner_node'] = F.zerocopy_from_numpy(inner_node)
+        part.ndata['orig_id'] = F.zerocopy_from_numpy(part_orig_nids)
+        part.ndata['part_id'] = F.zerocopy_from_numpy(node_parts[part_orig_nids])
+        part.edata[EID] = F.zerocopy_from_numpy(part_edges['eid'])
+        part.edata['inner_edge'] = F.zerocopy_from_numpy(inner_edge)
+        part.edata['orig_id'] = F.zerocopy_from_numpy(part_edges['orig_eid'])
+        print('part {} has {} nodes and {} are inside the partition'.format(
+            part_id, part.number_of_nodes(), num_inner_nodes))
+        print('part {} has {} edges and {} are inside the partition'.format(
+            part_id, part.number_of_edges(), num_inner_edges))
+        del part_edges
+
+        part_node_feats = {}
+        inner_orig_nids = orig_nids[node_start:node_end]
+        for name, data in node_feats.items():
+            rows = [np.asarray(data[inner_orig_nids[i:i + chunk_size]])
+                    for i in range(0, num_inner_nodes, chunk_size)]
+            rows = np.concatenate(rows) if len(rows) > 0 \
+                    else np.empty((0,) + tuple(data.shape[1:]), dtype=data.dtype)
+            part_node_feats['_N/' + name] = F.zerocopy_from_numpy(rows)
+        part_edge_feats = {}
+        for name, data in edge_feats.items():
+            part_edge_feats['_E/' + name] = F.zerocopy_from_numpy(
+                _read_spill(_spill_path(part_id, 'feat', name), data.dtype, data.shape[1:]))
+
+        part_dir = part_dirs[part_id]
+        node_feat_file = os.path.join(part_dir, "node_feat.dgl")
+        edge_feat_file = os.path.join(part_dir, "edge_feat.dgl")
+        part_graph_file = os.path.join(part_dir, "graph.dgl")
+        part_metadata['part-{}'.format(part_id)] = {
+            'node_feats': os.path.relpath(node_feat_file, out_path),
+            'edge_feats': os.path.relpath(edge_feat_file, out_path),
+            'part_graph': os.path.relpath(part_graph_file, out_path)}
+        save_tensors(node_feat_file, part_node_feats)
+        save_tensors(edge_feat_file, part_edge_feats)
+        save_graphs(part_graph_file, [part])
+        del part, part_node_feats, part_edge_feats
+        for path in os.listdir(part_dir):
+            if path.startswith('.spill_'):
+                os.remove(os.path.join(part_dir, path))
+    print('Save partitions: {:.3f} seconds, peak memory: {:.3f} GB'.format(
+        time.time() - start, get_peak_mem()))
+
+    with open('{}/{}.json'.format(out_path, graph_name), 'w') as outfile:
+        json.dump(part_metadata, outfile, sort_keys=True, indent=4)
+
+    print('There are {} edges in the graph and {} edge cuts for {} partitions.'.format(
+        num_edges, num_cuts, num_parts))
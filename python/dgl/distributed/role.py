@@ -223,5 +223,6 @@ def get_num_trainers():
     """Get the number of trainer processes"""
     return len(PER_ROLE_RANK['default'])
 
-rpc.register_service(REGISTER_ROLE, RegisterRoleRequest, RegisterRoleResponse)
+rpc.register_service(REGISTER_ROLE, RegisterRoleRequest, RegisterRoleResponse,
+                     batchable=False)
 rpc.register_service(GET_ROLE, GetRoleRequest, GetRoleResponse)
@@ -7,6 +7,7 @@ import random
 import numpy as np
 
 from .constants import SERVER_EXIT, SERVER_KEEP_ALIVE
+from .codec import encode_array, decode_array
 
 from .._ffi.object import register_object, ObjectBase
 from .._ffi.function import _init_api
@@ -19,11 +20,18 @@ __all__ = ['set_rank', 'get_rank', 'Request', 'Response', 'register_service', \
 'get_num_machines', 'set_num_machines', 'get_machine_id', 'set_machine_id', \
 'send_request', 'recv_request', 'send_response', 'recv_response', 'remote_call', \
 'send_request_to_machine', 'remote_call_to_machine', 'fast_pull', 'DistConnectError', \
-'get_num_client', 'set_num_client', 'client_barrier', 'copy_data_to_shared_memory']
+'get_num_client', 'set_num_client', 'client_barrier', 'copy_data_to_shared_memory', \
+'register_async_response', 'recv_async_response', 'set_service_codec', 'get_service_codec', \
+'send_batched_requests_to_machine', 'recv_batched_responses', 'remote_call_batched_to_machine']
 
 REQUEST_CLASS_TO_SERVICE_ID = {}
 RESPONSE_CLASS_TO_SERVICE_ID = {}
 SERVICE_ID_TO_PROPERTY = {}
+SERVICE_ID_TO_CODEC = {}
+# Services whose requests cannot be packed into a BatchedRequest.
+NON_BATCHABLE_SERVICE_IDS = set()
+# Codecs the client of the request being processed accepts for its response.
+_RESPONSE_CODECS = None
 
 DEFUALT_PORT = 30050
 
@@ -103,6 +111,8 @@ def reset():
     """Reset the rpc context
     """
     _CAPI_DGLRPCReset()
+    _ASYNC_MSG_SEQS.clear()
+    _ASYNC_RESPONSES.clear()
 
 def create_sender(max_queue_size, net_type):
     """Create rpc sender of this process.
@@ -315,7 +325,7 @@ def set_msg_seq(msg_seq):
     """
     _CAPI_DGLRPCSetMsgSeq(int(msg_seq))
 
-def register_service(service_id, req_cls, res_cls=None):
+def register_service(service_id, req_cls, res_cls=None, batchable=True):
     """Register a service to RPC.
 
     Parameter
@@ -326,11 +336,59 @@ def register_service(service_id, req_cls, res_cls=None):
         Request class.
     res_cls : class, optional
         Response class. If none, the service has no response.
+    batchable : bool, optional
+        Whether the requests of the service can be sent with
+        :func:`send_batched_requests_to_machine`. Services whose server handlers
+        return anything other than a single response or None (e.g., barriers), or
+        that change the state of the server (e.g., shutdown), must set it to False.
     """
     REQUEST_CLASS_TO_SERVICE_ID[req_cls] = service_id
     if res_cls is not None:
         RESPONSE_CLASS_TO_SERVICE_ID[res_cls] = service_id
     SERVICE_ID_TO_PROPERTY[service_id] = (req_cls, res_cls)
+    if batchable:
+        NON_BATCHABLE_SERVICE_IDS.discard(service_id)
+    else:
+        NON_BATCHABLE_SERVICE_IDS.add(service_id)
+
+def set_service_codec(service_id, id_codec=None, feat_codec=None):
+    """Compress the tensor payloads of a service sent by this process.
+
+    The codecs are applied to the requests of the service and announced in them, so
+    that the servers encode the responses with the same codecs.  Receivers decode
+    payloads automatically.
+
+    Parameter
+    ---------
+    service_id : int
+        Service ID.
+    id_codec : str, optional
+        The lossless codec for integer tensors: ``'delta_varint'`` or ``'zlib'``.
+    feat_codec : str, optional
+        The codec for floating-point tensors: ``'fp16'``, ``'bf16'``, ``'int8'``
+        (lossy), or ``'zlib'`` (lossless).
+
+    If both codecs are None, the payloads of the service are sent uncompressed.
+    """
+    if id_codec is None and feat_codec is None:
+        SERVICE_ID_TO_CODEC.pop(service_id, None)
+    else:
+        SERVICE_ID_TO_CODEC[service_id] = (id_codec, feat_codec)
+
+def get_service_codec(service_id):
+    """Get the codecs set by :func:`set_service_codec`.
+
+    Parameter
+    ---------
+    service_id : int
+        Service ID.
+
+    Returns
+    -------
+    (str, str) or None
+        The ID codec and the feature codec, or None if the service is uncompressed.
+    """
+    return SERVICE_ID_TO_CODEC.get(service_id, None)
 
 def get_service_property(service_id):
     """Get service property.
@@ -420,7 +478,7 @@ class Response:
             raise DGLError('Response class {} has not been registered as a service.'.format(cls))
         return sid
 
-def serialize_to_payload(serializable):
+def serialize_to_payload(serializable, codecs=None, accept_codecs=None):
     """Serialize an object to payloads.
 
     The object must have implemented the __getstate__ function.
@@ -429,6 +487,11 @@ def serialize_to_payload(serializable):
     ----------
     serializable : object
         Any serializable object.
+    codecs : (str, str), optional
+        The codecs for the integer and floating-point tensors.  See
+        :func:`set_service_codec`.
+    accept_codecs : (str, str), optional
+        The codecs the receiver should use to encode its response.
 
     Returns
     -------
@@ -449,8 +512,25 @@ def serialize_to_payload(serializable):
         else:
             nonarray_state.append(arr_state)
             nonarray_pos.append(i)
-    data = bytearray(pickle.dumps((nonarray_pos, nonarray_state)))
-    return data, array_state
+    if codecs is None and accept_codecs is None:
+        data = bytearray(pickle.dumps((nonarray_pos, nonarray_state)))
+        return data, array_state
+    array_headers = []
+    array_counts = []
+    tensors = []
+    for arr_state in array_state:
+        if codecs is None:
+            header, arrays = None, [arr_state]
+        else:
+            header, arrays = encode_array(F.asnumpy(arr_state), *codecs)
+            arrays = [F.zerocopy_from_numpy(arr) for arr in arrays] if header is not None \
+                else [arr_state]
+        array_headers.append(header)
+        array_counts.append(len(arrays))
+        tensors.extend(arrays)
+    data = bytearray(pickle.dumps(
+        (nonarray_pos, nonarray_state, array_headers, array_counts, accept_codecs)))
+    return data, tensors
 
 class PlaceHolder:
     """PlaceHolder object for deserialization"""
@@ -476,7 +556,31 @@ def deserialize_from_payload(cls, data, tensors):
     object
         De-serialized object of class cls.
     """
-    pos, nonarray_state = pickle.loads(data)
+    return _deserialize_from_payload(cls, data, tensors)[0]
+
+def _decode_tensors(array_headers, array_counts, tensors):
+    decoded = []
+    start = 0
+    for header, count in zip(array_headers, array_counts):
+        arrays = tensors[start:start + count]
+        start += count
+        if header is None:
+            decoded.append(arrays[0])
+        else:
+            decoded.append(F.zerocopy_from_numpy(
+                decode_array(header, [F.asnumpy(arr) for arr in arrays])))
+    return decoded
+
+def _deserialize_from_payload(cls, data, tensors):
+    """Same as :func:`deserialize_from_payload`, but also returns the codecs the
+    sender accepts for the response."""
+    header = pickle.loads(data)
+    accept_codecs = None
+    if len(header) == 2:
+        pos, nonarray_state = header
+    else:
+        pos, nonarray_state, array_headers, array_counts, accept_codecs = header
+        tensors = _decode_tensors(array_headers, array_counts, tensors)
     # Use _PLACEHOLDER to distinguish with other deserizliaed elements
     state = [_PLACEHOLDER] * (len(nonarray_state) + len(tensors))
     for i, no_state in zip(pos, nonarray_state):
@@ -494,7 +598,7 @@ def deserialize_from_payload(cls, data, tensors):
         state = tuple(state)
     obj = cls.__new__(cls)
     obj.__setstate__(state)
-    return obj
+    return obj, accept_codecs
 
 @register_object('rpc.RPCMessage')
 class RPCMessage(ObjectBase):
@@ -584,6 +688,11 @@ def send_request(target, request):
     request : Request
         The request to send.
 
+    Returns
+    -------
+    int
+        The sequence number of the message, which the response will carry.
+
     Raises
     ------
     ConnectionError if there is any problem with the connection.
@@ -592,10 +701,12 @@ def send_request(target, request):
     msg_seq = incr_msg_seq()
     client_id = get_rank()
     server_id = target
-    data, tensors = serialize_to_payload(request)
+    codecs = get_service_codec(service_id)
+    data, tensors = serialize_to_payload(request, codecs, codecs)
     msg = RPCMessage(service_id, msg_seq, client_id, server_id,
                      data, tensors, group_id=get_group_id())
     send_rpc_message(msg, server_id)
+    return msg_seq
 
 def send_request_to_machine(target, request):
     """Send one request to the target machine, which will randomly
@@ -613,6 +724,11 @@ def send_request_to_machine(target, request):
     request : Request
         The request to send.
 
+    Returns
+    -------
+    int
+        The sequence number of the message, which the response will carry.
+
     Raises
     ------
     ConnectionError if there is any problem with the connection.
@@ -622,9 +738,11 @@ def send_request_to_machine(target, request):
     client_id = get_rank()
     server_id = random.randint(target*get_num_server_per_machine(),
                                (target+1)*get_num_server_per_machine()-1)
-    data, tensors = serialize_to_payload(request)
+    codecs = get_service_codec(service_id)
+    data, tensors = serialize_to_payload(request, codecs, codecs)
     msg = RPCMessage(service_id, msg_seq, client_id, server_id, data, tensors, get_group_id())
     send_rpc_message(msg, server_id)
+    return msg_seq
 
 def send_response(target, response, group_id):
     """Send one response to the target client.
@@ -654,7 +772,7 @@ def send_response(target, response, group_id):
     msg_seq = get_msg_seq()
     client_id = target
     server_id = get_rank()
-    data, tensors = serialize_to_payload(response)
+    data, tensors = serialize_to_payload(response, _RESPONSE_CODECS)
     msg = RPCMessage(service_id, msg_seq, client_id, server_id, data, tensors, group_id)
     send_rpc_message(msg, get_client(client_id, group_id))
 
@@ -684,6 +802,7 @@ def recv_request(timeout=0):
     ------
     ConnectionError if there is any problem with the connection.
     """
+    global _RESPONSE_CODECS
     msg = recv_rpc_message(timeout)
     if msg is None:
         return None, -1, -1
@@ -692,7 +811,9 @@ def recv_request(timeout=0):
     if req_cls is None:
         raise DGLError('Got request message from service ID {}, '
                        'but no request class is registered.'.format(msg.service_id))
-    req = deserialize_from_payload(req_cls, msg.data, msg.tensors)
+    # Like the message sequence number, the codecs the client accepts are kept for
+    # the response to this request.
+    req, _RESPONSE_CODECS = _deserialize_from_payload(req_cls, msg.data, msg.tensors)
     if msg.server_id != get_rank():
         raise DGLError('Got request sent to server {}, '
                        'different from my rank {}!'.format(msg.server_id, get_rank()))
@@ -720,14 +841,10 @@ def recv_response(timeout=0):
     ------
     ConnectionError if there is any problem with the connection.
     """
-    msg = recv_rpc_message(timeout)
+    msg = _recv_non_async_rpc_message(timeout)
     if msg is None:
         return None
-    _, res_cls = SERVICE_ID_TO_PROPERTY[msg.service_id]
-    if res_cls is None:
-        raise DGLError('Got response message from service ID {}, '
-                       'but no response class is registered.'.format(msg.service_id))
-    res = deserialize_from_payload(res_cls, msg.data, msg.tensors)
+    res = _deserialize_response(msg)
     if msg.client_id != get_rank() and get_rank() != -1:
         raise DGLError('Got response of request sent by client {}, '
                        'different from my rank {}!'.format(msg.client_id, get_rank()))
@@ -773,7 +890,8 @@ def remote_call(target_and_requests, timeout=0):
         client_id = get_rank()
         server_id = random.randint(target*get_num_server_per_machine(),
                                    (target+1)*get_num_server_per_machine()-1)
-        data, tensors = serialize_to_payload(request)
+        codecs = get_service_codec(service_id)
+        data, tensors = serialize_to_payload(request, codecs, codecs)
         msg = RPCMessage(service_id, msg_seq, client_id, server_id, data, tensors, get_group_id())
         send_rpc_message(msg, server_id)
         # check if has response
@@ -783,16 +901,12 @@ def remote_call(target_and_requests, timeout=0):
             msgseq2pos[msg_seq] = pos
     while num_res != 0:
         # recv response
-        msg = recv_rpc_message(timeout)
+        msg = _recv_non_async_rpc_message(timeout)
         if msg is None:
             raise DGLError(
                 f"Timed out for receiving message within {timeout} milliseconds")
         num_res -= 1
-        _, res_cls = SERVICE_ID_TO_PROPERTY[msg.service_id]
-        if res_cls is None:
-            raise DGLError('Got response message from service ID {}, '
-                           'but no response class is registered.'.format(msg.service_id))
-        res = deserialize_from_payload(res_cls, msg.data, msg.tensors)
+        res = _deserialize_response(msg)
         if msg.client_id != myrank:
             raise DGLError('Got reponse of request sent by client {}, '
                            'different from my rank {}!'.format(msg.client_id, myrank))
@@ -826,7 +940,8 @@ def send_requests_to_machine(target_and_requests):
 
         server_id = random.randint(target*get_num_server_per_machine(),
                                    (target+1)*get_num_server_per_machine()-1)
-        data, tensors = serialize_to_payload(request)
+        codecs = get_service_codec(service_id)
+        data, tensors = serialize_to_payload(request, codecs, codecs)
         msg = RPCMessage(service_id, msg_seq, client_id, server_id, data, tensors, get_group_id())
         send_rpc_message(msg, server_id)
         # check if has response
@@ -863,16 +978,12 @@ def recv_responses(msgseq2pos, timeout=0):
     num_res = len(msgseq2pos)
     while num_res != 0:
         # recv response
-        msg = recv_rpc_message(timeout)
+        msg = _recv_non_async_rpc_message(timeout)
         if msg is None:
             raise DGLError(
                 f"Timed out for receiving message within {timeout} milliseconds")
         num_res -= 1
-        _, res_cls = SERVICE_ID_TO_PROPERTY[msg.service_id]
-        if res_cls is None:
-            raise DGLError('Got response message from service ID {}, '
-                           'but no response class is registered.'.format(msg.service_id))
-        res = deserialize_from_payload(res_cls, msg.data, msg.tensors)
+        res = _deserialize_response(msg)
         if msg.client_id != myrank:
             raise DGLError('Got reponse of request sent by client {}, '
                            'different from my rank {}!'.format(msg.client_id, myrank))
@@ -910,6 +1021,119 @@ def remote_call_to_machine(target_and_requests, timeout=0):
     msgseq2pos = send_requests_to_machine(target_and_requests)
     return recv_responses(msgseq2pos, timeout)
 
+def send_batched_requests_to_machine(target_and_requests):
+    """Send requests to the remote machines, packing all the requests bound for
+    the same machine into one message.
+
+    The requests may belong to different services (e.g., neighbor sampling, degree
+    lookups and KVStore pulls).  The server processes the requests of a message in
+    order.  Requests of the services registered with ``batchable=False`` (e.g.,
+    barriers and shutdown) cannot be batched.
+
+    This operation isn't block. It returns immediately once it sends all requests.
+
+    Parameters
+    ----------
+    target_and_requests : list[(int, Request)]
+        A list of requests and the machine they should be sent to.
+
+    Returns
+    -------
+    msgseq2pos : dict
+        map the message sequence number to the positions in the input list of the
+        requests it carries.
+    num_requests : int
+        The number of requests.
+
+    Raises
+    ------
+    DGLError
+        If any request belongs to a service that cannot be batched. Nothing is sent
+        in this case.
+    """
+    target2pos = {}
+    for pos, (target, request) in enumerate(target_and_requests):
+        if request.service_id in NON_BATCHABLE_SERVICE_IDS:
+            raise DGLError('Request of service {} cannot be batched.'.format(
+                request.service_id))
+        target2pos.setdefault(target, []).append(pos)
+    msgseq2pos = {}
+    for target, positions in target2pos.items():
+        requests = [target_and_requests[pos][1] for pos in positions]
+        if len(requests) == 1:
+            request = requests[0]
+            if get_service_property(request.service_id)[1] is None:
+                positions = None
+        else:
+            request = BatchedRequest(requests)
+        msg_seq = send_request_to_machine(target, request)
+        if positions is not None:
+            msgseq2pos[msg_seq] = positions
+    return msgseq2pos, len(target_and_requests)
+
+def recv_batched_responses(msgseq2pos, num_requests, timeout=0):
+    """Receive the responses of the requests sent by
+    :func:`send_batched_requests_to_machine`.
+
+    It returns the responses in the same order as the requests.
+
+    Parameters
+    ----------
+    msgseq2pos : dict
+        map the message sequence number to the positions of its requests.
+    num_requests : int
+        The number of requests sent.
+    timeout : int, optional
+        The timeout value in milliseconds. If zero, wait indefinitely.
+
+    Returns
+    -------
+    list[Response]
+        Responses for each target-request pair. If the request does not have
+        response, None is placed.
+    """
+    myrank = get_rank()
+    all_res = [None] * num_requests
+    num_res = len(msgseq2pos)
+    while num_res != 0:
+        msg = _recv_non_async_rpc_message(timeout)
+        if msg is None:
+            raise DGLError(
+                f"Timed out for receiving message within {timeout} milliseconds")
+        num_res -= 1
+        res = _deserialize_response(msg)
+        if msg.client_id != myrank:
+            raise DGLError('Got reponse of request sent by client {}, '
+                           'different from my rank {}!'.format(msg.client_id, myrank))
+        responses = res.responses if isinstance(res, BatchedResponse) else [res]
+        for pos, response in zip(msgseq2pos[msg.msg_seq], responses):
+            all_res[pos] = response
+    return all_res
+
+def remote_call_batched_to_machine(target_and_requests, timeout=0):
+    """Invoke registered services on remote machines with one message per machine
+    and collect responses.
+
+    Same as :func:`remote_call_to_machine` except that the requests bound for the
+    same machine are packed into one message.  See
+    :func:`send_batched_requests_to_machine`.
+
+    Parameters
+    ----------
+    target_and_requests : list[(int, Request)]
+        A list of requests and the machine they should be sent to.
+    timeout : int, optional
+        The timeout value in milliseconds. If zero, wait indefinitely.
+
+    Returns
+    -------
+    list[Response]
+        Responses for each target-request pair. If the request does not have
+        response, None is placed.
+    """
+    msgseq2pos, num_requests = send_batched_requests_to_machine(target_and_requests)
+    return recv_batched_responses(msgseq2pos, num_requests, timeout)
+
 def send_rpc_message(msg, target):
     """Send one message to the target server.
 
@@ -960,6 +1184,73 @@ def recv_rpc_message(timeout=0):
     status = _CAPI_DGLRPCRecvRPCMessage(timeout, msg)
     return msg if status == 0 else None
 
+# Sequence numbers of the requests whose responses are awaited by futures (e.g.
+# KVClient.pull_async).  The receiving functions above put those responses aside
+# in _ASYNC_RESPONSES instead of returning them to the wrong caller.
+_ASYNC_MSG_SEQS = set()
+_ASYNC_RESPONSES = {}
+
+def _deserialize_response(msg):
+    _, res_cls = SERVICE_ID_TO_PROPERTY[msg.service_id]
+    if res_cls is None:
+        raise DGLError('Got response message from service ID {}, '
+                       'but no response class is registered.'.format(msg.service_id))
+    return deserialize_from_payload(res_cls, msg.data, msg.tensors)
+
+def _recv_non_async_rpc_message(timeout=0):
+    """Receive one message that is not the response of an asynchronous request."""
+    while True:
+        msg = recv_rpc_message(timeout)
+        if msg is None or msg.msg_seq not in _ASYNC_MSG_SEQS:
+            return msg
+        _ASYNC_RESPONSES[msg.msg_seq] = _deserialize_response(msg)
+
+def register_async_response(msg_seq):
+    """Mark the response of the request with the given sequence number as awaited
+    by :func:`recv_async_response`, so that other receiving functions skip it.
+
+    Parameters
+    ----------
+    msg_seq : int
+        The sequence number returned by :func:`send_request` or
+        :func:`send_request_to_machine`.
+    """
+    _ASYNC_MSG_SEQS.add(msg_seq)
+
+def recv_async_response(msg_seq, timeout=0):
+    """Receive the response of the asynchronous request with the given sequence number.
+
+    Responses of other asynchronous requests received in the meantime are kept
+    until they are asked for.
+
+    Parameters
+    ----------
+    msg_seq : int
+        The sequence number registered with :func:`register_async_response`.
+    timeout : int, optional
+        The timeout value in milliseconds. If zero, wait indefinitely.
+
+    Returns
+    -------
+    Response
+        The response.
+    """
+    while msg_seq not in _ASYNC_RESPONSES:
+        msg = recv_rpc_message(timeout)
+        if msg is None:
+            raise DGLError(
+                f"Timed out for receiving message within {timeout} milliseconds")
+        if msg.msg_seq not in _ASYNC_MSG_SEQS:
+            raise DGLError('Got response of message {} while waiting for asynchronous '
+                           'responses.'.format(msg.msg_seq))
+        _ASYNC_RESPONSES[msg.msg_seq] = _deserialize_response(msg)
+    _ASYNC_MSG_SEQS.discard(msg_seq)
+    return _ASYNC_RESPONSES.pop(msg_seq)
+
+def num_pending_async_responses():
+    """Return the number of registered asynchronous responses not yet received."""
+    return len(_ASYNC_MSG_SEQS)
+
 def client_barrier():
     """Barrier all client processes"""
     req = ClientBarrierRequest()
@@ -1191,6 +1482,105 @@ class ClientBarrierRequest(Request):
             return res_list
         return None
 
+BATCHED_REQUEST = 22455
+
+def _pack_payloads(objs, codecs_list):
+    """Serialize objects into a list of data buffers, the number of tensors of
+    each object and the concatenated tensors."""
+    datas, counts, tensors = [], [], []
+    for obj, codecs in zip(objs, codecs_list):
+        data, obj_tensors = serialize_to_payload(obj, codecs, codecs)
+        datas.append(bytes(data))
+        counts.append(len(obj_tensors))
+        tensors.extend(obj_tensors)
+    return datas, counts, tensors
+
+def _unpack_payloads(datas, counts, tensors):
+    """Split the concatenated tensors of :func:`_pack_payloads` per object."""
+    start = 0
+    for data, count in zip(datas, counts):
+        yield bytearray(data), list(tensors[start:start + count])
+        start += count
+
+class BatchedResponse(Response):
+    """The responses of the requests in a :class:`BatchedRequest`.
+
+    Parameters
+    ----------
+    responses : list[Response or None]
+        The responses in the order of the requests.
+    codecs_list : list[(str, str) or None], optional
+        The codecs to encode each response with.
+    """
+    def __init__(self, responses, codecs_list=None):
+        self.responses = responses
+        self.codecs_list = codecs_list or [None] * len(responses)
+
+    def __getstate__(self):
+        service_ids = [None if res is None else res.service_id for res in self.responses]
+        sent = [res for res in self.responses if res is not None]
+        codecs_list = [codecs for res, codecs in zip(self.responses, self.codecs_list)
+                       if res is not None]
+        datas, counts, tensors = _pack_payloads(sent, codecs_list)
+        return (service_ids, datas, counts) + tuple(tensors)
+
+    def __setstate__(self, state):
+        service_ids, datas, counts = state[:3]
+        payloads = _unpack_payloads(datas, counts, state[3:])
+        self.responses = []
+        for service_id in service_ids:
+            if service_id is None:
+                self.responses.append(None)
+            else:
+                data, tensors = next(payloads)
+                res_cls = get_service_property(service_id)[1]
+                self.responses.append(deserialize_from_payload(res_cls, data, tensors))
+        self.codecs_list = [None] * len(self.responses)
+
+class BatchedRequest(Request):
+    """Envelope carrying several requests, possibly of different services, to one
+    server in a single message.
+
+    The server processes the requests in order and replies with one
+    :class:`BatchedResponse`.  Each request is encoded with the codecs of its own
+    service.
+
+    Parameters
+    ----------
+    requests : list[Request]
+        The requests.
+    """
+    def __init__(self, requests):
+        self.requests = requests
+        self._accept_codecs = [None] * len(requests)
+
+    def __getstate__(self):
+        service_ids = [req.service_id for req in self.requests]
+        datas, counts, tensors = _pack_payloads(
+            self.requests, [get_service_codec(sid) for sid in service_ids])
+        return (service_ids, datas, counts) + tuple(tensors)
+
+    def __setstate__(self, state):
+        service_ids, datas, counts = state[:3]
+        self.requests = []
+        self._accept_codecs = []
+        for service_id, (data, tensors) in zip(
+                service_ids, _unpack_payloads(datas, counts, state[3:])):
+            req_cls = get_service_property(service_id)[0]
+            req, accept_codecs = _deserialize_from_payload(req_cls, data, tensors)
+            self.requests.append(req)
+            self._accept_codecs.append(accept_codecs)
+
+    def process_request(self, server_state):
+        responses = []
+        for req in self.requests:
+            res = req.process_request(server_state)
+            # Guaranteed by the batchable check of send_batched_requests_to_machine.
+            assert res is None or isinstance(res, Response), \
+                'Request of service {} cannot be batched.'.format(req.service_id)
+            responses.append(res)
+        return BatchedResponse(responses, self._accept_codecs)
+
 def set_group_id(group_id):
     """Set current group ID
 
@@ -134,16 +134,23 @@ def connect_to_server(ip_config, num_servers, max_queue_size=MAX_QUEUE_SIZE,
     # Register some basic service
     rpc.register_service(rpc.CLIENT_REGISTER,
                          rpc.ClientRegisterRequest,
-                         rpc.ClientRegisterResponse)
+                         rpc.ClientRegisterResponse,
+                         batchable=False)
     rpc.register_service(rpc.SHUT_DOWN_SERVER,
                          rpc.ShutDownRequest,
-                         None)
+                         None,
+                         batchable=False)
     rpc.register_service(rpc.GET_NUM_CLIENT,
                          rpc.GetNumberClientsRequest,
                          rpc.GetNumberClientsResponse)
     rpc.register_service(rpc.CLIENT_BARRIER,
                          rpc.ClientBarrierRequest,
-                         rpc.ClientBarrierResponse)
+                         rpc.ClientBarrierResponse,
+                         batchable=False)
+    rpc.register_service(rpc.BATCHED_REQUEST,
+                         rpc.BatchedRequest,
+                         rpc.BatchedResponse,
+                         batchable=False)
     rpc.register_sig_handler()
     server_namebook = rpc.read_ip_config(ip_config, num_servers)
     num_servers = len(server_namebook)
@@ -231,7 +238,8 @@ def shutdown_servers(ip_config, num_servers):
     """
     rpc.register_service(rpc.SHUT_DOWN_SERVER,
                          rpc.ShutDownRequest,
-                         None)
+                         None,
+                         batchable=False)
     rpc.register_sig_handler()
     server_namebook = rpc.read_ip_config(ip_config, num_servers)
     num_servers = len(server_namebook)
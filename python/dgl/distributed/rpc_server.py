@@ -51,16 +51,23 @@ def start_server(server_id, ip_config, num_servers, num_clients, server_state, \
     # Register some basic services
     rpc.register_service(rpc.CLIENT_REGISTER,
                          rpc.ClientRegisterRequest,
-                         rpc.ClientRegisterResponse)
+                         rpc.ClientRegisterResponse,
+                         batchable=False)
     rpc.register_service(rpc.SHUT_DOWN_SERVER,
                          rpc.ShutDownRequest,
-                         None)
+                         None,
+                         batchable=False)
     rpc.register_service(rpc.GET_NUM_CLIENT,
                          rpc.GetNumberClientsRequest,
                          rpc.GetNumberClientsResponse)
     rpc.register_service(rpc.CLIENT_BARRIER,
                          rpc.ClientBarrierRequest,
-                         rpc.ClientBarrierResponse)
+                         rpc.ClientBarrierResponse,
+                         batchable=False)
+    rpc.register_service(rpc.BATCHED_REQUEST,
+                         rpc.BatchedRequest,
+                         rpc.BatchedResponse,
+                         batchable=False)
     rpc.set_rank(server_id)
     server_namebook = rpc.read_ip_config(ip_config, num_servers)
     machine_id = server_namebook[server_id][0]
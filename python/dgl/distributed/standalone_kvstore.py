@@ -5,6 +5,19 @@ This kvstore is used when running in the standalone mode
 
 from .. import backend as F
 
+class _CompletedPull(object):
+    '''A pull future whose data is already available.'''
+    def __init__(self, data):
+        self._data = data
+
+    def done(self):
+        '''Whether the data has arrived.'''
+        return True
+
+    def wait(self):
+        '''Return the data.'''
+        return self._data
+
 class KVClient(object):
     ''' The fake KVStore client.
 
@@ -85,6 +98,29 @@ class KVClient(object):
         else:
             return F.gather_row(self._data[name], id_tensor)
 
+    def pull_async(self, name, id_tensor):
+        '''pull data from kvstore, returning a future'''
+        return _CompletedPull(self.pull(name, id_tensor))
+
+    def set_pull_window(self, window):
+        '''set the coalescing window of pull_async'''
+
+    def flush_pulls(self):
+        '''send the queued pulls'''
+
+    def enable_cache(self, name, cache_size, max_staleness=None):
+        '''all data is local in standalone mode, so nothing is cached'''
+
+    def disable_cache(self, name):
+        '''drop the cache of the data'''
+
+    def invalidate_cache(self, name=None):
+        '''remove the cached rows of the data'''
+
+    def cache_stats(self, name):
+        '''get the cache statistics of the data'''
+        return None
+
     def map_shared_data(self, partition_book):
         '''Mapping shared-memory tensor from server to client.'''
 
@@ -154,6 +154,11 @@ class DGLHeteroGraph(object):
                        for i, frame in enumerate(edge_frames)]
         self._edge_frames = edge_frames
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop('_relation_cache', None)
+        return state
+
     def __setstate__(self, state):
         # Compatibility check
         # TODO: version the storage
@@ -653,6 +658,7 @@ class DGLHeteroGraph(object):
         self._graph = sub_g._graph
         self._node_frames = sub_g._node_frames
         self._edge_frames = sub_g._edge_frames
+        self._relation_cache = None
 
     def remove_nodes(self, nids, ntype=None, store_ids=False):
         r"""Remove multiple nodes with the specified node type
@@ -784,6 +790,7 @@ class DGLHeteroGraph(object):
         self._graph = sub_g._graph
         self._node_frames = sub_g._node_frames
         self._edge_frames = sub_g._edge_frames
+        self._relation_cache = None
 
         # If the graph is batched, update batch_num_edges
         if batched:
@@ -817,6 +824,52 @@ class DGLHeteroGraph(object):
         """
         self._batch_num_nodes = None
         self._batch_num_edges = None
+        self._relation_cache = None
+
+    def _get_relation_cache(self):
+        """Return the cache of the relation slices created by :meth:`__getitem__`.
+
+        The cache belongs to the graph index, so a shallow copy of this graph shares it
+        until the structure of either graph changes.
+        """
+        cache = self.__dict__.get('_relation_cache', None)
+        if cache is None or cache.gidx is not self._graph:
+            cache = _RelationCache(self._graph)
+            self._relation_cache = cache
+        return cache
+
+    def relation_cache_info(self):
+        """Return the statistics of the cache of relation slices.
+
+        Slicing the graph with ``g[srctype, etype, dsttype]`` caches the graph structure
+        of the slice, so that slicing the same relations again does not construct it
+        again.  The cache is cleared whenever the graph structure changes.
+
+        Returns
+        -------
+        dict[str, int]
+            The statistics with the following keys.
+
+            * ``hits``: the number of slices served from the cache.
+            * ``misses``: the number of slices constructed.
+            * ``size``: the number of cached slices.
+
+        Examples
+        --------
+        >>> g = dgl.heterograph({
+        ...     ('user', 'follows', 'user'): ([0, 1], [1, 2]),
+        ...     ('user', 'plays', 'game'): ([0, 1], [0, 1])})
+        >>> for _ in range(3):
+        ...     sg = g['plays']
+        >>> g.relation_cache_info()
+        {'hits': 2, 'misses': 1, 'size': 1}
+        >>> g.add_edges(0, 1, etype='plays')
+        >>> g.relation_cache_info()
+        {'hits': 0, 'misses': 0, 'size': 0}
+        """
+        cache = self._get_relation_cache()
+        return {'hits': cache.hits, 'misses': cache.misses,
+                'size': len(cache.slices) + len(cache.flats)}
 
 
     #################################################################
@@ -2185,6 +2238,9 @@ class DGLHeteroGraph(object):
         This function returns a new graph.  Changing the content of this graph does not reflect
         onto the original graph.
 
+        The graph structure of the slice is cached, so slicing the same relations again
+        only creates a new graph object around it.  See :meth:`relation_cache_info`.
+
         If the graph combines multiple node types or edge types together, it will have the
         mapping of node/edge types and IDs from the new graph to the original graph.
         The mappings have the name ``dgl.NTYPE``, ``dgl.NID``, ``dgl.ETYPE`` and ``dgl.EID``,
@@ -2234,31 +2290,57 @@ class DGLHeteroGraph(object):
         if len(key) != 3:
             raise DGLError(err_msg)
 
-        etypes = self._find_etypes(key)
-
-        if len(etypes) == 0:
-            raise DGLError('Invalid key "{}". Must be one of the edge types.'.format(orig_key))
+        cache = self._get_relation_cache()
+        # Slices are unhashable.
+        cacheable = not any(isinstance(k, slice) for k in key)
+        etypes = cache.etypes.get(key, None) if cacheable else None
+        if etypes is None:
+            etypes = self._find_etypes(key)
+            if len(etypes) == 0:
+                raise DGLError('Invalid key "{}". Must be one of the edge types.'.format(
+                    orig_key))
+            if cacheable:
+                cache.etypes[key] = etypes
 
         if len(etypes) == 1:
             # no ambiguity: return the unitgraph itself
-            srctype, etype, dsttype = self._canonical_etypes[etypes[0]]
-            stid = self.get_ntype_id_from_src(srctype)
-            etid = self.get_etype_id((srctype, etype, dsttype))
-            dtid = self.get_ntype_id_from_dst(dsttype)
-            new_g = self._graph.get_relation_graph(etid)
+            etid = etypes[0]
+            entry = cache.slices.get(etid, None)
+            if entry is None:
+                cache.misses += 1
+                srctype, etype, dsttype = self._canonical_etypes[etid]
+                stid = self.get_ntype_id_from_src(srctype)
+                dtid = self.get_ntype_id_from_dst(dsttype)
+                new_g = self._graph.get_relation_graph(etid)
+
+                if stid == dtid:
+                    new_ntypes = [srctype]
+                else:
+                    new_ntypes = ([srctype], [dsttype])
+                new_etypes = [etype]
+                proto = self.__class__(new_g, new_ntypes, new_etypes, None, None)
+                # The frames are attached to every returned copy instead, so that the
+                # cache does not keep the frames of a local scope alive.
+                proto._node_frames = proto._edge_frames = None
+                entry = cache.slices[etid] = (proto, stid, dtid)
+            else:
+                cache.hits += 1
 
+            proto, stid, dtid = entry
+            new_g = copy.copy(proto)
             if stid == dtid:
-                new_ntypes = [srctype]
-                new_nframes = [self._node_frames[stid]]
+                new_g._node_frames = [self._node_frames[stid]]
             else:
-                new_ntypes = ([srctype], [dsttype])
-                new_nframes = [self._node_frames[stid], self._node_frames[dtid]]
-            new_etypes = [etype]
-            new_eframes = [self._edge_frames[etid]]
-
-            return self.__class__(new_g, new_ntypes, new_etypes, new_nframes, new_eframes)
+                new_g._node_frames = [self._node_frames[stid], self._node_frames[dtid]]
+            new_g._edge_frames = [self._edge_frames[etid]]
+            return new_g
         else:
-            flat = self._graph.flatten_relations(etypes)
+            flat = cache.flats.get(tuple(etypes), None)
+            if flat is None:
+                cache.misses += 1
+                flat = cache.flats[tuple(etypes)] = self._graph.flatten_relations(etypes)
+            else:
+                cache.hits += 1
             new_g = flat.graph
 
             # merge frames
@@ -5550,6 +5632,7 @@ class DGLHeteroGraph(object):
         if F.device_type(self.device) != 'cpu':
             raise DGLError("The graph structure must be on CPU to be pinned.")
         self._graph.pin_memory_()
+        self._relation_cache = None
         for frame in itertools.chain(self._node_frames, self._edge_frames):
             for col in frame._columns.values():
                 col.pin_memory_()
@@ -5570,6 +5653,7 @@ class DGLHeteroGraph(object):
         if not self._graph.is_pinned():
             return self
         self._graph.unpin_memory_()
+        self._relation_cache = None
         for frame in itertools.chain(self._node_frames, self._edge_frames):
             for col in frame._columns.values():
                 col.unpin_memory_()
@@ -6368,6 +6452,33 @@ def combine_names(names, ids=None):
         selected = sorted([names[i] for i in ids])
         return '+'.join(selected)
 
+class _RelationCache(object):
+    """Relation slices of a graph index created by :meth:`DGLHeteroGraph.__getitem__`.
+
+    Attributes
+    ----------
+    gidx : HeteroGraphIndex
+        The graph index the slices are created from.
+    etypes : dict[tuple, list[int]]
+        The edge type IDs matched by every key without wildcards.
+    slices : dict[int, tuple]
+        The prototype slice without frames, the source node type ID and the destination
+        node type ID of every single-relation slice.
+    flats : dict[tuple[int], FlattenedHeteroGraph]
+        The flattened graph index of every multi-relation slice.
+    hits : int
+        The number of slices served from the cache.
+    misses : int
+        The number of slices constructed.
+    """
+    def __init__(self, gidx):
+        self.gidx = gidx
+        self.etypes = {}
+        self.slices = {}
+        self.flats = {}
+        self.hits = 0
+        self.misses = 0
+
 class DGLBlock(DGLHeteroGraph):
     """Subclass that signifies the graph is a block created from
     :func:`dgl.to_block`.
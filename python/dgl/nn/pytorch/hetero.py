@@ -2,7 +2,13 @@
 from functools import partial
 import torch as th
 import torch.nn as nn
+from ... import function as fn
 from ...base import DGLError
+from ...convert import create_block
+from ...ops import segment_mm
+from ..functional import edge_softmax
+from .conv import GraphConv, SAGEConv, GATConv
+from .utils import Identity
 
 __all__ = ['HeteroGraphConv', 'HeteroLinear', 'HeteroEmbedding']
 
@@ -115,14 +121,43 @@ class HeteroGraphConv(nn.Module):
                 stacked = torch.stack(tensors, dim=0)
                 return torch.sum(stacked, dim=0)
 
+    fused : bool, optional
+        If True, the relations whose sub-modules are :class:`~dgl.nn.pytorch.GraphConv`,
+        :class:`~dgl.nn.pytorch.SAGEConv` or :class:`~dgl.nn.pytorch.GATConv` are
+        computed together instead of one by one, producing the same outputs up to
+        floating point rounding.  Only effective when :attr:`aggregate` is ``'sum'`` or
+        ``'mean'``.  See the notes below.  Default: False.
+
     Attributes
     ----------
     mods : dict[str, nn.Module]
         Modules associated with every edge types.
+
+    Notes
+    -----
+    In fused mode, the relations are grouped by the type of their sub-modules.  Each
+    group is merged into one bipartite graph, where every relation has its own copy of
+    the source and destination nodes, so that the per-relation weights are applied with
+    :func:`~dgl.ops.segment_mm` and the messages of all the relations are passed in one
+    call.  This avoids constructing a relation graph and invoking a sub-module for every
+    relation, which dominates the running time on graphs with many relation types.
+
+    A relation is only fused if its sub-module is one of the following and is called
+    without extra arguments, and all the sub-modules of the group have the same
+    feature sizes and options:
+
+    * :class:`~dgl.nn.pytorch.GraphConv` with its own weight and no activation.
+    * :class:`~dgl.nn.pytorch.SAGEConv` with the ``'mean'`` aggregator, no activation,
+      no normalization and no active feature dropout.
+    * :class:`~dgl.nn.pytorch.GATConv` with no activation and no active feature or
+      attention dropout.
+
+    The other relations are computed one by one as usual.
     """
-    def __init__(self, mods, aggregate='sum'):
+    def __init__(self, mods, aggregate='sum', fused=False):
         super(HeteroGraphConv, self).__init__()
         self.mods = nn.ModuleDict(mods)
+        self.fused = fused
         # Do not break if graph has 0-in-degree nodes.
         # Because there is no general rule to add self-loop for heterograph.
         for _, v in self.mods.items():
@@ -131,8 +166,10 @@ class HeteroGraphConv(nn.Module):
                 set_allow_zero_in_degree_fn(True)
         if isinstance(aggregate, str):
             self.agg_fn = get_aggregate_fn(aggregate)
+            self._agg_name = aggregate
         else:
             self.agg_fn = aggregate
+            self._agg_name = None
 
     def forward(self, g, inputs, mod_args=None, mod_kwargs=None):
         """Forward computation
@@ -166,34 +203,247 @@ class HeteroGraphConv(nn.Module):
             else:
                 src_inputs = inputs
                 dst_inputs = {k: v[:g.number_of_dst_nodes(k)] for k, v in inputs.items()}
-
-            for stype, etype, dtype in g.canonical_etypes:
-                rel_graph = g[stype, etype, dtype]
-                if stype not in src_inputs or dtype not in dst_inputs:
-                    continue
-                dstdata = self.mods[etype](
-                    rel_graph,
-                    (src_inputs[stype], dst_inputs[dtype]),
-                    *mod_args.get(etype, ()),
-                    **mod_kwargs.get(etype, {}))
-                outputs[dtype].append(dstdata)
+            rels = [(stype, etype, dtype) for stype, etype, dtype in g.canonical_etypes
+                    if stype in src_inputs and dtype in dst_inputs]
         else:
-            for stype, etype, dtype in g.canonical_etypes:
-                rel_graph = g[stype, etype, dtype]
-                if stype not in inputs:
-                    continue
-                dstdata = self.mods[etype](
-                    rel_graph,
-                    (inputs[stype], inputs[dtype]),
-                    *mod_args.get(etype, ()),
-                    **mod_kwargs.get(etype, {}))
-                outputs[dtype].append(dstdata)
+            src_inputs = dst_inputs = inputs
+            rels = [(stype, etype, dtype) for stype, etype, dtype in g.canonical_etypes
+                    if stype in inputs]
+
+        # Number of relations summed in every output tensor.
+        counts = {nty : [] for nty in g.dsttypes}
+        if self.fused and self._agg_name in ('sum', 'mean'):
+            rels = self._forward_fused(
+                g, rels, src_inputs, dst_inputs, mod_args, mod_kwargs, outputs, counts)
+
+        for stype, etype, dtype in rels:
+            rel_graph = g[stype, etype, dtype]
+            dstdata = self.mods[etype](
+                rel_graph,
+                (src_inputs[stype], dst_inputs[dtype]),
+                *mod_args.get(etype, ()),
+                **mod_kwargs.get(etype, {}))
+            outputs[dtype].append(dstdata)
+            counts[dtype].append(1)
         rsts = {}
         for nty, alist in outputs.items():
-            if len(alist) != 0:
+            if len(alist) == 0:
+                continue
+            if len(alist) == sum(counts[nty]):
                 rsts[nty] = self.agg_fn(alist, nty)
+            else:
+                # Some of the tensors are already sums of several relations.
+                rsts[nty] = th.stack(alist, dim=0).sum(dim=0)
+                if self._agg_name == 'mean':
+                    rsts[nty] = rsts[nty] / sum(counts[nty])
         return rsts
 
+    def _forward_fused(self, g, rels, src_inputs, dst_inputs, mod_args, mod_kwargs,
+                       outputs, counts):
+        """Compute the fusable relations in groups, appending the results to
+        ``outputs`` and ``counts``, and return the remaining relations."""
+        groups = {}
+        remaining = []
+        for rel in rels:
+            stype, etype, dtype = rel
+            mod = self.mods[etype]
+            fused_fn = _FUSED_CONV_FNS.get(type(mod), None)
+            if (fused_fn is None or etype in mod_args or etype in mod_kwargs or
+                    dtype not in dst_inputs or src_inputs[stype].dim() != 2 or
+                    dst_inputs[dtype].dim() != 2):
+                remaining.append(rel)
+                continue
+            # Only the relations with identical configurations can share the kernels.
+            key = (type(mod), _fused_config(mod), src_inputs[stype].shape[1],
+                   dst_inputs[dtype].shape[1])
+            groups.setdefault(key, []).append(rel)
+
+        for key, group in groups.items():
+            mods = [self.mods[etype] for _, etype, _ in group]
+            if key[1] is None or len(group) == 1:
+                # Not fusable, or nothing to gain.
+                remaining.extend(group)
+                continue
+            fg = _FusedRelationGraph(g, group)
+            rst = _FUSED_CONV_FNS[key[0]](
+                mods, fg, fg.concat_src(src_inputs), fg.concat_dst(dst_inputs))
+            for nty, (nty_rst, nty_count) in fg.split_outputs(rst).items():
+                outputs[nty].append(nty_rst)
+                counts[nty].append(nty_count)
+        # Keep the original order of the relations computed one by one.
+        remaining = set(remaining)
+        return [rel for rel in rels if rel in remaining]
+
+class _FusedRelationGraph(object):
+    """The relations of a graph merged into one bipartite graph, in which every relation
+    has its own copy (called slots) of the source nodes of its source type and of the
+    destination nodes of its destination type.  The slots of every relation are
+    contiguous, so that the per-relation weights can be applied with
+    :func:`~dgl.ops.segment_mm`.
+    """
+    def __init__(self, g, rels):
+        self.rels = rels
+        num_src = [g.number_of_src_nodes(stype) for stype, _, _ in rels]
+        num_dst = [g.number_of_dst_nodes(dtype) for _, _, dtype in rels]
+        src, dst = [], []
+        src_offset = dst_offset = 0
+        for rel, rel_num_src, rel_num_dst in zip(rels, num_src, num_dst):
+            rel_src, rel_dst = g.edges(etype=rel)
+            src.append(rel_src + src_offset)
+            dst.append(rel_dst + dst_offset)
+            src_offset += rel_num_src
+            dst_offset += rel_num_dst
+        self.graph = create_block(
+            (th.cat(src), th.cat(dst)), num_src_nodes=src_offset, num_dst_nodes=dst_offset,
+            idtype=g.idtype, device=g.device)
+        self.src_seglen = th.tensor(num_src, dtype=th.int64)
+        self.dst_seglen = th.tensor(num_dst, dtype=th.int64)
+        rel_ids = th.arange(len(rels), device=g.device)
+        # The relation of every slot.
+        self.src_rel = th.repeat_interleave(rel_ids, self.src_seglen.to(g.device))
+        self.dst_rel = th.repeat_interleave(rel_ids, self.dst_seglen.to(g.device))
+
+        # The slots of the relations with the same destination type are summed into the
+        # same output rows.
+        self.dsttypes = [nty for nty in g.dsttypes if any(d == nty for _, _, d in rels)]
+        type_offset = {}
+        self.num_dst_per_type = []
+        for nty in self.dsttypes:
+            type_offset[nty] = sum(self.num_dst_per_type)
+            self.num_dst_per_type.append(g.number_of_dst_nodes(nty))
+        self.dst_index = th.cat([
+            th.arange(n, device=g.device) + type_offset[dtype]
+            for (_, _, dtype), n in zip(rels, num_dst)])
+
+    def concat_src(self, src_inputs):
+        """Concatenate the source features of the slots."""
+        return th.cat([src_inputs[stype] for stype, _, _ in self.rels])
+
+    def concat_dst(self, dst_inputs):
+        """Concatenate the destination features of the slots."""
+        return th.cat([dst_inputs[dtype] for _, _, dtype in self.rels])
+
+    def split_outputs(self, rst):
+        """Sum the outputs of the destination slots by node type.
+
+        Returns a dictionary mapping every destination node type to its output and the
+        number of relations summed in it."""
+        out = rst.new_zeros((sum(self.num_dst_per_type),) + rst.shape[1:])
+        out.index_add_(0, self.dst_index, rst)
+        out = th.split(out, self.num_dst_per_type)
+        return {nty: (nty_out, sum(d == nty for _, _, d in self.rels))
+                for nty, nty_out in zip(self.dsttypes, out)}
+
+def _stack_bias(mods, fg):
+    """Return the bias of the relation of every destination slot."""
+    return th.stack([mod.bias for mod in mods])[fg.dst_rel]
+
+def _fused_config(mod):
+    """Return the options that the sub-modules fused together must share, or None if the
+    sub-module cannot be fused."""
+    if isinstance(mod, GraphConv):
+        if mod.weight is None or mod._activation is not None:
+            return None
+        return (mod._in_feats, mod._out_feats, mod._norm, mod.bias is not None)
+    elif isinstance(mod, SAGEConv):
+        mod._compatibility_check()
+        if (mod._aggre_type != 'mean' or mod.activation is not None or mod.norm is not None
+                or (mod.training and mod.feat_drop.p > 0)):
+            return None
+        return (mod._in_src_feats, mod._in_dst_feats, mod._out_feats, mod.bias is not None)
+    elif isinstance(mod, GATConv):
+        if (mod.activation is not None or
+                (mod.training and (mod.feat_drop.p > 0 or mod.attn_drop.p > 0))):
+            return None
+        return (mod._in_src_feats, mod._in_dst_feats, mod._out_feats, mod._num_heads,
+                mod.leaky_relu.negative_slope, type(mod.res_fc), mod.bias is not None)
+    return None
+
+def _fused_graph_conv(mods, fg, feat_src, feat_dst): # pylint: disable=unused-argument
+    """GraphConv on all the relations of a _FusedRelationGraph."""
+    mod = mods[0]
+    graph = fg.graph
+    weight = th.stack([m.weight for m in mods])
+    with graph.local_scope():
+        if mod._norm in ['left', 'both']:
+            degs = graph.out_degrees().float().clamp(min=1)
+            norm = th.pow(degs, -0.5) if mod._norm == 'both' else 1.0 / degs
+            feat_src = feat_src * norm.unsqueeze(-1)
+        if mod._in_feats > mod._out_feats:
+            # mult W first to reduce the feature size for aggregation.
+            graph.srcdata['h'] = segment_mm(feat_src, weight, fg.src_seglen)
+            graph.update_all(fn.copy_src('h', 'm'), fn.sum(msg='m', out='h'))
+            rst = graph.dstdata['h']
+        else:
+            graph.srcdata['h'] = feat_src
+            graph.update_all(fn.copy_src('h', 'm'), fn.sum(msg='m', out='h'))
+            rst = segment_mm(graph.dstdata['h'], weight, fg.dst_seglen)
+        if mod._norm in ['right', 'both']:
+            degs = graph.in_degrees().float().clamp(min=1)
+            norm = th.pow(degs, -0.5) if mod._norm == 'both' else 1.0 / degs
+            rst = rst * norm.unsqueeze(-1)
+    if mod.bias is not None:
+        rst = rst + _stack_bias(mods, fg)
+    return rst
+
+def _fused_sage_conv(mods, fg, feat_src, feat_dst):
+    """SAGEConv with the mean aggregator on all the relations of a _FusedRelationGraph."""
+    mod = mods[0]
+    graph = fg.graph
+    w_neigh = th.stack([m.fc_neigh.weight.t() for m in mods])
+    with graph.local_scope():
+        if mod._in_src_feats > mod._out_feats:
+            graph.srcdata['h'] = segment_mm(feat_src, w_neigh, fg.src_seglen)
+            graph.update_all(fn.copy_src('h', 'm'), fn.mean('m', 'neigh'))
+            h_neigh = graph.dstdata['neigh']
+        else:
+            graph.srcdata['h'] = feat_src
+            graph.update_all(fn.copy_src('h', 'm'), fn.mean('m', 'neigh'))
+            h_neigh = segment_mm(graph.dstdata['neigh'], w_neigh, fg.dst_seglen)
+    w_self = th.stack([m.fc_self.weight.t() for m in mods])
+    rst = segment_mm(feat_dst, w_self, fg.dst_seglen) + h_neigh
+    if mod.bias is not None:
+        rst = rst + _stack_bias(mods, fg)
+    return rst
+
+def _fused_gat_conv(mods, fg, feat_src, feat_dst):
+    """GATConv on all the relations of a _FusedRelationGraph."""
+    mod = mods[0]
+    graph = fg.graph
+    num_heads, out_feats = mod._num_heads, mod._out_feats
+    w_src = th.stack([getattr(m, 'fc_src', getattr(m, 'fc', None)).weight.t() for m in mods])
+    w_dst = th.stack([getattr(m, 'fc_dst', getattr(m, 'fc', None)).weight.t() for m in mods])
+    h_src = segment_mm(feat_src, w_src, fg.src_seglen).view(-1, num_heads, out_feats)
+    h_dst = segment_mm(feat_dst, w_dst, fg.dst_seglen).view(-1, num_heads, out_feats)
+    attn_l = th.cat([m.attn_l for m in mods])[fg.src_rel]
+    attn_r = th.cat([m.attn_r for m in mods])[fg.dst_rel]
+    el = (h_src * attn_l).sum(dim=-1).unsqueeze(-1)
+    er = (h_dst * attn_r).sum(dim=-1).unsqueeze(-1)
+    with graph.local_scope():
+        graph.srcdata.update({'ft': h_src, 'el': el})
+        graph.dstdata.update({'er': er})
+        graph.apply_edges(fn.u_add_v('el', 'er', 'e'))
+        e = mod.leaky_relu(graph.edata.pop('e'))
+        # The slots of every relation are separate nodes, so the softmax is computed
+        # over the incoming edges of each relation as in GATConv.
+        graph.edata['a'] = edge_softmax(graph, e)
+        graph.update_all(fn.u_mul_e('ft', 'a', 'm'), fn.sum('m', 'ft'))
+        rst = graph.dstdata['ft']
+    if isinstance(mod.res_fc, Identity):
+        rst = rst + feat_dst.view(-1, num_heads, out_feats)
+    elif mod.res_fc is not None:
+        w_res = th.stack([m.res_fc.weight.t() for m in mods])
+        rst = rst + segment_mm(feat_dst, w_res, fg.dst_seglen).view(-1, num_heads, out_feats)
+    if mod.bias is not None:
+        rst = rst + _stack_bias(mods, fg).view(-1, num_heads, out_feats)
+    return rst
+
+_FUSED_CONV_FNS = {
+    GraphConv: _fused_graph_conv,
+    SAGEConv: _fused_sage_conv,
+    GATConv: _fused_gat_conv,
+}
+
 def _max_reduce_func(inputs, dim):
     return th.max(inputs, dim=dim)[0]
 
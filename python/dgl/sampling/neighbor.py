@@ -3,7 +3,7 @@
 from .._ffi.function import _init_api
 from .. import backend as F
 from ..base import DGLError, EID
-from ..heterograph import DGLHeteroGraph
+from ..heterograph import DGLHeteroGraph, DGLBlock
 from .. import ndarray as nd
 from .. import utils
 from .utils import EidExcluder
@@ -11,6 +11,7 @@ from .utils import EidExcluder
 __all__ = [
     'sample_etype_neighbors',
     'sample_neighbors',
+    'sample_neighbor_blocks',
     'sample_neighbors_biased',
     'select_topk']
 
@@ -302,9 +303,8 @@ def sample_neighbors(g, nodes, fanout, edge_dir='in', prob=None, replace=False,
             frontier = eid_excluder(frontier)
     return frontier if output_device is None else frontier.to(output_device)
 
-def _sample_neighbors(g, nodes, fanout, edge_dir='in', prob=None, replace=False,
-                      copy_ndata=True, copy_edata=True, _dist_training=False,
-                      exclude_edges=None):
+def _prepare_nodes(g, nodes):
+    """Return the node IDs of every node type as DGL NDArrays and their device."""
     if not isinstance(nodes, dict):
         if len(g.ntypes) > 1:
             raise DGLError("Must specify node type when the graph is not homogeneous.")
@@ -323,34 +323,40 @@ def _sample_neighbors(g, nodes, fanout, edge_dir='in', prob=None, replace=False,
             nodes_all_types.append(F.to_dgl_nd(nodes[ntype]))
         else:
             nodes_all_types.append(nd.array([], ctx=ctx))
+    return nodes_all_types, device
 
+def _prepare_fanout(g, fanout):
+    """Return the fanout of every edge type as a DGL NDArray."""
     if isinstance(fanout, nd.NDArray):
-        fanout_array = fanout
+        return fanout
+    if not isinstance(fanout, dict):
+        fanout_array = [int(fanout)] * len(g.etypes)
     else:
-        if not isinstance(fanout, dict):
-            fanout_array = [int(fanout)] * len(g.etypes)
-        else:
-            if len(fanout) != len(g.etypes):
-                raise DGLError('Fan-out must be specified for each edge type '
-                               'if a dict is provided.')
-            fanout_array = [None] * len(g.etypes)
-            for etype, value in fanout.items():
-                fanout_array[g.get_etype_id(etype)] = value
-        fanout_array = F.to_dgl_nd(F.tensor(fanout_array, dtype=F.int64))
+        if len(fanout) != len(g.etypes):
+            raise DGLError('Fan-out must be specified for each edge type '
+                           'if a dict is provided.')
+        fanout_array = [None] * len(g.etypes)
+        for etype, value in fanout.items():
+            fanout_array[g.get_etype_id(etype)] = value
+    return F.to_dgl_nd(F.tensor(fanout_array, dtype=F.int64))
 
+def _prepare_prob(g, prob):
+    """Return the edge probability array of every edge type."""
     if isinstance(prob, list) and len(prob) > 0 and \
             isinstance(prob[0], nd.NDArray):
-        prob_arrays = prob
-    elif prob is None:
-        prob_arrays = [nd.array([], ctx=nd.cpu())] * len(g.etypes)
-    else:
-        prob_arrays = []
-        for etype in g.canonical_etypes:
-            if prob in g.edges[etype].data:
-                prob_arrays.append(F.to_dgl_nd(g.edges[etype].data[prob]))
-            else:
-                prob_arrays.append(nd.array([], ctx=nd.cpu()))
+        return prob
+    if prob is None:
+        return [nd.array([], ctx=nd.cpu())] * len(g.etypes)
+    prob_arrays = []
+    for etype in g.canonical_etypes:
+        if prob in g.edges[etype].data:
+            prob_arrays.append(F.to_dgl_nd(g.edges[etype].data[prob]))
+        else:
+            prob_arrays.append(nd.array([], ctx=nd.cpu()))
+    return prob_arrays
 
+def _prepare_exclude_edges(g, exclude_edges, ctx):
+    """Return the edge IDs to exclude of every edge type."""
     excluded_edges_all_t = []
     if exclude_edges is not None:
         if not isinstance(exclude_edges, dict):
@@ -363,6 +369,16 @@ def _sample_neighbors(g, nodes, fanout, edge_dir='in', prob=None, replace=False,
                 excluded_edges_all_t.append(F.to_dgl_nd(exclude_edges[etype]))
             else:
                 excluded_edges_all_t.append(nd.array([], ctx=ctx))
+    return excluded_edges_all_t
+
+def _sample_neighbors(g, nodes, fanout, edge_dir='in', prob=None, replace=False,
+                      copy_ndata=True, copy_edata=True, _dist_training=False,
+                      exclude_edges=None):
+    nodes_all_types, device = _prepare_nodes(g, nodes)
+    fanout_array = _prepare_fanout(g, fanout)
+    prob_arrays = _prepare_prob(g, prob)
+    excluded_edges_all_t = _prepare_exclude_edges(
+        g, exclude_edges, utils.to_dgl_context(device))
 
     subgidx = _CAPI_DGLSampleNeighbors(g._graph, nodes_all_types, fanout_array,
                                        edge_dir, prob_arrays, excluded_edges_all_t, replace)
@@ -390,6 +406,88 @@ def _sample_neighbors(g, nodes, fanout, edge_dir='in', prob=None, replace=False,
 
 DGLHeteroGraph.sample_neighbors = utils.alias_func(sample_neighbors)
 
+def sample_neighbor_blocks(g, seed_nodes, fanouts, prob=None, replace=False,
+                           exclude_edges=None, output_device=None):
+    """Sample the inbound neighbors of multiple layers and return the message flow
+    graphs (MFGs) of all the layers at once.
+
+    This is equivalent to calling :func:`sample_neighbors` and :func:`dgl.to_block`
+    once per layer, from the last layer to the first one, with the source nodes of
+    each MFG being the seed nodes of the previous layer.  All the layers are sampled
+    and relabeled in a single native call, which shares the relabeling hash tables
+    between the layers and does not create the intermediate frontier graphs.
+
+    Parameters
+    ----------
+    g : DGLGraph
+        The graph.  Must be on CPU and not pinned.
+    seed_nodes : tensor or dict
+        Node IDs of the output nodes of the last layer.
+
+        This argument can take a single ID tensor or a dictionary of node types and
+        ID tensors.  If a single tensor is given, the graph must only have one type
+        of nodes.
+    fanouts : list[int] or list[dict[etype, int]]
+        The fanout of each layer, with the i-th element being the fanout of the i-th
+        layer.  See the :attr:`fanout` argument of :func:`sample_neighbors`.
+    prob : str, optional
+        Feature name used as the (unnormalized) probabilities associated with each
+        neighboring edge of a node.  See :func:`sample_neighbors`.
+    replace : bool, optional
+        If True, sample with replacement.
+    exclude_edges : tensor or dict, optional
+        Edge IDs to exclude during sampling in every layer.
+    output_device : Framework-specific device context object, optional
+        The output device.  Default is the same as the input graph.
+
+    Returns
+    -------
+    list[DGLBlock]
+        The MFGs from the first layer to the last.  The source and destination node IDs
+        are stored in ``srcdata[dgl.NID]`` and ``dstdata[dgl.NID]``, and the original
+        edge IDs in ``edata[dgl.EID]``.
+
+    Examples
+    --------
+    >>> g = dgl.graph(([1, 2, 3], [0, 1, 2]))
+    >>> blocks = dgl.sampling.sample_neighbor_blocks(g, torch.tensor([0]), [-1, -1])
+    >>> blocks[1].dstdata[dgl.NID]
+    tensor([0])
+    >>> blocks[1].srcdata[dgl.NID]
+    tensor([0, 1])
+    >>> blocks[0].srcdata[dgl.NID]
+    tensor([0, 1, 2])
+    >>> blocks[0].edata[dgl.EID]
+    tensor([0, 1])
+    """
+    if F.device_type(g.device) != 'cpu' or g.is_pinned():
+        raise DGLError('sample_neighbor_blocks only supports graphs on CPU.')
+    nodes_all_types, device = _prepare_nodes(g, seed_nodes)
+    if F.device_type(device) != 'cpu':
+        raise DGLError('The seed nodes must be on CPU.')
+    ret = _CAPI_DGLSampleNeighborBlocks(
+        g._graph, nodes_all_types, [_prepare_fanout(g, fanout) for fanout in fanouts],
+        _prepare_prob(g, prob), _prepare_exclude_edges(g, exclude_edges, nd.cpu()),
+        replace)
+
+    # Since the destination nodes come first among the source nodes in every layer,
+    # the node IDs of every layer are a prefix of the input nodes of the first layer.
+    input_nodes = [F.from_dgl_nd(nodes) for nodes in ret[0]]
+    blocks = []
+    for i in range(len(fanouts)):
+        block = DGLBlock(ret[2 * i + 1], (g.ntypes, g.ntypes), g.etypes)
+        src_nodes = [F.narrow_row(nodes, 0, block.num_src_nodes(ntype))
+                     for nodes, ntype in zip(input_nodes, g.ntypes)]
+        dst_nodes = [F.narrow_row(nodes, 0, block.num_dst_nodes(ntype))
+                     for nodes, ntype in zip(input_nodes, g.ntypes)]
+        edge_ids = [F.from_dgl_nd(eid) for eid in ret[2 * i + 2]]
+        utils.set_new_frames(
+            block,
+            node_frames=utils.extract_node_subframes_for_block(g, src_nodes, dst_nodes),
+            edge_frames=utils.extract_edge_subframes(g, edge_ids))
+        blocks.append(block if output_device is None else block.to(output_device))
+    return blocks
+
 def sample_neighbors_biased(g, nodes, fanout, bias, edge_dir='in',
                             tag_offset_name='_TAG_OFFSET', replace=False,
                             copy_ndata=True, copy_edata=True, output_device=None):
@@ -22,6 +22,25 @@ def _select_pinsage_neighbors(src, dst, num_samples_per_node, k):
     counts = F.from_dgl_nd(counts)
     return (src, dst, counts)
 
+def _pinsage_neighbors(g, seed_nodes, metapath, restart_prob, num_random_walks,
+                       metapath_hops, k):
+    """Determine the neighbors for PinSAGE algorithm by performing the random walks
+    from the given seed nodes.
+
+    This is fusing ``random_walk()`` with stepwise restart and
+    ``_select_pinsage_neighbors()`` together, without materializing the traces.
+    Only CPU graphs are supported.
+    """
+    seed_nodes = F.to_dgl_nd(seed_nodes)
+    metapath = F.to_dgl_nd(metapath)
+    restart_prob = F.to_dgl_nd(restart_prob)
+    src, dst, counts = _CAPI_DGLSamplingPinSageNeighbors(
+        g._graph, seed_nodes, metapath, restart_prob, num_random_walks, metapath_hops, k)
+    src = F.from_dgl_nd(src)
+    dst = F.from_dgl_nd(dst)
+    counts = F.from_dgl_nd(counts)
+    return (src, dst, counts)
+
 class RandomWalkNeighborSampler(object):
     """PinSage-like neighbor sampler extended to any heterogeneous graphs.
 
@@ -65,6 +84,12 @@ class RandomWalkNeighborSampler(object):
         The name of the edge feature to be stored on the returned graph with the number of
         visits.
 
+    Notes
+    -----
+    When the graph and the given nodes are on CPU, the random walks and the counting of
+    the visited nodes run in parallel in a single native operator, without materializing
+    the random walk traces.
+
     Examples
     --------
     See examples in :any:`PinSAGESampler`.
@@ -94,6 +119,8 @@ class RandomWalkNeighborSampler(object):
         restart_prob[self.metapath_hops::self.metapath_hops] = termination_prob
         restart_prob = F.tensor(restart_prob, dtype=F.float32)
         self.restart_prob = F.copy_to(restart_prob, G.device)
+        self._full_metapath_ids = F.astype(
+            F.tensor([G.get_etype_id(etype) for etype in self.full_metapath]), G.idtype)
 
     # pylint: disable=no-member
     def __call__(self, seed_nodes):
@@ -115,14 +142,20 @@ class RandomWalkNeighborSampler(object):
         seed_nodes = utils.prepare_tensor(self.G, seed_nodes, 'seed_nodes')
         self.restart_prob = F.copy_to(self.restart_prob, F.context(seed_nodes))
 
-        seed_nodes = F.repeat(seed_nodes, self.num_random_walks, 0)
-        paths, _ = random_walk(
-            self.G, seed_nodes, metapath=self.full_metapath, restart_prob=self.restart_prob)
-        src = F.reshape(paths[:, self.metapath_hops::self.metapath_hops], (-1,))
-        dst = F.repeat(paths[:, 0], self.num_traversals, 0)
-
-        src, dst, counts = _select_pinsage_neighbors(
-            src, dst, (self.num_random_walks * self.num_traversals), self.num_neighbors)
+        if F.device_type(F.context(seed_nodes)) == 'cpu' and not self.G.is_pinned():
+            # Walk and count the visits natively without materializing the traces.
+            src, dst, counts = _pinsage_neighbors(
+                self.G, seed_nodes, self._full_metapath_ids, self.restart_prob,
+                self.num_random_walks, self.metapath_hops, self.num_neighbors)
+        else:
+            seed_nodes = F.repeat(seed_nodes, self.num_random_walks, 0)
+            paths, _ = random_walk(
+                self.G, seed_nodes, metapath=self.full_metapath, restart_prob=self.restart_prob)
+            src = F.reshape(paths[:, self.metapath_hops::self.metapath_hops], (-1,))
+            dst = F.repeat(paths[:, 0], self.num_traversals, 0)
+
+            src, dst, counts = _select_pinsage_neighbors(
+                src, dst, (self.num_random_walks * self.num_traversals), self.num_neighbors)
         neighbor_graph = convert.heterograph(
             {(self.ntype, '_E', self.ntype): (src, dst)},
             {self.ntype: self.G.number_of_nodes(self.ntype)}
@@ -6,5 +6,7 @@ from .numpy import *
 # Defines the name TensorStorage
 if F.get_preferred_backend() == 'pytorch':
     from .pytorch_tensor import PyTorchTensorStorage as TensorStorage
+    from .cache import *
+    from .staging import *
 else:
     from .tensor import BaseTensorStorage as TensorStorage
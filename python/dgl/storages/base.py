@@ -1,6 +1,10 @@
 """Base classes and functionalities for feature storages."""
 
+from concurrent.futures import ThreadPoolExecutor
+import os
 import threading
+import time
+import weakref
 
 
 STORAGE_WRAPPERS = {}
@@ -25,38 +29,201 @@ def wrap_storage(storage):
         .format(type(storage)))
     return storage
 
-class _FuncWrapper(object):
-    def __init__(self, func):
-        self.func = func
-
-    def __call__(self, buf, *args):
-        buf[0] = self.func(*args)
+# Maximum number of fetches executed concurrently by the shared fetch executor.
+DEFAULT_FETCH_THREADS = int(os.environ.get(
+    'DGL_FETCH_THREADS', str(min(32, (os.cpu_count() or 1) + 4))))
+
+_EXECUTOR = None
+_EXECUTOR_LOCK = threading.Lock()
+_num_fetch_threads = DEFAULT_FETCH_THREADS
+
+def _get_executor():
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = ThreadPoolExecutor(
+                max_workers=_num_fetch_threads, thread_name_prefix='dgl-fetch')
+        return _EXECUTOR
+
+def _reset_executor_in_child():
+    # A forked child (e.g. a DataLoader worker) inherits the executor but not its
+    # threads, so anything submitted to it would never run.
+    global _EXECUTOR, _EXECUTOR_LOCK
+    _EXECUTOR = None
+    _EXECUTOR_LOCK = threading.Lock()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_executor_in_child)
+
+def set_num_fetch_threads(num_threads):
+    """Set the maximum number of feature fetches that run concurrently in the
+    thread pool shared by all :class:`FeatureStorage` objects.
+
+    Fetches that are already submitted keep running on the old pool.
+
+    Parameters
+    ----------
+    num_threads : int
+        The number of threads.
+    """
+    global _EXECUTOR, _num_fetch_threads
+    with _EXECUTOR_LOCK:
+        _num_fetch_threads = num_threads
+        old_executor, _EXECUTOR = _EXECUTOR, None
+    if old_executor is not None:
+        old_executor.shutdown(wait=False)
+
+def get_num_fetch_threads():
+    """Get the maximum number of feature fetches that run concurrently."""
+    return _num_fetch_threads
+
+class FetchStats(object):
+    """Latency statistics of the asynchronous fetches issued by a feature storage.
+
+    Attributes
+    ----------
+    count : int
+        The number of finished fetches.
+    queue_time : float
+        The total seconds the fetches waited for a free thread.
+    run_time : float
+        The total seconds the fetches were running.
+    max_run_time : float
+        The longest running time in seconds of a single fetch.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Reset all the counters."""
+        self.count = 0
+        self.queue_time = 0.
+        self.run_time = 0.
+        self.max_run_time = 0.
+
+    def record(self, queue_time, run_time):
+        """Record a finished fetch."""
+        with self._lock:
+            self.count += 1
+            self.queue_time += queue_time
+            self.run_time += run_time
+            self.max_run_time = max(self.max_run_time, run_time)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def as_dict(self):
+        """Return the statistics as a dictionary, including the mean latencies."""
+        count = max(self.count, 1)
+        return {'count': self.count,
+                'mean_queue_time': self.queue_time / count,
+                'mean_run_time': self.run_time / count,
+                'max_run_time': self.max_run_time}
+
+class FetchGroup(object):
+    """A group of outstanding fetches that can be cancelled together, e.g. when a
+    DataLoader iterator shuts down.
+
+    The :class:`ThreadedFuture` objects created inside a ``with`` block of the group
+    in the same thread are added to the group.
+    """
+    _local = threading.local()
+
+    def __init__(self):
+        self._futures = weakref.WeakSet()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def current(cls):
+        """Return the innermost active group of the calling thread, or None."""
+        stack = getattr(cls._local, 'stack', None)
+        return stack[-1] if stack else None
+
+    def add(self, future):
+        """Add a future into the group."""
+        with self._lock:
+            self._futures.add(future)
+
+    def cancel(self):
+        """Cancel all the fetches in the group that have not started yet."""
+        with self._lock:
+            futures = list(self._futures)
+        for future in futures:
+            future.cancel()
+
+    def __enter__(self):
+        if not hasattr(self._local, 'stack'):
+            self._local.stack = []
+        self._local.stack.append(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._local.stack.pop()
+
+def _timed_call(func, args, stats, submit_time):
+    start_time = time.perf_counter()
+    try:
+        return func(*args)
+    finally:
+        if stats is not None:
+            stats.record(start_time - submit_time, time.perf_counter() - start_time)
 
 class ThreadedFuture(object):
-    """Wraps a function into a future asynchronously executed by a Python
-    ``threading.Thread`.  The function is being executed upon instantiation of
-    this object.
+    """Wraps a function into a future asynchronously executed by a thread pool shared
+    by all feature storages (see :func:`set_num_fetch_threads`).  The function is
+    submitted upon instantiation of this object.
+
+    Parameters
+    ----------
+    target : callable
+        The function to execute.
+    args : iterable
+        The arguments of :attr:`target`.
+    stats : FetchStats, optional
+        If given, records the latency of the execution.
     """
-    def __init__(self, target, args):
-        self.buf = [None]
-
-        thread = threading.Thread(
-            target=_FuncWrapper(target),
-            args=[self.buf] + list(args),
-            daemon=True)
-        thread.start()
-        self.thread = thread
+    def __init__(self, target, args, stats=None):
+        self._future = _get_executor().submit(
+            _timed_call, target, list(args), stats, time.perf_counter())
+        group = FetchGroup.current()
+        if group is not None:
+            group.add(self)
 
     def wait(self):
-        """Blocks the current thread until the result becomes available and returns it."""
-        self.thread.join()
-        return self.buf[0]
+        """Blocks the current thread until the result becomes available and returns it.
+
+        Raises ``concurrent.futures.CancelledError`` if the fetch has been cancelled.
+        """
+        return self._future.result()
+
+    def cancel(self):
+        """Cancel the fetch if it has not started.  Returns whether it is cancelled."""
+        return self._future.cancel()
+
+    def done(self):
+        """Whether the fetch has finished or has been cancelled."""
+        return self._future.done()
 
 class FeatureStorage(object):
     """Feature storage object which should support a fetch() operation.  It is the
     counterpart of a tensor for homogeneous graphs, or a dict of tensor for heterogeneous
     graphs where the keys are node/edge types.
     """
+    @property
+    def fetch_stats(self):
+        """The :class:`FetchStats` of the asynchronous fetches of this storage."""
+        stats = getattr(self, '_fetch_stats', None)
+        if stats is None:
+            stats = self._fetch_stats = FetchStats()
+        return stats
+
     def requires_ddp(self):
         """Whether the FeatureStorage requires the DataLoader to set use_ddp.
         """
@@ -0,0 +1,182 @@
+"""Size-bounded feature caches in front of feature storages."""
+import threading
+
+import torch
+from .base import FeatureStorage, wrap_storage
+from .staging import empty_host_tensor
+from .._ffi.base import DGLError
+
+__all__ = ['CachedFeatureStorage']
+
+CACHE_POLICIES = ('lru', 'lfu', 'static')
+# The number of fetches after which the LFU access counts are halved.
+LFU_AGING_PERIOD = 64
+
+def _wait_if_future(x):
+    return x.wait() if hasattr(x, 'wait') else x
+
+class CachedFeatureStorage(FeatureStorage):
+    """FeatureStorage that keeps a bounded number of feature rows of another
+    storage in a contiguous buffer, serving cache hits from the buffer and
+    only fetching the misses from the wrapped storage.
+
+    The cache assumes that the wrapped features are read-only while the cache
+    is in use.
+
+    Parameters
+    ----------
+    storage : FeatureStorage or Tensor
+        The storage to cache.  Anything accepted by :func:`wrap_storage` works.
+    num_rows : int
+        The number of rows (i.e. nodes or edges) in :attr:`storage`.
+    cache_size : int
+        The maximum number of rows held in the cache.
+    policy : str, optional
+        The replacement policy.  Can be one of
+
+        * ``'lru'``: evicts the least recently used rows.
+        * ``'lfu'``: evicts the least frequently used rows.  Newly inserted rows start
+          with a count of one, and all the counts are halved every
+          ``LFU_AGING_PERIOD`` fetches so that rows no longer requested are
+          eventually evicted.
+        * ``'static'``: only holds the rows in :attr:`preload_ids`; never evicts.
+
+        Default: ``'lru'``.
+    preload_ids : Tensor, optional
+        The row IDs to load into the cache on the first fetch.  Required by the
+        ``'static'`` policy (e.g. the IDs of the highest-degree nodes), optional
+        otherwise.  Only the first :attr:`cache_size` IDs are loaded.
+
+    Attributes
+    ----------
+    hits : int
+        The number of requested rows served from the cache.
+    misses : int
+        The number of requested rows fetched from the wrapped storage.
+    """
+    def __init__(self, storage, num_rows, cache_size, policy='lru', preload_ids=None):
+        if policy not in CACHE_POLICIES:
+            raise DGLError('Unknown cache policy {}.  Expect one of {}.'.format(
+                policy, CACHE_POLICIES))
+        if policy == 'static' and preload_ids is None:
+            raise DGLError('The static cache policy requires preload_ids.')
+        self.storage = wrap_storage(storage)
+        self.num_rows = num_rows
+        self.cache_size = max(0, min(cache_size, num_rows))
+        self.policy = policy
+        self.hits = 0
+        self.misses = 0
+
+        self._preload_ids = preload_ids
+        # Cache slot -> row ID, -1 if the slot is free.
+        self._id_of = torch.full((self.cache_size,), -1, dtype=torch.int64)
+        # The row IDs in _id_of sorted, and the slot of each, for looking up rows with
+        # binary search.  The index takes O(cache_size) rather than O(num_rows) memory.
+        self._sorted_ids = self._id_of.clone()
+        self._sorted_slots = torch.arange(self.cache_size)
+        # Replacement score of each slot: the last access time for LRU and the access
+        # count for LFU.  Free slots have score -1 so that they are filled first.
+        self._score = torch.full((self.cache_size,), -1, dtype=torch.int64)
+        self._clock = 0
+        # The cache buffer is allocated on the first fetch once the feature shape and
+        # data type are known.
+        self._buffer = None
+        self._lock = threading.Lock()
+
+    @property
+    def hit_rate(self):
+        """The fraction of requested rows served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total > 0 else 0.
+
+    def stats(self):
+        """Return the cache counters as a dictionary."""
+        return {'hits': self.hits, 'misses': self.misses, 'hit_rate': self.hit_rate,
+                'cached_rows': int((self._id_of >= 0).sum())}
+
+    def reset_stats(self):
+        """Reset the hit and miss counters."""
+        self.hits = 0
+        self.misses = 0
+
+    def _ensure_buffer(self, feats):
+        if self._buffer is None:
+            self._buffer = torch.empty(
+                self.cache_size, *feats.shape[1:], dtype=feats.dtype)
+
+    def _preload(self):
+        ids = torch.as_tensor(self._preload_ids, dtype=torch.int64)[:self.cache_size]
+        ids = torch.unique(ids)
+        self._preload_ids = None
+        if ids.shape[0] == 0:
+            return
+        feats = _wait_if_future(self.storage.fetch(ids, torch.device('cpu')))
+        self._ensure_buffer(feats)
+        self._insert(ids, feats)
+
+    def _lookup(self, ids):
+        """Return the cache slot of each row ID in ``ids``, or -1 if not cached."""
+        if self.cache_size == 0:
+            return torch.full_like(ids, -1, dtype=torch.int64)
+        pos = torch.searchsorted(self._sorted_ids, ids).clamp_(max=self.cache_size - 1)
+        found = self._sorted_ids[pos] == ids
+        return torch.where(found, self._sorted_slots[pos], torch.full_like(pos, -1))
+
+    def _insert(self, ids, feats):
+        """Insert the unique row IDs ``ids`` with features ``feats``, evicting the rows
+        with the lowest scores."""
+        num_insert = min(ids.shape[0], self.cache_size)
+        if num_insert == 0:
+            return
+        ids = ids[:num_insert]
+        feats = feats[:num_insert]
+        slots = torch.topk(self._score, num_insert, largest=False).indices
+        self._id_of[slots] = ids
+        self._sorted_ids, self._sorted_slots = torch.sort(self._id_of)
+        self._buffer[slots] = feats.to(self._buffer.dtype)
+        self._score[slots] = self._clock if self.policy == 'lru' else 1
+
+    def fetch(self, indices, device, pin_memory=False, **kwargs):
+        indices = torch.as_tensor(indices).cpu()
+        with self._lock:
+            if self._preload_ids is not None:
+                self._preload()
+            self._clock += 1
+            if self.policy == 'lfu' and self._clock % LFU_AGING_PERIOD == 0:
+                # Free slots keep their score of -1.
+                self._score.div_(2, rounding_mode='floor')
+
+            slots = self._lookup(indices.to(torch.int64))
+            hit_mask = slots >= 0
+            hit_pos = torch.nonzero(hit_mask, as_tuple=True)[0]
+            miss_pos = torch.nonzero(~hit_mask, as_tuple=True)[0]
+            hit_slots = slots[hit_pos]
+
+            miss_ids, miss_inverse = torch.unique(indices[miss_pos], return_inverse=True)
+            miss_feats = None
+            if miss_ids.shape[0] > 0:
+                miss_feats = _wait_if_future(self.storage.fetch(miss_ids, torch.device('cpu')))
+                self._ensure_buffer(miss_feats)
+            if self._buffer is None:
+                # Nothing cached and nothing requested.
+                return _wait_if_future(self.storage.fetch(indices, device, pin_memory, **kwargs))
+
+            result, pin_memory = empty_host_tensor(
+                (indices.shape[0], *self._buffer.shape[1:]), self._buffer.dtype, device,
+                pin_memory)
+            if hit_pos.shape[0] > 0:
+                result[hit_pos] = self._buffer[hit_slots]
+                if self.policy == 'lru':
+                    self._score[hit_slots] = self._clock
+                elif self.policy == 'lfu':
+                    self._score.index_add_(0, hit_slots, torch.ones_like(hit_slots))
+            if miss_feats is not None:
+                result[miss_pos] = miss_feats[miss_inverse]
+                if self.policy != 'static':
+                    self._insert(miss_ids, miss_feats)
+
+            self.hits += hit_pos.shape[0]
+            self.misses += miss_pos.shape[0]
+
+        kwargs['non_blocking'] = pin_memory
+        return result.to(device, **kwargs)
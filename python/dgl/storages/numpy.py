@@ -1,20 +1,147 @@
 """Feature storage for ``numpy.memmap`` object."""
+from concurrent.futures import ThreadPoolExecutor
+import mmap
+import os
+import threading
+
 import numpy as np
 from .base import FeatureStorage, ThreadedFuture, register_storage_wrapper
 from .. import backend as F
 
+try:
+    import torch
+    from .staging import StagingBuffer
+except ImportError:
+    StagingBuffer = None
+
+# Number of threads used to gather rows from a numpy.memmap in parallel.  Setting it
+# to 1 disables parallel gathering.
+DEFAULT_GATHER_THREADS = int(os.environ.get(
+    'DGL_NUMPY_STORAGE_THREADS', str(min(8, os.cpu_count() or 1))))
+# Fetches with fewer indices than this are gathered with a single fancy-index.
+MIN_PARALLEL_ROWS = 1024
+
+# Kept separate from the shared fetch executor in base.py since the fetches running
+# there wait for the chunks submitted here.
+_GATHER_POOL = None
+_GATHER_POOL_SIZE = 0
+_GATHER_POOL_LOCK = threading.Lock()
+
+def _get_gather_pool(num_threads):
+    """Return the process-wide thread pool for gathering rows, creating or growing it
+    if necessary."""
+    global _GATHER_POOL, _GATHER_POOL_SIZE
+    with _GATHER_POOL_LOCK:
+        if _GATHER_POOL is None or _GATHER_POOL_SIZE < num_threads:
+            old_pool = _GATHER_POOL
+            _GATHER_POOL = ThreadPoolExecutor(
+                max_workers=num_threads, thread_name_prefix='dgl-numpy-gather')
+            _GATHER_POOL_SIZE = num_threads
+            if old_pool is not None:
+                old_pool.shutdown(wait=False)
+        return _GATHER_POOL
+
+def _reset_gather_pool_in_child():
+    # Forked children inherit the pool but not its threads; see base.py.
+    global _GATHER_POOL, _GATHER_POOL_SIZE, _GATHER_POOL_LOCK
+    _GATHER_POOL = None
+    _GATHER_POOL_SIZE = 0
+    _GATHER_POOL_LOCK = threading.Lock()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_gather_pool_in_child)
+
+def _page_aligned_splits(rows, row_bytes, offset, num_chunks):
+    """Return the positions that split the sorted unique ``rows`` into at most
+    ``num_chunks`` chunks of similar sizes such that no OS page is read by two chunks.
+    """
+    if num_chunks <= 1 or rows.shape[0] <= 1:
+        return []
+    rows = rows.astype(np.int64)
+    first_page = (offset + rows * row_bytes) // mmap.PAGESIZE
+    last_page = (offset + (rows + 1) * row_bytes - 1) // mmap.PAGESIZE
+    boundaries = np.nonzero(first_page[1:] > last_page[:-1])[0] + 1
+    if boundaries.shape[0] == 0:
+        return []
+    targets = np.linspace(0, rows.shape[0], num_chunks + 1)[1:-1]
+    pos = np.minimum(np.searchsorted(boundaries, targets), boundaries.shape[0] - 1)
+    return np.unique(boundaries[pos]).tolist()
+
+def _empty_output(shape, dtype, pin_memory, staging=None):
+    if staging is not None:
+        torch_dtype = torch.from_numpy(np.empty(0, dtype=dtype)).dtype
+        return staging.empty(shape, torch_dtype).numpy()
+    if pin_memory and F.get_preferred_backend() == 'pytorch':
+        torch_dtype = torch.from_numpy(np.empty(0, dtype=dtype)).dtype
+        return torch.empty(shape, dtype=torch_dtype, pin_memory=True).numpy()
+    return np.empty(shape, dtype=dtype)
+
 @register_storage_wrapper(np.memmap)
 class NumpyStorage(FeatureStorage):
-    """FeatureStorage that asynchronously reads features from a ``numpy.memmap`` object."""
-    def __init__(self, arr):
+    """FeatureStorage that asynchronously reads features from a ``numpy.memmap`` object.
+
+    Large fetches are gathered in parallel: the indices are sorted and deduplicated,
+    split into chunks that do not share OS pages, read by a process-wide thread pool
+    and scattered back into a preallocated (optionally pinned) output buffer.  When
+    fetching to GPU within a :class:`StagingBuffer`, the output buffer is taken from it.
+
+    Parameters
+    ----------
+    arr : numpy.memmap
+        The feature array.
+    num_threads : int, optional
+        The number of threads for gathering rows.  Defaults to the environment variable
+        ``DGL_NUMPY_STORAGE_THREADS`` or ``min(8, os.cpu_count())``.  Setting it to 1
+        disables parallel gathering.
+    """
+    def __init__(self, arr, num_threads=None):
         self.arr = arr
+        self.num_threads = num_threads or DEFAULT_GATHER_THREADS
+
+    def _gather_parallel(self, indices, pin_memory, staging=None):
+        feat_shape = self.arr.shape[1:]
+        out = _empty_output(
+            (indices.shape[0],) + feat_shape, self.arr.dtype, pin_memory, staging)
+        if np.all(indices[1:] > indices[:-1]):
+            # Already sorted and unique - read directly into the output buffer.
+            rows, inverse, buf = indices, None, out
+        else:
+            rows, inverse = np.unique(indices, return_inverse=True)
+            buf = np.empty((rows.shape[0],) + feat_shape, dtype=self.arr.dtype)
+
+        splits = _page_aligned_splits(
+            rows, self.arr.strides[0], getattr(self.arr, 'offset', 0), self.num_threads * 4)
+        bounds = list(zip([0] + splits, splits + [rows.shape[0]]))
+        pool = _get_gather_pool(self.num_threads)
+        futures = [
+            pool.submit(np.take, self.arr, rows[start:end], 0, buf[start:end])
+            for start, end in bounds]
+        for future in futures:
+            future.result()
+
+        if inverse is not None:
+            np.take(buf, inverse, axis=0, out=out)
+        return out
 
     # pylint: disable=unused-argument
-    def _fetch(self, indices, device, pin_memory=False):
-        result = F.zerocopy_from_numpy(self.arr[indices])
+    def _fetch(self, indices, device, pin_memory=False, staging=None):
+        if self.num_threads > 1 and len(indices) >= MIN_PARALLEL_ROWS:
+            indices = np.asarray(F.asnumpy(indices) if F.is_tensor(indices) else indices)
+            result = F.zerocopy_from_numpy(
+                self._gather_parallel(indices, pin_memory, staging))
+        else:
+            result = F.zerocopy_from_numpy(self.arr[indices])
         result = F.copy_to(result, device)
         return result
 
     # pylint: disable=unused-argument
     def fetch(self, indices, device, pin_memory=False, **kwargs):
-        return ThreadedFuture(target=self._fetch, args=(indices, device, pin_memory))
+        # The gathering runs in another thread, so look up the staging buffer entered by
+        # the calling thread here.
+        staging = None
+        if StagingBuffer is not None and F.get_preferred_backend() == 'pytorch' \
+                and torch.device(device).type == 'cuda':
+            staging = StagingBuffer.current()
+        return ThreadedFuture(target=self._fetch,
+                              args=(indices, device, pin_memory, staging),
+                              stats=self.fetch_stats)
@@ -3,12 +3,12 @@
 import torch
 from .base import register_storage_wrapper
 from .tensor import BaseTensorStorage
+from .staging import empty_host_tensor
 from ..utils import gather_pinned_tensor_rows
 
 def _fetch_cpu(indices, tensor, feature_shape, device, pin_memory, **kwargs):
-    result = torch.empty(
-        indices.shape[0], *feature_shape, dtype=tensor.dtype,
-        pin_memory=pin_memory)
+    result, pin_memory = empty_host_tensor(
+        (indices.shape[0], *feature_shape), tensor.dtype, device, pin_memory)
     torch.index_select(tensor, 0, indices, out=result)
     kwargs['non_blocking'] = pin_memory
     result = result.to(device, **kwargs)
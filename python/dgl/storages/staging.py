@@ -0,0 +1,171 @@
+"""Reusable host buffers for staging fetched features before copying them to GPU."""
+import threading
+
+import numpy as np
+import torch
+
+__all__ = ['StagingBuffer', 'StagingRing']
+
+# Tensors are carved from the buffers at offsets aligned to this many bytes.
+ALIGNMENT = 64
+
+def _align(offset):
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+def empty_host_tensor(shape, dtype, device, pin_memory=False):
+    """Return an uninitialized CPU tensor for holding features that will be copied
+    to :attr:`device`.
+
+    The tensor comes from the current staging buffer of the calling thread if there is
+    one and :attr:`device` is a CUDA device, and is allocated otherwise.
+
+    Returns
+    -------
+    Tensor
+        The tensor.
+    bool
+        Whether the tensor is in pinned memory.
+    """
+    staging = StagingBuffer.current()
+    if staging is not None and torch.device(device).type == 'cuda':
+        return staging.empty(shape, dtype), staging.pin_memory
+    return torch.empty(shape, dtype=dtype, pin_memory=pin_memory), pin_memory
+
+class StagingBuffer(object):
+    """A preallocated, optionally pinned, host buffer that the features of one
+    minibatch are gathered into before they are copied to GPU.
+
+    Entering the buffer with a ``with`` block makes it the current staging buffer of
+    the calling thread, which the feature storages use instead of allocating a new
+    output tensor for every fetch with a CUDA target device.  Leaving the block records
+    a CUDA event on the current stream, and entering the block again waits for the
+    event, so that the buffer is only overwritten after the copies reading from it
+    have finished.
+
+    The buffer grows when a minibatch does not fit, so it ends up sized to the largest
+    minibatch.
+
+    Parameters
+    ----------
+    pin_memory : bool, optional
+        Whether to allocate the buffer in pinned memory.
+    size : int, optional
+        The initial size of the buffer in bytes.
+    """
+    _local = threading.local()
+
+    def __init__(self, pin_memory=True, size=0):
+        self.pin_memory = pin_memory
+        self.num_allocations = 0
+        self._buffer = None
+        self._offset = 0
+        self._event = None
+        # Guards the allocations within a minibatch, which may be gathered in parallel.
+        self._lock = threading.Lock()
+        # Held while a minibatch is being staged into the buffer.
+        self._in_use = threading.Lock()
+        if size > 0:
+            self._allocate(size)
+
+    @classmethod
+    def current(cls):
+        """Return the staging buffer entered by the calling thread, or None."""
+        stack = getattr(cls._local, 'stack', None)
+        return stack[-1] if stack else None
+
+    @property
+    def nbytes(self):
+        """The size of the buffer in bytes."""
+        return 0 if self._buffer is None else self._buffer.numel()
+
+    def _allocate(self, nbytes):
+        self._buffer = torch.empty(nbytes, dtype=torch.uint8, pin_memory=self.pin_memory)
+        self.num_allocations += 1
+
+    def empty(self, shape, dtype):
+        """Return an uninitialized tensor from the buffer.
+
+        The tensor is only valid until the buffer is entered again.
+
+        Parameters
+        ----------
+        shape : tuple[int]
+            The shape of the tensor.
+        dtype : torch.dtype
+            The data type of the tensor.
+
+        Returns
+        -------
+        Tensor
+            The tensor.
+        """
+        shape = tuple(shape)
+        nbytes = int(np.prod(shape)) * torch.empty((), dtype=dtype).element_size()
+        if nbytes == 0:
+            return torch.empty(shape, dtype=dtype, pin_memory=self.pin_memory)
+        with self._lock:
+            start = _align(self._offset)
+            end = start + nbytes
+            if end > self.nbytes:
+                # The tensors returned earlier keep the old buffer alive.
+                self._allocate(max(end, 2 * self.nbytes))
+            self._offset = end
+            buffer = self._buffer
+        return buffer[start:end].view(dtype).view(shape)
+
+    def wait(self):
+        """Wait until the copies reading from the buffer have finished."""
+        if self._event is not None:
+            self._event.synchronize()
+            self._event = None
+
+    def __enter__(self):
+        self._in_use.acquire()
+        self.wait()
+        self._offset = 0
+        if not hasattr(self._local, 'stack'):
+            self._local.stack = []
+        self._local.stack.append(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._local.stack.pop()
+        if self._offset > 0 and torch.cuda.is_available():
+            self._event = torch.cuda.Event()
+            self._event.record()
+        self._in_use.release()
+
+class StagingRing(object):
+    """A fixed ring of :class:`StagingBuffer` objects used in turn by consecutive
+    minibatches.
+
+    Parameters
+    ----------
+    num_buffers : int
+        The number of buffers.
+    pin_memory : bool, optional
+        Whether to allocate the buffers in pinned memory.
+    size : int, optional
+        The initial size of every buffer in bytes.
+    """
+    def __init__(self, num_buffers, pin_memory=True, size=0):
+        self.buffers = [StagingBuffer(pin_memory, size) for _ in range(num_buffers)]
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def next(self):
+        """Return the next buffer of the ring."""
+        with self._lock:
+            buffer = self.buffers[self._next]
+            self._next = (self._next + 1) % len(self.buffers)
+        return buffer
+
+    @property
+    def nbytes(self):
+        """The total size of the buffers in bytes."""
+        return sum(buffer.nbytes for buffer in self.buffers)
+
+    @property
+    def num_allocations(self):
+        """The total number of times the buffers have been allocated."""
+        return sum(buffer.num_allocations for buffer in self.buffers)
@@ -41,9 +41,6 @@ from ..partition import partition_graph_with_halo
 from ..partition import metis_partition
 from .. import subgraph
 
-# TO BE DEPRECATED
-from .._deprecate.graph import DGLGraph as DGLGraphStale
-
 __all__ = [
     'line_graph',
     'khop_adj',
@@ -1291,6 +1288,8 @@ def to_bidirected_stale(g, readonly=True):
     >>> bg1.edges()
     (tensor([0, 1, 0]), tensor([0, 0, 1]))
     """
+    # The deprecated graph class is imported here to keep it out of ``import dgl``.
+    from .._deprecate.graph import DGLGraph as DGLGraphStale
     if readonly:
         newgidx = _CAPI_DGLToBidirectedImmutableGraph(g._graph)
     else:
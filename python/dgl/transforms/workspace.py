@@ -0,0 +1,56 @@
+"""Scratch space of the relabeling transforms.
+
+:func:`dgl.to_block`, :func:`dgl.compact_graphs` and
+:func:`dgl.sampling.sample_neighbor_blocks` relabel node IDs with hash maps on CPU.
+The hash maps are kept in a per-thread workspace and reused by the following calls
+of the same thread instead of being allocated for every call.
+"""
+from .._ffi.function import _init_api
+
+__all__ = ['stats', 'reset_stats', 'release']
+
+_STAT_NAMES = ['num_calls', 'last_bytes_allocated', 'total_bytes_allocated',
+               'total_bytes_reused', 'bytes_held']
+
+def stats():
+    """Return the memory statistics of the workspace of the calling thread.
+
+    Returns
+    -------
+    dict[str, int]
+        The statistics with the following keys.
+
+        * ``num_calls``: the number of calls that used the workspace.
+        * ``last_bytes_allocated``: the number of bytes allocated by the last call.
+        * ``total_bytes_allocated``: the number of bytes allocated by all the calls.
+        * ``total_bytes_reused``: the number of bytes reused from the previous calls
+          by all the calls.
+        * ``bytes_held``: the number of bytes currently held by the workspace.
+
+    Examples
+    --------
+    >>> g = dgl.graph(([0, 1], [1, 2]))
+    >>> dgl.transforms.workspace.reset_stats()
+    >>> block = dgl.to_block(g, torch.tensor([2]))
+    >>> block = dgl.to_block(g, torch.tensor([2]))
+    >>> stats = dgl.transforms.workspace.stats()
+    >>> stats['num_calls']
+    2
+    >>> stats['last_bytes_allocated']
+    0
+    """
+    values = _CAPI_DGLWorkspaceStats().asnumpy().tolist()
+    return dict(zip(_STAT_NAMES, values))
+
+def reset_stats():
+    """Reset the memory statistics of the workspace of the calling thread."""
+    _CAPI_DGLWorkspaceResetStats()
+
+def release():
+    """Free the memory held by the workspace of the calling thread.
+
+    The following calls allocate the workspace again.
+    """
+    _CAPI_DGLWorkspaceRelease()
+
+_init_api("dgl.transform", __name__)
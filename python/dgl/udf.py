@@ -1,6 +1,8 @@
 """User-defined function related data structures."""
 from __future__ import absolute_import
 
+from .base import DGLError
+
 class EdgeBatch(object):
     """The class that can represent a batch of edges.
 
@@ -246,13 +248,16 @@ class NodeBatch(object):
         Node feature data.
     msgs : dict[str, Tensor], optional
         Messages data.
+    msg_mask : Tensor, optional
+        The mask of the padded messages.
     """
-    def __init__(self, graph, nodes, ntype, data, msgs=None):
+    def __init__(self, graph, nodes, ntype, data, msgs=None, msg_mask=None):
         self._graph = graph
         self._nodes = nodes
         self._ntype = ntype
         self._data = data
         self._msgs = msgs
+        self._msg_mask = msg_mask
 
     @property
     def data(self):
@@ -320,6 +325,35 @@ class NodeBatch(object):
         """
         return self._msgs
 
+    @property
+    def mailbox_mask(self):
+        """Return the mask of the messages received, or None if the messages are not padded.
+
+        It is a boolean tensor of shape (N, D) when the reduce function is wrapped by
+        :func:`padded_reduce`, where ``mailbox_mask[i, j]`` is False if the j-th message of
+        the i-th node is padding. The padded messages are zeros.
+
+        Examples
+        --------
+        The following example uses PyTorch backend.
+
+        >>> import dgl
+        >>> import torch
+
+        >>> g = dgl.graph((torch.tensor([0, 1, 1]), torch.tensor([1, 1, 0])))
+        >>> g.ndata['h'] = torch.ones(2, 1)
+
+        >>> # Define a UDF that computes the maximum of the messages received
+        >>> def node_udf(nodes):
+        >>>     mask = nodes.mailbox_mask.unsqueeze(-1)
+        >>>     m = nodes.mailbox['m'].masked_fill(~mask, float('-inf'))
+        >>>     return {'h': m.max(1)[0]}
+
+        >>> import dgl.function as fn
+        >>> g.update_all(fn.copy_u('h', 'm'), dgl.udf.padded_reduce(node_udf))
+        """
+        return self._msg_mask
+
     def nodes(self):
         """Return the nodes in the batch.
 
@@ -403,3 +437,68 @@ class NodeBatch(object):
     def ntype(self):
         """Return the node type of this node batch, if available."""
         return self._ntype
+
+class PaddedReduceFunction(object):
+    """A user-defined reduce function that receives padded mailboxes.
+
+    See :func:`padded_reduce`.
+    """
+    def __init__(self, func, bucketing='pow2'):
+        if bucketing not in ('pow2', 'none'):
+            raise DGLError('Invalid bucketing {}. Must be "pow2" or "none".'.format(bucketing))
+        self.func = func
+        self.bucketing = bucketing
+
+    def __call__(self, nodes):
+        return self.func(nodes)
+
+def padded_reduce(func, bucketing='pow2'):
+    r"""Wrap a node-wise user-defined reduce function so that it runs on padded mailboxes
+    instead of on one batch of nodes per in-degree.
+
+    With degree bucketing, the reduce function is called once for every distinct in-degree,
+    which means hundreds of calls on power-law graphs. With the wrapped function, the
+    mailboxes of many nodes with different in-degrees are padded with zeros to the same
+    length and :attr:`NodeBatch.mailbox_mask` tells the real messages from the padding.
+    The function must therefore ignore the padded messages, e.g., by masking them
+    before a softmax or a max.
+
+    Parameters
+    ----------
+    func : callable
+        The reduce function, which takes a :class:`NodeBatch` and returns a dict of tensors.
+    bucketing : str, optional
+        ``'pow2'`` groups the nodes whose in-degrees are within the same power of two,
+        i.e., :math:`(2^{k-1}, 2^k]`, and pads each group to its maximum in-degree, so that
+        the function is called at most :math:`\log_2(D)+1` times where :math:`D` is the
+        maximum in-degree, and less than half of the mailbox is padding. ``'none'`` pads all
+        the nodes to the maximum in-degree and calls the function once.
+
+    Returns
+    -------
+    PaddedReduceFunction
+        The reduce function to pass to message passing APIs such as
+        :func:`~dgl.DGLGraph.update_all`.
+
+    Examples
+    --------
+    The following example uses PyTorch backend.
+
+    >>> import dgl
+    >>> import torch
+    >>> import dgl.function as fn
+    >>> g = dgl.graph(([1, 3, 5, 0, 4, 2, 3, 3, 4, 5], [1, 1, 0, 0, 1, 2, 2, 0, 3, 3]))
+    >>> g.edata['eid'] = torch.arange(10)
+    >>> def reducer(nodes):
+    ...     print(nodes.mailbox['eid'], nodes.mailbox_mask)
+    ...     return {'n': nodes.mailbox['eid'].sum(1)}
+    >>> g.update_all(fn.copy_e('eid', 'eid'), dgl.udf.padded_reduce(reducer, 'none'))
+    tensor([[2, 3, 7],
+            [0, 1, 4],
+            [5, 6, 0],
+            [8, 9, 0]]) tensor([[ True,  True,  True],
+            [ True,  True,  True],
+            [ True,  True, False],
+            [ True,  True, False]])
+    """
+    return PaddedReduceFunction(func, bucketing)
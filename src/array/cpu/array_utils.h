@@ -99,6 +99,21 @@ class IdHashMap {
     return oldv2newv_.size();
   }
 
+  // Remove all the ids while keeping the memory for reuse.
+  void Clear() {
+    for (auto pair : oldv2newv_)
+      filter_[pair.first & kFilterMask] = false;
+    // Erase the entries one by one because clear() releases the buckets of large tables.
+    for (auto it = oldv2newv_.begin(); it != oldv2newv_.end(); )
+      oldv2newv_.erase(it++);
+  }
+
+  // Return the number of bytes held by the hashmap.
+  size_t NumBytes() const {
+    return filter_.capacity() / 8 +
+      oldv2newv_.bucket_count() * (sizeof(std::pair<const IdType, IdType>) + 1);
+  }
+
  private:
   static constexpr int32_t kFilterMask = 0xFFFFFF;
   static constexpr int32_t kFilterSize = kFilterMask + 1;
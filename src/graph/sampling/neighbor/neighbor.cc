@@ -8,8 +8,13 @@
 #include <dgl/packed_func_ext.h>
 #include <dgl/array.h>
 #include <dgl/aten/macro.h>
+#include <dgl/immutable_graph.h>
 #include <dgl/sampling/neighbor.h>
+#include <tuple>
+#include <vector>
 #include "../../../c_api_common.h"
+#include "../../../array/cpu/array_utils.h"
+#include "../../transform/workspace.h"
 #include "../../unit_graph.h"
 
 using namespace dgl::runtime;
@@ -413,6 +418,159 @@ HeteroSubgraph SampleNeighborsBiased(
   return ret;
 }
 
+namespace {
+
+/*!
+ * \brief Relabel the sampled edges of one layer into a block.
+ *
+ * On entry \c node_mappings holds the destination nodes of the block for every node
+ * type.  The source nodes are added to the same hash tables, so on exit they hold the
+ * source nodes of the block, i.e. the destination nodes of the next layer.  Since the
+ * destination nodes always come first among the source nodes, one table per node type
+ * serves all the layers and never has to be copied or rebuilt.
+ *
+ * \return The block.
+ */
+template <typename IdType>
+HeteroGraphPtr ToBlockInPlace(
+    const HeteroGraphPtr graph,
+    transform::ScopedHashMaps<IdType>* node_mappings) {
+  const int64_t num_etypes = graph->NumEdgeTypes();
+  const int64_t num_ntypes = graph->NumVertexTypes();
+  transform::ScopedHashMaps<IdType>& mappings = *node_mappings;
+
+  std::vector<int64_t> num_dst_nodes(num_ntypes);
+  for (int64_t ntype = 0; ntype < num_ntypes; ++ntype)
+    num_dst_nodes[ntype] = mappings[ntype].Size();
+
+  std::vector<EdgeArray> edge_arrays(num_etypes);
+  for (int64_t etype = 0; etype < num_etypes; ++etype) {
+    const dgl_type_t srctype = graph->GetEndpointTypes(etype).first;
+    edge_arrays[etype] = graph->Edges(etype);
+    mappings[srctype].Update(edge_arrays[etype].src);
+  }
+
+  const EdgeArray etypes = graph->meta_graph()->Edges("eid");
+  const auto new_meta_graph = ImmutableGraph::CreateFromCOO(
+      num_ntypes * 2, etypes.src, Add(etypes.dst, num_ntypes));
+  std::vector<int64_t> num_nodes_per_type(num_ntypes * 2);
+  for (int64_t ntype = 0; ntype < num_ntypes; ++ntype) {
+    num_nodes_per_type[ntype] = mappings[ntype].Size();
+    num_nodes_per_type[num_ntypes + ntype] = num_dst_nodes[ntype];
+  }
+
+  std::vector<HeteroGraphPtr> rel_graphs(num_etypes);
+  for (int64_t etype = 0; etype < num_etypes; ++etype) {
+    const auto src_dst_types = graph->GetEndpointTypes(etype);
+    const dgl_type_t srctype = src_dst_types.first;
+    const dgl_type_t dsttype = src_dst_types.second;
+    const int64_t num_src = mappings[srctype].Size();
+    const int64_t num_dst = num_dst_nodes[dsttype];
+    if (num_dst == 0) {
+      rel_graphs[etype] = CreateFromCOO(
+          2, num_src, num_dst, aten::NullArray(), aten::NullArray());
+      continue;
+    }
+    IdArray new_src = mappings[srctype].Map(edge_arrays[etype].src, -1);
+    IdArray new_dst = mappings[dsttype].Map(edge_arrays[etype].dst, -1);
+    const IdType* new_dst_data = new_dst.Ptr<IdType>();
+    for (int64_t i = 0; i < new_dst->shape[0]; ++i)
+      CHECK(new_dst_data[i] >= 0 && new_dst_data[i] < num_dst)
+        << "Node " << edge_arrays[etype].dst.Ptr<IdType>()[i] << " is not a seed node"
+        << " of the layer.  Only inbound neighbors can be turned into blocks.";
+    rel_graphs[etype] = CreateFromCOO(2, num_src, num_dst, new_src, new_dst);
+  }
+
+  return CreateHeteroGraph(new_meta_graph, rel_graphs, num_nodes_per_type);
+}
+
+/*!
+ * \brief Sample the inbound neighbors of all layers and convert each layer into a block.
+ *
+ * \param hg The input graph on CPU.
+ * \param nodes The seed node IDs of each type for the last layer.
+ * \param fanouts The fanouts per edge type of each layer, from the first layer to the last.
+ * \param prob The transition probability arrays of each edge type.
+ * \param exclude_edges Edges IDs of each type which will be excluded during sampling.
+ * \param replace If true, sample with replacement.
+ * \return The source node IDs of each type of the first layer, and the block and the
+ *         original edge IDs of each type for every layer, from the first layer to the last.
+ *         The source nodes of every other layer are a prefix of those of the first layer.
+ */
+template <typename IdType>
+std::tuple<std::vector<IdArray>, std::vector<HeteroGraphPtr>, std::vector<std::vector<IdArray>>>
+SampleNeighborBlocks(
+    const HeteroGraphPtr hg,
+    const std::vector<IdArray>& nodes,
+    const std::vector<std::vector<int64_t>>& fanouts,
+    const std::vector<FloatArray>& prob,
+    const std::vector<IdArray>& exclude_edges,
+    bool replace) {
+  const int64_t num_layers = fanouts.size();
+  transform::ScopedHashMaps<IdType> mappings(nodes.size());
+  for (size_t ntype = 0; ntype < nodes.size(); ++ntype)
+    mappings[ntype].Update(nodes[ntype]);
+  std::vector<IdArray> seeds = nodes;
+  std::vector<std::vector<IdArray>> src_nodes(num_layers);
+  std::vector<HeteroGraphPtr> blocks(num_layers);
+  std::vector<std::vector<IdArray>> block_eids(num_layers);
+
+  for (int64_t layer = num_layers - 1; layer >= 0; --layer) {
+    const HeteroSubgraph frontier = SampleNeighbors(
+        hg, seeds, fanouts[layer], EdgeDir::kIn, prob, exclude_edges, replace);
+    // The edges of a block keep the order of the frontier, so the original edge IDs
+    // are the induced edges of the frontier.
+    blocks[layer] = ToBlockInPlace<IdType>(frontier.graph, &mappings);
+    block_eids[layer] = frontier.induced_edges;
+    for (size_t ntype = 0; ntype < mappings.size(); ++ntype)
+      src_nodes[layer].push_back(mappings[ntype].Values());
+    seeds = src_nodes[layer];
+  }
+  return std::make_tuple(src_nodes[0], blocks, block_eids);
+}
+
+}  // namespace
+
+DGL_REGISTER_GLOBAL("sampling.neighbor._CAPI_DGLSampleNeighborBlocks")
+.set_body([] (DGLArgs args, DGLRetValue *rv) {
+    HeteroGraphRef hg = args[0];
+    const auto& nodes = ListValueToVector<IdArray>(args[1]);
+    const auto& fanout_arrays = ListValueToVector<IdArray>(args[2]);
+    const auto& prob = ListValueToVector<FloatArray>(args[3]);
+    const auto& exclude_edges = ListValueToVector<IdArray>(args[4]);
+    const bool replace = args[5];
+
+    CHECK_EQ(hg->Context().device_type, kDLCPU)
+      << "Fused multi-layer neighbor sampling only supports graphs on CPU.";
+    std::vector<std::vector<int64_t>> fanouts;
+    for (const IdArray& fanout : fanout_arrays) {
+      CHECK_INT64(fanout, "fanout");
+      fanouts.push_back(fanout.ToVector<int64_t>());
+    }
+
+    std::vector<IdArray> input_nodes;
+    std::vector<HeteroGraphPtr> blocks;
+    std::vector<std::vector<IdArray>> block_eids;
+    ATEN_ID_TYPE_SWITCH(hg->DataType(), IdType, {
+      std::tie(input_nodes, blocks, block_eids) = SampleNeighborBlocks<IdType>(
+          hg.sptr(), nodes, fanouts, prob, exclude_edges, replace);
+    });
+
+    List<ObjectRef> ret;
+    List<Value> input_nodes_ref;
+    for (IdArray& array : input_nodes)
+      input_nodes_ref.push_back(Value(MakeValue(array)));
+    ret.push_back(input_nodes_ref);
+    for (size_t layer = 0; layer < blocks.size(); ++layer) {
+      List<Value> eids_ref;
+      for (IdArray& array : block_eids[layer])
+        eids_ref.push_back(Value(MakeValue(array)));
+      ret.push_back(HeteroGraphRef(blocks[layer]));
+      ret.push_back(eids_ref);
+    }
+    *rv = ret;
+  });
+
 DGL_REGISTER_GLOBAL("sampling.neighbor._CAPI_DGLSampleNeighborsEType")
 .set_body([] (DGLArgs args, DGLRetValue *rv) {
     HeteroGraphRef hg = args[0];
@@ -0,0 +1,225 @@
+/*!
+ *  Copyright (c) 2022 by Contributors
+ * \file graph/sampling/randomwalks/pinsage_cpu.cc
+ * \brief DGL sampler - CPU implementation of fused PinSAGE neighbor selection with OpenMP
+ */
+
+#include <dgl/array.h>
+#include <dgl/base_heterograph.h>
+#include <dgl/random.h>
+#include <dgl/runtime/parallel_for.h>
+#include <algorithm>
+#include <functional>
+#include <tuple>
+#include <utility>
+#include <vector>
+#include "randomwalks_impl.h"
+
+namespace dgl {
+
+using namespace dgl::runtime;
+using namespace dgl::aten;
+
+namespace sampling {
+
+namespace impl {
+
+namespace {
+
+/*!
+ * \brief Open-addressing hash map counting the number of visits of each node, reused
+ *        across the seeds processed by one thread.
+ *
+ * Only the slots used by the current seed are cleared afterwards, so the cost per seed
+ * is proportional to the number of visits rather than the capacity.
+ */
+template<typename IdxType>
+class VisitCounter {
+ public:
+  /*! \param max_keys The maximum number of visits of a seed. */
+  explicit VisitCounter(int64_t max_keys) {
+    int64_t capacity = 1;
+    while (capacity < 2 * max_keys) {
+      capacity <<= 1;
+      ++log_capacity_;
+    }
+    keys_.assign(capacity, -1);
+    counts_.resize(capacity);
+    used_.reserve(max_keys);
+    items_.reserve(max_keys);
+  }
+
+  /*! \brief Count one visit of the given node. */
+  void Add(IdxType key) {
+    const int64_t mask = static_cast<int64_t>(keys_.size()) - 1;
+    int64_t pos = Hash(key);
+    while (keys_[pos] != -1 && keys_[pos] != key)
+      pos = (pos + 1) & mask;
+    if (keys_[pos] == -1) {
+      keys_[pos] = key;
+      counts_[pos] = 0;
+      used_.push_back(pos);
+    }
+    ++counts_[pos];
+  }
+
+  /*!
+   * \brief Write the k most visited nodes and their number of visits, and clear the map.
+   *
+   * Ties are broken by the larger node ID first, same as \c SelectPinSageNeighbors.
+   *
+   * \return The number of nodes written, which is at most k.
+   */
+  int64_t TopKAndClear(int64_t k, IdxType *nodes, IdxType *counts) {
+    items_.clear();
+    for (const int64_t pos : used_) {
+      items_.emplace_back(counts_[pos], keys_[pos]);
+      keys_[pos] = -1;
+    }
+    used_.clear();
+
+    const int64_t num_selected = std::min(static_cast<int64_t>(items_.size()), k);
+    std::partial_sort(items_.begin(), items_.begin() + num_selected, items_.end(),
+                      std::greater<std::pair<IdxType, IdxType>>());
+    for (int64_t i = 0; i < num_selected; ++i) {
+      counts[i] = items_[i].first;
+      nodes[i] = items_[i].second;
+    }
+    return num_selected;
+  }
+
+ private:
+  int64_t Hash(IdxType key) const {
+    // Fibonacci hashing: the top bits of the product are well mixed.
+    if (log_capacity_ == 0)
+      return 0;
+    return static_cast<int64_t>(
+        (static_cast<uint64_t>(key) * 0x9E3779B97F4A7C15ull) >> (64 - log_capacity_));
+  }
+
+  int log_capacity_ = 0;
+  std::vector<IdxType> keys_;
+  std::vector<IdxType> counts_;
+  std::vector<int64_t> used_;
+  std::vector<std::pair<IdxType, IdxType>> items_;
+};
+
+};  // namespace
+
+template<DLDeviceType XPU, typename IdxType>
+std::tuple<IdArray, IdArray, IdArray> PinSageNeighbors(
+    const HeteroGraphPtr hg,
+    const IdArray seeds,
+    const TypeArray metapath,
+    const FloatArray restart_prob,
+    const int64_t num_random_walks,
+    const int64_t metapath_hops,
+    const int64_t k) {
+  const int64_t num_seeds = seeds->shape[0];
+  const int64_t num_steps = metapath->shape[0];
+  const int64_t max_visits = num_random_walks * (num_steps / metapath_hops);
+  const int64_t max_selected = std::min(k, max_visits);
+  const IdxType *seed_data = seeds.Ptr<IdxType>();
+  const IdxType *metapath_data = metapath.Ptr<IdxType>();
+  const int64_t begin_ntype = hg->meta_graph()->FindEdge(metapath_data[0]).first;
+  const int64_t max_nodes = hg->NumVertices(begin_ntype);
+
+  // Materialize the CSRs before the parallel loop to avoid data races.
+  const int64_t num_etypes = hg->NumEdgeTypes();
+  std::vector<CSRMatrix> edges_by_type(num_etypes);
+  std::vector<const IdxType *> indptr_by_type(num_etypes);
+  std::vector<const IdxType *> indices_by_type(num_etypes);
+  for (int64_t etype = 0; etype < num_etypes; ++etype) {
+    edges_by_type[etype] = hg->GetCSRMatrix(etype);
+    indptr_by_type[etype] = edges_by_type[etype].indptr.Ptr<IdxType>();
+    indices_by_type[etype] = edges_by_type[etype].indices.Ptr<IdxType>();
+  }
+
+  // The selected neighbors of each seed occupy max_selected slots before compaction.
+  IdArray padded_nodes = IdArray::Empty({num_seeds * max_selected}, seeds->dtype, seeds->ctx);
+  IdArray padded_counts = IdArray::Empty({num_seeds * max_selected}, seeds->dtype, seeds->ctx);
+  IdxType *padded_nodes_data = padded_nodes.Ptr<IdxType>();
+  IdxType *padded_counts_data = padded_counts.Ptr<IdxType>();
+  std::vector<int64_t> num_selected(num_seeds);
+
+  ATEN_FLOAT_TYPE_SWITCH(restart_prob->dtype, DType, "restart probability", {
+    const DType *restart_prob_data = restart_prob.Ptr<DType>();
+    runtime::parallel_for(0, num_seeds, [&](size_t seed_begin, size_t seed_end) {
+      VisitCounter<IdxType> counter(max_visits);
+      for (auto i = seed_begin; i < seed_end; ++i) {
+        const IdxType seed = seed_data[i];
+        CHECK_LT(seed, max_nodes) << "Seed node ID exceeds the maximum number of nodes.";
+
+        for (int64_t walk = 0; walk < num_random_walks; ++walk) {
+          IdxType curr = seed;
+          for (int64_t step = 0; step < num_steps; ++step) {
+            const dgl_type_t etype = metapath_data[step];
+            const IdxType *indptr = indptr_by_type[etype];
+            const int64_t degree = indptr[curr + 1] - indptr[curr];
+            if (degree == 0)
+              break;
+            curr = indices_by_type[etype][
+              indptr[curr] + RandomEngine::ThreadLocal()->RandInt(degree)];
+            // Only the nodes at the end of each metapath traversal are counted.
+            if ((step + 1) % metapath_hops == 0)
+              counter.Add(curr);
+            // Same termination rule as RandomWalkWithStepwiseRestart.
+            if (RandomEngine::ThreadLocal()->Uniform<DType>() < restart_prob_data[step])
+              break;
+          }
+        }
+
+        num_selected[i] = counter.TopKAndClear(
+            max_selected, padded_nodes_data + i * max_selected,
+            padded_counts_data + i * max_selected);
+      }
+    });
+  });
+
+  std::vector<int64_t> offsets(num_seeds + 1, 0);
+  for (int64_t i = 0; i < num_seeds; ++i)
+    offsets[i + 1] = offsets[i] + num_selected[i];
+  const int64_t num_edges = offsets[num_seeds];
+
+  IdArray res_src = IdArray::Empty({num_edges}, seeds->dtype, seeds->ctx);
+  IdArray res_dst = IdArray::Empty({num_edges}, seeds->dtype, seeds->ctx);
+  IdArray res_cnt = IdArray::Empty({num_edges}, seeds->dtype, seeds->ctx);
+  IdxType *res_src_data = res_src.Ptr<IdxType>();
+  IdxType *res_dst_data = res_dst.Ptr<IdxType>();
+  IdxType *res_cnt_data = res_cnt.Ptr<IdxType>();
+  runtime::parallel_for(0, num_seeds, [&](size_t seed_begin, size_t seed_end) {
+    for (auto i = seed_begin; i < seed_end; ++i) {
+      const int64_t out = offsets[i];
+      std::copy_n(padded_nodes_data + i * max_selected, num_selected[i], res_src_data + out);
+      std::copy_n(padded_counts_data + i * max_selected, num_selected[i], res_cnt_data + out);
+      std::fill_n(res_dst_data + out, num_selected[i], seed_data[i]);
+    }
+  });
+
+  return std::make_tuple(res_src, res_dst, res_cnt);
+}
+
+template
+std::tuple<IdArray, IdArray, IdArray> PinSageNeighbors<kDLCPU, int32_t>(
+    const HeteroGraphPtr hg,
+    const IdArray seeds,
+    const TypeArray metapath,
+    const FloatArray restart_prob,
+    const int64_t num_random_walks,
+    const int64_t metapath_hops,
+    const int64_t k);
+template
+std::tuple<IdArray, IdArray, IdArray> PinSageNeighbors<kDLCPU, int64_t>(
+    const HeteroGraphPtr hg,
+    const IdArray seeds,
+    const TypeArray metapath,
+    const FloatArray restart_prob,
+    const int64_t num_random_walks,
+    const int64_t metapath_hops,
+    const int64_t k);
+
+};  // namespace impl
+
+};  // namespace sampling
+
+};  // namespace dgl
@@ -133,6 +133,33 @@ std::tuple<IdArray, IdArray, IdArray> SelectPinSageNeighbors(
   return result;
 }
 
+std::tuple<IdArray, IdArray, IdArray> PinSageNeighbors(
+    const HeteroGraphPtr hg,
+    const IdArray seeds,
+    const TypeArray metapath,
+    const FloatArray restart_prob,
+    const int64_t num_random_walks,
+    const int64_t metapath_hops,
+    const int64_t k) {
+  CheckRandomWalkInputs(hg, seeds, metapath, {});
+  CHECK_FLOAT(restart_prob, "restart_prob");
+  CHECK_NDIM(restart_prob, 1, "restart_prob");
+  CHECK_EQ(restart_prob->shape[0], metapath->shape[0])
+    << "restart_prob must have the same length as metapath.";
+  CHECK(metapath_hops > 0 && metapath->shape[0] % metapath_hops == 0)
+    << "The length of metapath must be a multiple of metapath_hops.";
+  std::tuple<IdArray, IdArray, IdArray> result;
+
+  ATEN_XPU_SWITCH(seeds->ctx.device_type, XPU, "PinSageNeighbors", {
+    ATEN_ID_TYPE_SWITCH(seeds->dtype, IdxType, {
+      result = impl::PinSageNeighbors<XPU, IdxType>(
+          hg, seeds, metapath, restart_prob, num_random_walks, metapath_hops, k);
+    });
+  });
+
+  return result;
+}
+
 };  // namespace sampling
 
 DGL_REGISTER_GLOBAL("sampling.randomwalks._CAPI_DGLSamplingRandomWalk")
@@ -168,6 +195,26 @@ DGL_REGISTER_GLOBAL("sampling.pinsage._CAPI_DGLSamplingSelectPinSageNeighbors")
     *rv = ret;
   });
 
+DGL_REGISTER_GLOBAL("sampling.pinsage._CAPI_DGLSamplingPinSageNeighbors")
+.set_body([] (DGLArgs args, DGLRetValue *rv) {
+    HeteroGraphRef hg = args[0];
+    IdArray seeds = args[1];
+    TypeArray metapath = args[2];
+    FloatArray restart_prob = args[3];
+    int64_t num_random_walks = static_cast<int64_t>(args[4]);
+    int64_t metapath_hops = static_cast<int64_t>(args[5]);
+    int64_t k = static_cast<int64_t>(args[6]);
+
+    auto result = sampling::PinSageNeighbors(
+        hg.sptr(), seeds, metapath, restart_prob, num_random_walks, metapath_hops, k);
+
+    List<Value> ret;
+    ret.push_back(Value(MakeValue(std::get<0>(result))));
+    ret.push_back(Value(MakeValue(std::get<1>(result))));
+    ret.push_back(Value(MakeValue(std::get<2>(result))));
+    *rv = ret;
+  });
+
 DGL_REGISTER_GLOBAL("sampling.randomwalks._CAPI_DGLSamplingRandomWalkWithRestart")
 .set_body([] (DGLArgs args, DGLRetValue *rv) {
     HeteroGraphRef hg = args[0];
@@ -122,6 +122,34 @@ std::tuple<IdArray, IdArray, IdArray> SelectPinSageNeighbors(
     const int64_t num_samples_per_node,
     const int64_t k);
 
+/*!
+ * \brief Select the neighbors of PinSAGE-like models by performing the random walks with
+ *        stepwise restart and counting the visited nodes of each seed in one pass.
+ * \param hg The heterograph.
+ * \param seeds A 1D array of seed nodes, with the type the source type of the first
+ *        edge type in the metapath.
+ * \param metapath A 1D array of edge types of a random walk, consisting of multiple
+ *        traversals of \c metapath_hops edge types each.
+ * \param restart_prob Restart probability array which has the same number of elements
+ *        as \c metapath, indicating the probability to terminate after transition.
+ * \param num_random_walks The number of random walks from each seed.
+ * \param metapath_hops The number of edge types in one traversal.  Only the node
+ *        reached at the end of each traversal is counted.
+ * \param k The maximum number of neighbors to select for each seed.
+ * \return A tuple of three 1D arrays: the selected neighbors, the seeds they are
+ *         selected for, and their numbers of visits.  The neighbors of each seed
+ *         are sorted by the number of visits in descending order.
+ */
+template<DLDeviceType XPU, typename IdxType>
+std::tuple<IdArray, IdArray, IdArray> PinSageNeighbors(
+    const HeteroGraphPtr hg,
+    const IdArray seeds,
+    const TypeArray metapath,
+    const FloatArray restart_prob,
+    const int64_t num_random_walks,
+    const int64_t metapath_hops,
+    const int64_t k);
+
 };  // namespace impl
 
 };  // namespace sampling
@@ -32,6 +32,7 @@
 // TODO(BarclayII): currently CompactGraphs depend on IdHashMap implementation which
 // only works on CPU.  Should fix later to make it device agnostic.
 #include "../../array/cpu/array_utils.h"
+#include "workspace.h"
 
 namespace dgl {
 
@@ -50,7 +51,7 @@ CompactGraphsCPU(
   // TODO(BarclayII): check whether the node space and metagraph of each graph is the same.
   // Step 1: Collect the nodes that has connections for each type.
   const int64_t num_ntypes = graphs[0]->NumVertexTypes();
-  std::vector<aten::IdHashMap<IdType>> hashmaps(num_ntypes);
+  ScopedHashMaps<IdType> hashmaps(num_ntypes);
   std::vector<std::vector<EdgeArray>> all_edges(graphs.size());   // all_edges[i][etype]
 
   std::vector<int64_t> max_vertex_cnt(num_ntypes, 0);
@@ -30,6 +30,7 @@
 #include <tuple>
 #include <utility>
 #include "../../array/cpu/array_utils.h"
+#include "workspace.h"
 
 namespace dgl {
 
@@ -56,20 +57,21 @@ ToBlockCPU(HeteroGraphPtr graph, const std::vector<IdArray> &rhs_nodes,
   CHECK(rhs_nodes.size() == static_cast<size_t>(num_ntypes))
     << "rhs_nodes not given for every node type";
 
-  const std::vector<IdHashMap<IdType>> rhs_node_mappings(rhs_nodes.begin(), rhs_nodes.end());
-  std::vector<IdHashMap<IdType>> lhs_node_mappings;
-
-  if (generate_lhs_nodes) {
-  // build lhs_node_mappings -- if we don't have them already
-    if (include_rhs_in_lhs)
-      lhs_node_mappings = rhs_node_mappings;  // copy
-    else
-      lhs_node_mappings.resize(num_ntypes);
-  } else {
-    lhs_node_mappings = std::vector<IdHashMap<IdType>>(lhs_nodes.begin(), lhs_nodes.end());
+  // If the lhs nodes are generated and include the rhs nodes, the rhs nodes come
+  // first in the lhs nodes with the same new IDs, so a single map per node type
+  // serves both sides.
+  const bool share_mappings = generate_lhs_nodes && include_rhs_in_lhs;
+  ScopedHashMaps<IdType> mappings(share_mappings ? num_ntypes : 2 * num_ntypes);
+  const int64_t lhs_offset = share_mappings ? 0 : num_ntypes;
+  std::vector<int64_t> num_rhs_nodes(num_ntypes);
+  for (int64_t ntype = 0; ntype < num_ntypes; ++ntype) {
+    mappings[ntype].Reserve(rhs_nodes[ntype]->shape[0]);
+    mappings[ntype].Update(rhs_nodes[ntype]);
+    num_rhs_nodes[ntype] = mappings[ntype].Size();
+    if (!generate_lhs_nodes)
+      mappings[lhs_offset + ntype].Update(lhs_nodes[ntype]);
   }
 
-
   for (int64_t etype = 0; etype < num_etypes; ++etype) {
     const auto src_dst_types = graph->GetEndpointTypes(etype);
     const dgl_type_t srctype = src_dst_types.first;
@@ -77,7 +79,7 @@ ToBlockCPU(HeteroGraphPtr graph, const std::vector<IdArray> &rhs_nodes,
     if (!aten::IsNullArray(rhs_nodes[dsttype])) {
       const EdgeArray& edges = graph->Edges(etype);
       if (generate_lhs_nodes) {
-        lhs_node_mappings[srctype].Update(edges.src);
+        mappings[lhs_offset + srctype].Update(edges.src);
       }
       edge_arrays[etype] = edges;
     }
@@ -93,9 +95,9 @@ ToBlockCPU(HeteroGraphPtr graph, const std::vector<IdArray> &rhs_nodes,
       num_ntypes * 2, etypes.src, new_dst);
 
   for (int64_t ntype = 0; ntype < num_ntypes; ++ntype)
-    num_nodes_per_type.push_back(lhs_node_mappings[ntype].Size());
+    num_nodes_per_type.push_back(mappings[lhs_offset + ntype].Size());
   for (int64_t ntype = 0; ntype < num_ntypes; ++ntype)
-    num_nodes_per_type.push_back(rhs_node_mappings[ntype].Size());
+    num_nodes_per_type.push_back(num_rhs_nodes[ntype]);
 
   std::vector<HeteroGraphPtr> rel_graphs;
   std::vector<IdArray> induced_edges;
@@ -103,25 +105,27 @@ ToBlockCPU(HeteroGraphPtr graph, const std::vector<IdArray> &rhs_nodes,
     const auto src_dst_types = graph->GetEndpointTypes(etype);
     const dgl_type_t srctype = src_dst_types.first;
     const dgl_type_t dsttype = src_dst_types.second;
-    const IdHashMap<IdType> &lhs_map = lhs_node_mappings[srctype];
-    const IdHashMap<IdType> &rhs_map = rhs_node_mappings[dsttype];
-    if (rhs_map.Size() == 0) {
+    const IdHashMap<IdType> &lhs_map = mappings[lhs_offset + srctype];
+    const IdHashMap<IdType> &rhs_map = mappings[dsttype];
+    const int64_t num_rhs = num_rhs_nodes[dsttype];
+    if (num_rhs == 0) {
       // No rhs nodes are given for this edge type. Create an empty graph.
       rel_graphs.push_back(CreateFromCOO(
-          2, lhs_map.Size(), rhs_map.Size(),
+          2, lhs_map.Size(), num_rhs,
           aten::NullArray(), aten::NullArray()));
       induced_edges.push_back(aten::NullArray());
     } else {
       IdArray new_src = lhs_map.Map(edge_arrays[etype].src, -1);
       IdArray new_dst = rhs_map.Map(edge_arrays[etype].dst, -1);
-      // Check whether there are unmapped IDs and raise error.
+      // Check whether there are unmapped IDs and raise error.  With shared mappings
+      // the lhs-only nodes are mapped beyond the rhs nodes.
       for (int64_t i = 0; i < new_dst->shape[0]; ++i)
-        CHECK_NE(new_dst.Ptr<IdType>()[i], -1)
+        CHECK(new_dst.Ptr<IdType>()[i] != -1 && new_dst.Ptr<IdType>()[i] < num_rhs)
           << "Node " << edge_arrays[etype].dst.Ptr<IdType>()[i] << " does not exist"
           << " in `rhs_nodes`. Argument `rhs_nodes` must contain all the edge"
           << " destination nodes.";
       rel_graphs.push_back(CreateFromCOO(
-          2, lhs_map.Size(), rhs_map.Size(),
+          2, lhs_map.Size(), num_rhs,
           new_src, new_dst));
       induced_edges.push_back(edge_arrays[etype].id);
     }
@@ -133,8 +137,8 @@ ToBlockCPU(HeteroGraphPtr graph, const std::vector<IdArray> &rhs_nodes,
   if (generate_lhs_nodes) {
     CHECK_EQ(lhs_nodes.size(), 0) << "InteralError: lhs_nodes should be empty "
         "when generating it.";
-    for (const IdHashMap<IdType> &lhs_map : lhs_node_mappings)
-      lhs_nodes.push_back(lhs_map.Values());
+    for (int64_t ntype = 0; ntype < num_ntypes; ++ntype)
+      lhs_nodes.push_back(mappings[lhs_offset + ntype].Values());
   }
   return std::make_tuple(new_graph, induced_edges);
 }
@@ -0,0 +1,41 @@
+/*!
+ *  Copyright (c) 2022 by Contributors
+ * \file graph/transform/workspace.cc
+ * \brief APIs of the per-thread scratch space of the CPU relabeling transforms.
+ */
+#include "workspace.h"
+
+#include <dgl/array.h>
+#include <dgl/runtime/registry.h>
+#include <vector>
+#include "../../c_api_common.h"
+
+namespace dgl {
+
+using namespace dgl::runtime;
+
+namespace transform {
+
+DGL_REGISTER_GLOBAL("transform._CAPI_DGLWorkspaceStats")
+.set_body([] (DGLArgs args, DGLRetValue* rv) {
+    Workspace* workspace = Workspace::ThreadLocal();
+    const WorkspaceStats* stats = workspace->Stats();
+    const std::vector<int64_t> values = {
+      stats->num_calls, stats->last_bytes_allocated, stats->total_bytes_allocated,
+      stats->total_bytes_reused, workspace->NumBytes()};
+    *rv = aten::VecToIdArray(values, 64);
+  });
+
+DGL_REGISTER_GLOBAL("transform._CAPI_DGLWorkspaceResetStats")
+.set_body([] (DGLArgs args, DGLRetValue* rv) {
+    *Workspace::ThreadLocal()->Stats() = WorkspaceStats();
+  });
+
+DGL_REGISTER_GLOBAL("transform._CAPI_DGLWorkspaceRelease")
+.set_body([] (DGLArgs args, DGLRetValue* rv) {
+    Workspace::ThreadLocal()->Release();
+  });
+
+};  // namespace transform
+
+};  // namespace dgl
@@ -0,0 +1,161 @@
+/*!
+ *  Copyright (c) 2022 by Contributors
+ * \file graph/transform/workspace.h
+ * \brief Per-thread scratch space of the CPU relabeling transforms.
+ */
+#ifndef DGL_GRAPH_TRANSFORM_WORKSPACE_H_
+#define DGL_GRAPH_TRANSFORM_WORKSPACE_H_
+
+#include <memory>
+#include <vector>
+#include "../../array/cpu/array_utils.h"
+
+namespace dgl {
+namespace transform {
+
+/*! \brief Memory statistics of the workspace of one thread. */
+struct WorkspaceStats {
+  /*! \brief Number of calls that used the workspace. */
+  int64_t num_calls = 0;
+  /*! \brief Number of bytes allocated by the last call. */
+  int64_t last_bytes_allocated = 0;
+  /*! \brief Number of bytes allocated by all the calls. */
+  int64_t total_bytes_allocated = 0;
+  /*! \brief Number of bytes reused from previous calls by all the calls. */
+  int64_t total_bytes_reused = 0;
+};
+
+/*!
+ * \brief Pool of the ID hash maps used by ToBlock, CompactGraphs and the fused
+ * neighbor sampler on CPU.
+ *
+ * Every IdHashMap owns a 2MB bloom filter and a hash table which grows with the
+ * number of relabeled nodes.  These functions run once per layer per minibatch, so
+ * the maps are kept across calls and cleared instead of being allocated and freed
+ * every time.  There is one workspace per thread, hence no locking.
+ */
+class Workspace {
+ public:
+  /*! \brief Return the workspace of the calling thread. */
+  static Workspace* ThreadLocal() {
+    static thread_local Workspace workspace;
+    return &workspace;
+  }
+
+  /*! \brief Return the pool of hash maps of the given ID type. */
+  template <typename IdType>
+  std::vector<std::unique_ptr<aten::IdHashMap<IdType>>>* Pool();
+
+  /*! \brief Number of hash maps of each ID type currently handed out. */
+  template <typename IdType>
+  size_t* NumInUse();
+
+  WorkspaceStats* Stats() {
+    return &stats_;
+  }
+
+  /*! \brief Free the hash maps that are not in use. */
+  void Release() {
+    pool32_.resize(in_use32_);
+    pool64_.resize(in_use64_);
+  }
+
+  /*! \brief Number of bytes held by the hash maps. */
+  int64_t NumBytes() const {
+    int64_t nbytes = 0;
+    for (const auto& map : pool32_)
+      nbytes += map->NumBytes();
+    for (const auto& map : pool64_)
+      nbytes += map->NumBytes();
+    return nbytes;
+  }
+
+ private:
+  std::vector<std::unique_ptr<aten::IdHashMap<int32_t>>> pool32_;
+  std::vector<std::unique_ptr<aten::IdHashMap<int64_t>>> pool64_;
+  size_t in_use32_ = 0;
+  size_t in_use64_ = 0;
+  WorkspaceStats stats_;
+};
+
+template <>
+inline std::vector<std::unique_ptr<aten::IdHashMap<int32_t>>>* Workspace::Pool<int32_t>() {
+  return &pool32_;
+}
+
+template <>
+inline std::vector<std::unique_ptr<aten::IdHashMap<int64_t>>>* Workspace::Pool<int64_t>() {
+  return &pool64_;
+}
+
+template <>
+inline size_t* Workspace::NumInUse<int32_t>() {
+  return &in_use32_;
+}
+
+template <>
+inline size_t* Workspace::NumInUse<int64_t>() {
+  return &in_use64_;
+}
+
+/*!
+ * \brief Empty hash maps taken from the workspace of the calling thread for the
+ * duration of one call.
+ *
+ * The maps are returned to the workspace, and the bytes allocated by the call are
+ * recorded, when the object is destroyed.
+ */
+template <typename IdType>
+class ScopedHashMaps {
+ public:
+  explicit ScopedHashMaps(size_t num_maps)
+    : workspace_(Workspace::ThreadLocal()), num_maps_(num_maps) {
+    auto* pool = workspace_->Pool<IdType>();
+    size_t* in_use = workspace_->NumInUse<IdType>();
+    begin_ = *in_use;
+    while (pool->size() < begin_ + num_maps_)
+      pool->emplace_back(nullptr);
+    for (size_t i = begin_; i < begin_ + num_maps_; ++i) {
+      if ((*pool)[i]) {
+        (*pool)[i]->Clear();
+        bytes_reused_ += (*pool)[i]->NumBytes();
+      } else {
+        (*pool)[i].reset(new aten::IdHashMap<IdType>());
+      }
+    }
+    *in_use = begin_ + num_maps_;
+  }
+
+  ~ScopedHashMaps() {
+    auto* pool = workspace_->Pool<IdType>();
+    int64_t nbytes = 0;
+    for (size_t i = begin_; i < begin_ + num_maps_; ++i)
+      nbytes += (*pool)[i]->NumBytes();
+    *workspace_->NumInUse<IdType>() = begin_;
+
+    WorkspaceStats* stats = workspace_->Stats();
+    ++stats->num_calls;
+    stats->last_bytes_allocated = nbytes - bytes_reused_;
+    stats->total_bytes_allocated += nbytes - bytes_reused_;
+    stats->total_bytes_reused += bytes_reused_;
+  }
+
+  aten::IdHashMap<IdType>& operator[](size_t i) {
+    return *(*workspace_->Pool<IdType>())[begin_ + i];
+  }
+
+  size_t size() const {
+    return num_maps_;
+  }
+
+ private:
+  Workspace* workspace_;
+  size_t num_maps_;
+  size_t begin_;
+  int64_t bytes_reused_ = 0;
+};
+
+}  // namespace transform
+}  // namespace dgl
+
+#endif  // DGL_GRAPH_TRANSFORM_WORKSPACE_H_
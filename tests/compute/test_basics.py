@@ -672,3 +672,25 @@ def test_issue_2484(idtype):
     y2 = g.ndata['x']
 
     assert F.allclose(y1, y2)
+
+def test_lazy_import():
+    import subprocess
+    import sys
+    # Heavy subpackages are not loaded by ``import dgl`` but on first access.
+    code = ('import sys, dgl; '
+            'assert "dgl.distributed" not in sys.modules; '
+            'assert "dgl.dataloading" not in sys.modules; '
+            'assert "dgl.data" not in sys.modules; '
+            'assert dgl.distributed.DistGraph is not None; '
+            'assert "dgl.distributed" in sys.modules; '
+            'assert dgl.save_graphs is dgl.data.utils.save_graphs; '
+            'assert "nn" in dir(dgl)')
+    subprocess.check_call([sys.executable, '-c', code])
+    assert dgl.dataloading.set_node_lazy_features is dgl.set_node_lazy_features
+    assert dgl.DGLGraphStale is dgl._deprecate.graph.DGLGraph
+    try:
+        dgl.no_such_attribute
+        fail = True
+    except AttributeError:
+        fail = False
+    assert not fail
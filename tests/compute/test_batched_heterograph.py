@@ -375,6 +375,53 @@ def test_slice_batch(idtype):
                 for feat in g_i.edges[ety].data:
                     assert F.allclose(g_i.edges[ety].data[feat], g_slice.edges[ety].data[feat])
 
+        # ranges of graphs
+        for start, stop in [(0, 2), (1, 3), (0, 3)]:
+            g_slice = dgl.slice_batch(bg, slice(start, stop))
+            expected = dgl.batch(g_list[start:stop])
+            assert g_slice.batch_size == stop - start
+            for nty in expected.ntypes:
+                assert F.array_equal(g_slice.batch_num_nodes(nty), expected.batch_num_nodes(nty))
+            for ety in expected.canonical_etypes:
+                assert F.array_equal(g_slice.batch_num_edges(ety), expected.batch_num_edges(ety))
+                for u, v in zip(g_slice.edges(etype=ety), expected.edges(etype=ety)):
+                    assert F.array_equal(u, v)
+        g_slice = dgl.slice_batch(bg, range(1, 3))
+        for i, g_i in enumerate(dgl.unbatch(g_slice)):
+            check_graph_equal(g_i, dgl.slice_batch(bg, i + 1))
+
+
+@parametrize_idtype
+def test_unbatch_lazy(idtype):
+    g1 = dgl.graph(([0, 1, 2], [1, 2, 3]), idtype=idtype, device=F.ctx())
+    g2 = dgl.graph(([0, 0, 0, 1], [0, 1, 2, 0]), idtype=idtype, device=F.ctx())
+    g3 = dgl.graph(([0], [1]), idtype=idtype, device=F.ctx())
+    bg = dgl.batch([g1, g2, g3])
+    bg.ndata['h'] = F.randn((bg.num_nodes(), 2))
+    bg.edata['w'] = F.randn((bg.num_edges(), 3))
+
+    gs = dgl.unbatch(bg, lazy=True)
+    assert len(gs) == 3
+    for g_lazy, g in zip(gs, dgl.unbatch(bg)):
+        check_graph_equal(g_lazy, g)
+    check_graph_equal(gs[-1], gs[2])
+    assert gs[1] is gs[1]
+    assert len(gs[1:]) == 2
+    with pytest.raises(IndexError):
+        gs[3]
+
+    # mutating an unbatched graph does not change the batched graph
+    gs[0].ndata['h'] = F.zeros((4, 2))
+    gs[0].add_edges(0, 3)
+    assert bg.num_edges() == 8
+    assert not F.allclose(F.narrow_row(bg.ndata['h'], 0, 4), F.zeros((4, 2)))
+
+    # with provided split arguments
+    gs = dgl.unbatch(bg, F.tensor([4, 5]), F.tensor([3, 5]), lazy=True)
+    assert len(gs) == 2
+    assert gs[1].num_nodes() == 5
+    assert gs[1].num_edges() == 5
+
 
 @parametrize_idtype
 def test_batch_keeps_empty_data(idtype):
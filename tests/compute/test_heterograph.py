@@ -4,6 +4,7 @@ from collections import Counter
 import numpy as np
 import scipy.sparse as ssp
 import itertools
+import pickle
 import backend as F
 import networkx as nx
 import unittest, pytest
@@ -834,6 +835,41 @@ def test_view1(idtype):
     assert F.array_equal(f3, f4)
     assert F.array_equal(g.edges(form='eid'), F.arange(0, 2, g.idtype))
 
+@parametrize_idtype
+def test_relation_cache(idtype):
+    g = create_test_heterograph(idtype)
+    for _ in range(3):
+        sg = g['plays']
+    assert g.relation_cache_info() == {'hits': 2, 'misses': 1, 'size': 1}
+    assert sg.number_of_edges() == 4
+
+    # slices share the frames of the current graph
+    sg.nodes['user'].data['h'] = F.ones((3, 2))
+    assert F.array_equal(g.nodes['user'].data['h'], F.ones((3, 2)))
+    with g.local_scope():
+        g.nodes['game'].data['x'] = F.zeros((2, 3))
+        assert 'x' in g['plays'].nodes['game'].data
+    assert 'x' not in g['plays'].nodes['game'].data
+
+    # multiple relations
+    fg1 = g['user', :, 'game']
+    fg2 = g['user', :, 'game']
+    assert fg1.number_of_edges() == fg2.number_of_edges() == 6
+    assert g.relation_cache_info()['hits'] == 5
+
+    # structural changes clear the cache
+    g.add_edges(F.tensor([2], dtype=idtype), F.tensor([0], dtype=idtype), etype='plays')
+    assert g.relation_cache_info() == {'hits': 0, 'misses': 0, 'size': 0}
+    assert g['plays'].number_of_edges() == 5
+    g.remove_edges(F.tensor([0], dtype=idtype), etype='plays')
+    assert g['plays'].number_of_edges() == 4
+    assert g.relation_cache_info()['misses'] == 1
+
+    # the cache is not pickled
+    g2 = pickle.loads(pickle.dumps(g))
+    assert '_relation_cache' not in g2.__dict__
+    assert g2['plays'].number_of_edges() == 4
+
 @parametrize_idtype
 def test_flatten(idtype):
     def check_mapping(g, fg):
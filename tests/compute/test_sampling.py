@@ -240,6 +240,44 @@ def test_pinsage_sampling(use_uva):
         if g.is_pinned():
             g.unpin_memory_()
 
+@unittest.skipIf(F._default_context_str == 'gpu', reason="GPU uses the random walk path")
+@pytest.mark.parametrize('idtype', [F.int32, F.int64])
+def test_pinsage_sampling_native(idtype):
+    # The walks on a directed cycle are deterministic without termination.
+    g = dgl.graph(([0, 1, 2, 3, 4], [1, 2, 3, 4, 0]), idtype=idtype)
+    seeds = F.tensor([0, 3, 0], dtype=idtype)
+    sampler = dgl.sampling.RandomWalkNeighborSampler(g, 3, 0., 2, 2)
+    src, dst, counts = dgl.sampling.pinsage._pinsage_neighbors(
+        g, seeds, sampler._full_metapath_ids, sampler.restart_prob, 2, 1, 2)
+    # Every seed visits the next three nodes twice; ties go to the larger ID.
+    assert F.array_equal(src, F.tensor([3, 2, 4, 1, 3, 2], dtype=idtype))
+    assert F.array_equal(dst, F.tensor([0, 0, 3, 3, 0, 0], dtype=idtype))
+    assert F.array_equal(counts, F.tensor([2, 2, 2, 2, 2, 2], dtype=idtype))
+
+    paths, _ = dgl.sampling.random_walk(
+        g, F.repeat(seeds, 2, 0), metapath=sampler.full_metapath,
+        restart_prob=sampler.restart_prob)
+    expected = dgl.sampling.pinsage._select_pinsage_neighbors(
+        F.reshape(paths[:, 1:], (-1,)), F.repeat(paths[:, 0], 3, 0), 6, 2)
+    for x, y in zip((src, dst, counts), expected):
+        assert F.array_equal(x, y)
+
+    # Metapaths with several hops only count the end of each traversal.
+    g = dgl.heterograph({
+        ('A', 'AB', 'B'): ([0, 1], [0, 1]),
+        ('B', 'BA', 'A'): ([0, 1], [1, 0])}, idtype=idtype)
+    sampler = dgl.sampling.PinSAGESampler(g, 'A', 'B', 3, 0., 4, 5)
+    frontier = sampler(F.tensor([0], dtype=idtype))
+    u, v = frontier.edges(order='eid')
+    assert F.array_equal(u, F.tensor([1, 0], dtype=idtype))
+    assert F.array_equal(v, F.tensor([0, 0], dtype=idtype))
+    assert F.array_equal(frontier.edata['weights'], F.tensor([8, 4], dtype=idtype))
+
+    # The walks always terminate after the first traversal.
+    sampler = dgl.sampling.PinSAGESampler(g, 'A', 'B', 3, 1., 4, 5)
+    frontier = sampler(F.tensor([0], dtype=idtype))
+    assert F.array_equal(frontier.edata['weights'], F.tensor([4], dtype=idtype))
+
 def _gen_neighbor_sampling_test_graph(hypersparse, reverse):
     if hypersparse:
         # should crash if allocated a CSR
@@ -950,6 +988,79 @@ def test_sample_neighbors_exclude_edges_homoG(dtype):
 
     assert not np.any(F.asnumpy(sg.has_edges_between(excluded_nodes_U,excluded_nodes_V)))
 
+def _check_neighbor_blocks(g, seeds, blocks, fanouts, exclude_edges=None):
+    for i, block in enumerate(blocks):
+        for ntype in g.ntypes:
+            src = F.asnumpy(block.srcnodes[ntype].data[dgl.NID])
+            dst = F.asnumpy(block.dstnodes[ntype].data[dgl.NID])
+            # destination nodes come first among the source nodes
+            assert np.array_equal(src[:len(dst)], dst)
+            if i + 1 < len(blocks):
+                next_src = F.asnumpy(blocks[i + 1].srcnodes[ntype].data[dgl.NID])
+                assert np.array_equal(dst, next_src)
+            else:
+                assert np.array_equal(dst, F.asnumpy(seeds.get(ntype, F.tensor([], g.idtype))))
+        for etype in g.canonical_etypes:
+            u, v = block.edges(etype=etype)
+            if len(u) == 0:
+                continue
+            srctype, _, dsttype = etype
+            eid = block.edges[etype].data[dgl.EID]
+            gu, gv = g.find_edges(eid, etype=etype)
+            assert F.array_equal(
+                gu, F.gather_row(block.srcnodes[srctype].data[dgl.NID], F.astype(u, F.int64)))
+            assert F.array_equal(
+                gv, F.gather_row(block.dstnodes[dsttype].data[dgl.NID], F.astype(v, F.int64)))
+            fanout = fanouts[i] if not isinstance(fanouts[i], dict) else fanouts[i][etype]
+            if fanout >= 0:
+                assert F.asnumpy(block.in_degrees(etype=etype)).max() <= fanout
+            if exclude_edges is not None and etype in exclude_edges:
+                assert not np.isin(F.asnumpy(eid), F.asnumpy(exclude_edges[etype])).any()
+
+@pytest.mark.parametrize('dtype', ['int32', 'int64'])
+@unittest.skipIf(F._default_context_str == 'gpu', reason="GPU fused neighbor sampling not implemented")
+def test_sample_neighbor_blocks(dtype):
+    g = dgl.rand_graph(100, 1000, idtype=getattr(F, dtype))
+    seeds = F.tensor([0, 3, 5, 7], getattr(F, dtype))
+
+    # sampling all neighbors is deterministic and must match the per-layer path
+    blocks = dgl.sampling.sample_neighbor_blocks(g, seeds, [-1, -1, -1])
+    nodes = seeds
+    for i in reversed(range(3)):
+        frontier = dgl.sampling.sample_neighbors(g, nodes, -1)
+        block = dgl.to_block(frontier, nodes)
+        assert F.array_equal(block.srcdata[dgl.NID], blocks[i].srcdata[dgl.NID])
+        assert F.array_equal(block.dstdata[dgl.NID], blocks[i].dstdata[dgl.NID])
+        assert F.array_equal(frontier.edata[dgl.EID], blocks[i].edata[dgl.EID])
+        for a, b in zip(block.edges(), blocks[i].edges()):
+            assert F.array_equal(a, b)
+        nodes = block.srcdata[dgl.NID]
+    _check_neighbor_blocks(g, {'_N': seeds}, blocks, [-1, -1, -1])
+
+    g.edata['p'] = F.tensor(np.random.rand(1000), F.float32)
+    for prob, replace in [(None, False), (None, True), ('p', False)]:
+        blocks = dgl.sampling.sample_neighbor_blocks(
+            g, seeds, [5, 3], prob=prob, replace=replace)
+        _check_neighbor_blocks(g, {'_N': seeds}, blocks, [5, 3])
+
+    hg = dgl.heterograph({
+        ('user', 'follow', 'user'): (np.random.randint(0, 30, 200), np.random.randint(0, 30, 200)),
+        ('user', 'play', 'game'): (np.random.randint(0, 30, 200), np.random.randint(0, 20, 200)),
+        ('game', 'played-by', 'user'): (np.random.randint(0, 20, 200), np.random.randint(0, 30, 200))},
+        idtype=getattr(F, dtype))
+    hg.nodes['user'].data['h'] = F.randn((30, 4))
+    seeds = {'game': F.tensor([1, 2], getattr(F, dtype))}
+    fanouts = [{etype: 2 for etype in hg.canonical_etypes},
+               {('user', 'follow', 'user'): -1, ('user', 'play', 'game'): 3,
+                ('game', 'played-by', 'user'): 0}]
+    exclude = {('user', 'follow', 'user'): F.arange(0, 100, getattr(F, dtype))}
+    blocks = dgl.sampling.sample_neighbor_blocks(hg, seeds, fanouts, exclude_edges=exclude)
+    _check_neighbor_blocks(hg, seeds, blocks, fanouts, exclude)
+    assert F.array_equal(
+        blocks[0].srcnodes['user'].data['h'],
+        F.gather_row(hg.nodes['user'].data['h'],
+                     F.astype(blocks[0].srcnodes['user'].data[dgl.NID], F.int64)))
+
 @pytest.mark.parametrize('dtype', ['int32', 'int64'])
 def test_global_uniform_negative_sampling(dtype):
     g = dgl.graph(([], []), num_nodes=1000).to(F.ctx())
@@ -1002,5 +1113,6 @@ if __name__ == '__main__':
     test_sample_neighbors_biased_bipartite()
     test_sample_neighbors_exclude_edges_heteroG('int32')
     test_sample_neighbors_exclude_edges_homoG('int32')
+    test_sample_neighbor_blocks('int32')
     test_global_uniform_negative_sampling('int32')
     test_global_uniform_negative_sampling('int64')
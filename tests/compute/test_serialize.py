@@ -316,6 +316,50 @@ def test_serialize_heterograph():
 
     os.unlink(path)
 
+@unittest.skipIf(F._default_context_str == 'gpu', reason="GPU not implemented")
+@pytest.mark.parametrize('mmap', [True, False])
+def test_serialize_mmap(mmap):
+    f = tempfile.NamedTemporaryFile(delete=False)
+    path = f.name
+    f.close()
+    g_list0 = create_heterographs2(F.int64) + create_heterographs2(F.int32)
+    labels0 = {"label": F.tensor(np.arange(len(g_list0)))}
+    dgl.save_graphs(path, g_list0, labels0, mmap=True)
+
+    g_list, labels = dgl.load_graphs(path, mmap=mmap)
+    assert len(g_list) == len(g_list0)
+    assert np.array_equal(F.asnumpy(labels["label"]), F.asnumpy(labels0["label"]))
+    assert np.array_equal(F.asnumpy(load_labels(path)["label"]),
+                          F.asnumpy(labels0["label"]))
+    for g, g0 in zip(g_list, g_list0):
+        assert g.idtype == g0.idtype
+        assert g.ntypes == g0.ntypes
+        assert g.canonical_etypes == g0.canonical_etypes
+        assert sorted(sum(g.formats().values(), [])) == sorted(sum(g0.formats().values(), []))
+        for ntype in g0.ntypes:
+            assert g.number_of_nodes(ntype) == g0.number_of_nodes(ntype)
+            for key, value in g0.nodes[ntype].data.items():
+                assert F.allclose(g.nodes[ntype].data[key], value)
+        for etype in g0.canonical_etypes:
+            src, dst = g.edges(etype=etype)
+            src0, dst0 = g0.edges(etype=etype)
+            assert F.array_equal(src, src0)
+            assert F.array_equal(dst, dst0)
+            for key, value in g0.edges[etype].data.items():
+                assert F.allclose(g.edges[etype].data[key], value)
+
+    # Load a subset of graphs through the offset table.
+    g_list, _ = dgl.load_graphs(path, [6, 1], mmap=mmap)
+    assert g_list[0].idtype == F.int32
+    assert g_list[0].canonical_etypes == g_list0[6].canonical_etypes
+    assert F.allclose(g_list[1].edata['w'], g_list0[1].edata['w'])
+
+    # Files in the default format cannot be memory-mapped.
+    dgl.save_graphs(path, g_list0)
+    with pytest.raises(dgl.DGLError):
+        dgl.load_graphs(path, mmap=True)
+    os.unlink(path)
+
 @unittest.skipIf(F._default_context_str == 'gpu', reason="GPU not implemented")
 @pytest.mark.skip(reason="lack of permission on CI")
 def test_serialize_heterograph_s3():
@@ -303,6 +303,56 @@ def test_spmv_3d_feat(idtype):
     g.update_all(message_func=src_mul_edge_udf, reduce_func=sum_udf) # 3
     assert F.allclose(g.ndata['h'], ans)
 
+@parametrize_idtype
+def test_padded_udf_reduce(idtype):
+    # in-degrees vary from 0 to 30
+    src = np.concatenate([np.random.randint(0, 40, d) for d in range(31)])
+    dst = np.concatenate([np.full(d, d) for d in range(31)])
+    perm = np.random.permutation(len(src))
+    g = dgl.graph((src[perm], dst[perm]), num_nodes=40, idtype=idtype, device=F.ctx())
+    g.ndata['h'] = F.randn((40, D))
+    g.edata['w'] = F.randn((g.num_edges(), 1))
+
+    def message_func(edges):
+        return {'m': edges.src['h'] * edges.data['w']}
+
+    def reduce_func(nodes):
+        # sensitive to the order of the messages
+        deg = F.shape(nodes.mailbox['m'])[1]
+        pos = F.copy_to(F.reshape(F.arange(1, deg + 1), (1, deg, 1)), F.ctx())
+        return {'h': F.sum(nodes.mailbox['m'] * F.astype(pos, F.float32), 1)}
+
+    def masked_max(nodes):
+        assert F.shape(nodes.mailbox_mask) == F.shape(nodes.mailbox['m'])[:2]
+        mask = F.unsqueeze(F.astype(nodes.mailbox_mask, F.float32), 2)
+        return {'h': F.max(nodes.mailbox['m'] * mask - 1e6 * (1 - mask), 1)}
+
+    h = g.ndata['h']
+    for bucketing in ['pow2', 'none']:
+        g.ndata['h'] = h
+        g.update_all(message_func, reduce_func)
+        expected = g.ndata['h']
+        g.ndata['h'] = h
+        g.update_all(message_func, dgl.udf.padded_reduce(reduce_func, bucketing))
+        assert F.allclose(g.ndata['h'], expected)
+
+        g.ndata['h'] = h
+        g.update_all(message_func, fn.max('m', 'h'))
+        expected = g.ndata['h']
+        g.ndata['h'] = h
+        g.update_all(message_func, dgl.udf.padded_reduce(masked_max, bucketing))
+        assert F.allclose(g.ndata['h'], expected)
+
+        # message passing on a subset of edges
+        eids = F.copy_to(F.tensor(np.random.choice(g.num_edges(), 100, replace=False),
+                                  idtype), F.ctx())
+        g.ndata['h'] = h
+        g.send_and_recv(eids, message_func, reduce_func)
+        expected = g.ndata['h']
+        g.ndata['h'] = h
+        g.send_and_recv(eids, message_func, dgl.udf.padded_reduce(reduce_func, bucketing))
+        assert F.allclose(g.ndata['h'], expected)
+
 if __name__ == '__main__':
     test_v2v_update_all()
     test_v2v_snr()
@@ -315,3 +365,4 @@ if __name__ == '__main__':
     test_update_all_multi_fallback()
     test_pull_multi_fallback()
     test_spmv_3d_feat()
+    test_padded_udf_reduce(F.int64)
@@ -1007,6 +1007,37 @@ def test_to_block(idtype):
     check_features(g, bg)
 
 
+@unittest.skipIf(F._default_context_str == 'gpu', reason="GPU does not use the workspace")
+@parametrize_idtype
+def test_transform_workspace(idtype):
+    g = dgl.rand_graph(100, 500, idtype=idtype)
+    dst = F.tensor([0, 1, 2, 3], idtype)
+    workspace = dgl.transforms.workspace
+    workspace.release()
+    workspace.reset_stats()
+    expected = dgl.to_block(g, dst)
+    stats = workspace.stats()
+    assert stats['num_calls'] == 1
+    assert stats['last_bytes_allocated'] > 0
+    assert stats['bytes_held'] >= stats['last_bytes_allocated']
+
+    # the same call again reuses the hash maps and gives the same result
+    block = dgl.to_block(g, dst)
+    stats = workspace.stats()
+    assert stats['num_calls'] == 2
+    assert stats['last_bytes_allocated'] == 0
+    assert stats['total_bytes_reused'] > 0
+    assert F.array_equal(block.srcdata[dgl.NID], expected.srcdata[dgl.NID])
+    for a, b in zip(block.edges(), expected.edges()):
+        assert F.array_equal(a, b)
+
+    dgl.compact_graphs(g)
+    dgl.to_block(g, dst, include_dst_in_src=False)
+    assert workspace.stats()['num_calls'] == 4
+
+    workspace.release()
+    assert workspace.stats()['bytes_held'] == 0
+
 @unittest.skipIf(F._default_context_str == 'gpu', reason="GPU not implemented")
 @parametrize_idtype
 def test_remove_edges(idtype):
@@ -2491,5 +2522,6 @@ def test_module_feat_mask(idtype):
     assert g.edata['w'][('player', 'plays', 'game')].shape == (2, 5)
 
 if __name__ == '__main__':
+    test_transform_workspace(F.int64)
     test_partition_with_halo()
     test_module_heat_kernel(F.int32)
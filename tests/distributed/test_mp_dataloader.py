@@ -47,6 +47,9 @@ def start_server(rank, tmpdir, disable_shared_mem, num_clients, keep_alive=False
     g.start()
 
 
+def _collate_seeds(seeds):
+    return F.tensor(np.asarray(seeds))
+
 def start_dist_dataloader(rank, tmpdir, num_server, drop_last, orig_nid, orig_eid, group_id=0):
     import dgl
     import torch as th
@@ -98,7 +101,27 @@ def start_dist_dataloader(rank, tmpdir, num_server, drop_last, orig_nid, orig_ei
                 assert np.max(max_nid) == num_nodes_to_sample - 1 - num_nodes_to_sample % batch_size
             else:
                 assert np.max(max_nid) == num_nodes_to_sample - 1
+
+    # Two dataloaders sharing the sampler pool can be consumed in an interleaved way.
+    dataloader2 = DistDataLoader(
+        dataset=train_nid.numpy(),
+        batch_size=batch_size,
+        collate_fn=_collate_seeds,
+        shuffle=False,
+        drop_last=drop_last)
+    seeds = []
+    for blocks, batch in zip(dataloader, dataloader2):
+        assert isinstance(blocks, list)
+        seeds.append(F.asnumpy(batch))
+    assert np.all(np.sort(np.concatenate(seeds)) == np.arange(len(np.concatenate(seeds))))
+    pool, num_workers = dgl.distributed.dist_context.get_sampler_pool()
+    if pool is not None:
+        stats = pool.worker_stats()
+        assert len(stats) == num_workers
+        assert all(stat['pending'] >= 0 for stat in stats)
+        assert sum(stat['completed'] for stat in stats) > 0
     del dataloader
+    del dataloader2
     dgl.distributed.exit_client() # this is needed since there's two test here in one process
 
 @unittest.skipIf(os.name == 'nt', reason='Do not support windows yet')
@@ -122,6 +145,58 @@ def test_standalone(tmpdir):
     except Exception as e:
         print(e)
 
+@pytest.mark.parametrize("shuffle", [True, False])
+@pytest.mark.parametrize("drop_last", [True, False])
+def test_dataloader_batches(shuffle, drop_last):
+    reset_envs()
+    nids = F.arange(0, 103)
+    dataloader = DistDataLoader(nids, 10, shuffle=shuffle, drop_last=drop_last,
+                                collate_fn=lambda x: x)
+    for _ in range(2):
+        batches = list(dataloader)
+        assert len(batches) == (10 if drop_last else 11)
+        assert all(isinstance(batch, np.ndarray) for batch in batches)
+        seeds = np.concatenate(batches)
+        assert len(np.unique(seeds)) == len(seeds)
+        if not shuffle:
+            assert np.all(seeds == np.arange(len(seeds)))
+        elif not drop_last:
+            assert np.all(np.sort(seeds) == np.arange(103))
+
+@pytest.mark.parametrize("shuffle", [True, False])
+@pytest.mark.parametrize("drop_last", [True, False])
+@pytest.mark.parametrize("flattened", [True, False])
+def test_dataloader_dict_batches(shuffle, drop_last, flattened):
+    # Heterogeneous seeds are sliced into dicts of IDs.
+    reset_envs()
+    nids = {'n1': F.arange(0, 50), 'n2': F.arange(100, 153)}
+    dataset = dgl.utils.FlattenedDict(nids) if flattened else nids
+    dataloader = DistDataLoader(dataset, 10, shuffle=shuffle, drop_last=drop_last,
+                                collate_fn=lambda x: x)
+    for _ in range(2):
+        batches = list(dataloader)
+        assert len(batches) == (10 if drop_last else 11)
+        assert all(isinstance(batch, dict) for batch in batches)
+        assert all(sum(len(ids) for ids in batch.values()) == 10 for batch in batches[:10])
+        assert all(len(ids) > 0 for batch in batches for ids in batch.values())
+        seeds = {ntype: np.concatenate([batch[ntype] for batch in batches if ntype in batch])
+                 for ntype in nids}
+        # Every ID is in the group of its own type and appears at most once per epoch.
+        assert np.all(np.isin(seeds['n1'], F.asnumpy(nids['n1'])))
+        assert np.all(np.isin(seeds['n2'], F.asnumpy(nids['n2'])))
+        for ntype in nids:
+            assert len(np.unique(seeds[ntype])) == len(seeds[ntype])
+        assert sum(len(ids) for ids in seeds.values()) == (100 if drop_last else 103)
+        if not drop_last:
+            for ntype in nids:
+                assert np.all(np.sort(seeds[ntype]) == F.asnumpy(nids[ntype]))
+        if not shuffle:
+            # Without shuffling the IDs are visited in the order of the dataset.
+            order = np.concatenate([np.concatenate([batch.get(ntype, []) for ntype in nids])
+                                    for batch in batches])
+            assert np.all(order == np.concatenate(
+                [F.asnumpy(nids[ntype]) for ntype in nids])[:len(order)])
+
 def start_dist_neg_dataloader(rank, tmpdir, num_server, num_workers, orig_nid, groundtruth_g):
     import dgl
     import torch as th
@@ -449,10 +524,66 @@ def test_neg_dataloader(tmpdir, num_server, num_workers):
     g = create_random_hetero()
     check_neg_dataloader(g, tmpdir, num_server, num_workers)
 
+@unittest.skipIf(os.name == 'nt', reason='Do not support windows yet')
+def test_shared_mem_ring():
+    from dgl.distributed.dist_context import SharedMemRing, _ShmResult
+    ring = SharedMemRing(mp.get_context('spawn'), 1, 1024 * 1024)
+    # Wait for the queue of free slots to be flushed.
+    time.sleep(1)
+    g = dgl.graph(([0, 1, 2, 3], [1, 2, 3, 0]))
+    g.ndata['h'] = F.randn((4, 3))
+    block = dgl.to_block(g, F.tensor([1, 2]))
+    block.srcdata['x'] = F.randn((block.num_src_nodes(), 5))
+    seeds = F.tensor([1, 2])
+
+    handle = ring.dump((seeds, [block]))
+    assert isinstance(handle, _ShmResult)
+    # The only slot is in use.
+    assert ring.dump(seeds) is seeds
+    seeds1, blocks1 = ring.load(handle)
+    assert F.array_equal(seeds1, seeds)
+    assert blocks1[0].num_src_nodes() == block.num_src_nodes()
+    assert blocks1[0].num_dst_nodes() == block.num_dst_nodes()
+    for u, u1 in zip(block.edges(), blocks1[0].edges()):
+        assert F.array_equal(u, u1)
+    assert F.allclose(blocks1[0].srcdata['x'], block.srcdata['x'])
+    assert F.array_equal(blocks1[0].srcdata[dgl.NID], block.srcdata[dgl.NID])
+
+    # The slot is reused once the result is freed.
+    del handle, seeds1, blocks1
+    time.sleep(1)
+    handle = ring.dump(seeds)
+    assert isinstance(handle, _ShmResult)
+    ring.load(handle)
+    # Results larger than a slot go through the queue.
+    time.sleep(1)
+    large = F.zeros((1024 * 1024,), F.float32)
+    assert ring.dump(large) is large
+
+def test_delete_collate_fn_frees_slots():
+    import collections
+    from dgl.distributed.dist_context import CustomPool, SharedMemRing, _ShmResult
+    ring = SharedMemRing(mp.get_context('spawn'), 1, 1024 * 1024)
+    time.sleep(1)
+    # A pool without workers holding an unconsumed result of a dataloader.
+    pool = CustomPool.__new__(CustomPool)
+    pool.num_workers = 0
+    pool.task_queues = []
+    pool.shm_ring = ring
+    pool.dataloader_names = {'dataloader-0'}
+    handle = ring.dump(F.tensor([1, 2]))
+    assert isinstance(handle, _ShmResult)
+    pool.cache_result_dict = {'dataloader-0': collections.deque([handle])}
+    pool.delete_collate_fn('dataloader-0')
+    # The slot of the dropped result is free again.
+    time.sleep(1)
+    assert isinstance(ring.dump(F.tensor([1, 2])), _ShmResult)
+
 if __name__ == "__main__":
     import tempfile
     with tempfile.TemporaryDirectory() as tmpdirname:
         test_standalone(Path(tmpdirname))
+        test_shared_mem_ring()
         test_dataloader(Path(tmpdirname), 3, 4, 'node')
         test_dataloader(Path(tmpdirname), 3, 4, 'edge')
         test_neg_dataloader(Path(tmpdirname), 3, 4)
@@ -77,6 +77,80 @@ def test_partition_policy():
     assert node_policy.get_part_size() == len(node_map)
     assert edge_policy.get_part_size() == len(edge_map)
 
+@unittest.skipIf(os.name == 'nt' or os.getenv('DGLBACKEND') == 'tensorflow', reason='Do not support windows and TF yet')
+def test_pull_cache():
+    cache = dgl.distributed.kvstore._PullCache(3, (10, 2), F.float32, max_staleness=0.5)
+    rows = F.tensor([[1., 1.], [2., 2.], [3., 3.]], F.float32)
+    cache.insert(np.array([2, 5, 7]), rows)
+    hit, slots = cache.lookup(np.array([5, 1, 7]))
+    assert_array_equal(hit, [True, False, True])
+    assert_array_equal(F.asnumpy(cache.gather(slots)), F.asnumpy(rows)[[1, 2]])
+    # Eviction at capacity removes the least recently used row (2).
+    cache.insert(np.array([9]), F.tensor([[4., 4.]], F.float32))
+    hit, _ = cache.lookup(np.array([2, 5, 7, 9]))
+    assert_array_equal(hit, [False, True, True, True])
+    assert cache.stats()['cached_rows'] == 3
+    # Removal
+    cache.remove(np.array([5, 100]))
+    hit, _ = cache.lookup(np.array([5, 7, 9]))
+    assert_array_equal(hit, [False, True, True])
+    # Expiry after max_staleness
+    time.sleep(0.6)
+    hit, _ = cache.lookup(np.array([7, 9]))
+    assert not hit.any()
+    cache.clear()
+    assert cache.stats()['cached_rows'] == 0
+
+class _RangePolicy(object):
+    """Partition policy placing every 3 consecutive IDs on one machine."""
+    def to_partid(self, id_tensor):
+        return id_tensor // 3
+
+    def to_local(self, id_tensor):
+        return id_tensor % 3
+
+class _CountingKVClient(dgl.distributed.KVClient):
+    """KVClient on machine 0 whose pulls read a local table and record the IDs."""
+    def __init__(self, data):
+        self._data = data
+        self._machine_id = 0
+        self._part_policy = {'data': _RangePolicy()}
+        self._colocated_data = {}
+        self._pending_pulls = {}
+        self._num_pending_pulls = 0
+        self._inflight_pulls = []
+        self._pull_caches = {}
+        self.pulled = []
+
+    def _pull(self, name, id_tensor):
+        self.pulled.append(F.asnumpy(id_tensor))
+        return F.gather_row(self._data, id_tensor)
+
+@unittest.skipIf(os.name == 'nt' or os.getenv('DGLBACKEND') == 'tensorflow', reason='Do not support windows and TF yet')
+def test_pull_with_cache(monkeypatch):
+    data = F.tensor(np.arange(24).reshape(12, 2), F.float32)
+    kvclient = _CountingKVClient(data)
+    kvclient._pull_caches['data'] = dgl.distributed.kvstore._PullCache(2, (12, 2), F.float32)
+    id_tensor = F.tensor([0, 4, 7, 4], F.int64)
+    res = kvclient.pull('data', id_tensor)
+    assert_array_equal(F.asnumpy(res), F.asnumpy(data)[[0, 4, 7, 4]])
+    assert_array_equal(kvclient.pulled[-1], [0, 4, 7, 4])
+    # The remote rows 4 and 7 hit; only the local row is pulled.
+    res = kvclient.pull('data', id_tensor)
+    assert_array_equal(F.asnumpy(res), F.asnumpy(data)[[0, 4, 7, 4]])
+    assert_array_equal(kvclient.pulled[-1], [0])
+    stats = kvclient.cache_stats('data')
+    assert stats['hits'] == 3 and stats['misses'] == 3 and stats['cached_rows'] == 2
+    # Pushing a row removes it from the cache.
+    sent = []
+    monkeypatch.setattr(dgl.distributed.rpc, 'send_request_to_machine',
+                        lambda target, request: sent.append(target))
+    kvclient.push('data', F.tensor([4], F.int64), F.tensor([[0., 0.]], F.float32))
+    assert sent == [1]
+    kvclient.pull('data', F.tensor([4, 7], F.int64))
+    assert_array_equal(kvclient.pulled[-1], [4])
+    assert kvclient.cache_stats('data')['cached_rows'] == 2
+
 def start_server(server_id, num_clients, num_servers):
     # Init kvserver
     print("Sleep 5 seconds to test client re-connect.")
@@ -207,6 +281,35 @@ def start_client(num_clients, num_servers):
     assert_array_equal(F.asnumpy(res), F.asnumpy(data_tensor))
     res = kvclient.pull(name='data_2', id_tensor=id_tensor)
     assert_array_equal(F.asnumpy(res), F.asnumpy(data_tensor))
+    # Test async pull with coalescing
+    kvclient.set_pull_window(3)
+    fut_0 = kvclient.pull_async(name='data_0', id_tensor=id_tensor)
+    fut_1 = kvclient.pull_async(name='data_0', id_tensor=F.tensor([4,0,0], F.int64))
+    fut_2 = kvclient.pull_async(name='data_1', id_tensor=id_tensor)
+    assert_array_equal(F.asnumpy(fut_1.wait()), F.asnumpy(data_tensor))
+    assert_array_equal(F.asnumpy(fut_0.wait()), F.asnumpy(data_tensor))
+    assert_array_equal(F.asnumpy(fut_2.wait()), F.asnumpy(data_tensor))
+    kvclient.set_pull_window(1)
+    # Test async pull of no IDs
+    res = kvclient.pull_async(name='data_0', id_tensor=F.tensor([], F.int64)).wait()
+    assert F.shape(res) == (0,) + F.shape(data_tensor)[1:]
+    assert F.dtype(res) == F.dtype(data_tensor)
+    # Test pull with client-side cache. All the rows are local in this one-part graph,
+    # so nothing is cached.
+    kvclient.enable_cache('data_0', 4)
+    for _ in range(2):
+        res = kvclient.pull(name='data_0', id_tensor=id_tensor)
+        assert_array_equal(F.asnumpy(res), F.asnumpy(data_tensor))
+    stats = kvclient.cache_stats('data_0')
+    assert stats['hits'] == 0 and stats['cached_rows'] == 0
+    kvclient.disable_cache('data_0')
+    assert kvclient.cache_stats('data_0') is None
+    # All the rows are in the local partition.
+    kvclient.reset_pull_stats()
+    res = kvclient.pull(name='data_0', id_tensor=id_tensor)
+    stats = kvclient.pull_stats()
+    assert stats['local'] == len(id_tensor)
+    assert stats['shared_mem'] == 0 and stats['rpc'] == 0
     # Register new push handler
     kvclient.register_push_handler('data_0', udf_push)
     kvclient.register_push_handler('data_1', udf_push)
@@ -320,7 +423,74 @@ def test_kv_multi_role():
     for i in range(num_servers):
         pserver_list[i].join()
 
+colocated_data = F.tensor(np.arange(20).reshape(10, 2), F.float32)
+
+def _colocated_partition_book(part_id):
+    return dgl.distributed.graph_partition_book.RangePartitionBook(
+        part_id, 2, {'_N': F.tensor([[0, 5], [5, 10]], F.int64)},
+        {'_E': F.tensor([[0, 4], [4, 8]], F.int64)}, {'_N': 0}, {'_E': 0})
+
+def start_colocated_server(server_id):
+    kvserver = dgl.distributed.KVServer(server_id=server_id,
+                                        ip_config='kv_ip_colocated_config.txt',
+                                        num_servers=1,
+                                        num_clients=1)
+    gpb = _colocated_partition_book(server_id)
+    kvserver.add_part_policy(dgl.distributed.PartitionPolicy('node:_N', gpb))
+    kvserver.init_data('feat', 'node:_N',
+                       colocated_data[server_id * 5:(server_id + 1) * 5])
+    server_state = dgl.distributed.ServerState(kv_store=kvserver, local_g=None, partition_book=None)
+    dgl.distributed.start_server(server_id=server_id,
+                                 ip_config='kv_ip_colocated_config.txt',
+                                 num_servers=1,
+                                 num_clients=1,
+                                 server_state=server_state)
+
+def start_colocated_client(shm_pull):
+    os.environ['DGL_DIST_MODE'] = 'distributed'
+    os.environ['DGL_KVSTORE_SHM_PULL'] = shm_pull
+    dgl.distributed.initialize(ip_config='kv_ip_colocated_config.txt')
+    kvclient = dgl.distributed.KVClient(ip_config='kv_ip_colocated_config.txt', num_servers=1)
+    kvclient.map_shared_data(partition_book=_colocated_partition_book(0))
+    # Both partitions are hosted by this machine.
+    assert ('feat' in kvclient._colocated_data) == (shm_pull == '1')
+    id_tensor = F.tensor([9, 0, 5, 4, 7, 7, 2], F.int64)
+    expected = F.asnumpy(colocated_data)[F.asnumpy(id_tensor)]
+    kvclient.reset_pull_stats()
+    assert_array_equal(F.asnumpy(kvclient.pull(name='feat', id_tensor=id_tensor)), expected)
+    stats = kvclient.pull_stats()
+    assert stats['local'] == 3
+    if shm_pull == '1':
+        assert stats['shared_mem'] == 4 and stats['rpc'] == 0
+    else:
+        assert stats['shared_mem'] == 0 and stats['rpc'] == 4
+    res = kvclient.pull_async(name='feat', id_tensor=id_tensor).wait()
+    assert_array_equal(F.asnumpy(res), expected)
+    dgl.distributed.exit_client()
+
+@unittest.skipIf(os.name == 'nt' or os.getenv('DGLBACKEND') == 'tensorflow', reason='Do not support windows and TF yet')
+def test_kv_colocated_partitions():
+    # Two partitions on one machine; the client on partition 0 reads partition 1
+    # from shared memory, or through RPC if DGL_KVSTORE_SHM_PULL is 0.
+    for shm_pull in ['1', '0']:
+        reset_envs()
+        generate_ip_config("kv_ip_colocated_config.txt", 2, 1)
+        ctx = mp.get_context('spawn')
+        os.environ['DGL_NUM_SERVER'] = '1'
+        pserver_list = []
+        for i in range(2):
+            pserver = ctx.Process(target=start_colocated_server, args=(i,))
+            pserver.start()
+            pserver_list.append(pserver)
+        pclient = ctx.Process(target=start_colocated_client, args=(shm_pull,))
+        pclient.start()
+        pclient.join()
+        assert pclient.exitcode == 0
+        for pserver in pserver_list:
+            pserver.join()
+
 if __name__ == '__main__':
     test_partition_policy()
     test_kv_store()
     test_kv_multi_role()
+    test_kv_colocated_partitions()
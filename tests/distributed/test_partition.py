@@ -5,10 +5,11 @@ import numpy as np
 from scipy import sparse as spsp
 from numpy.testing import assert_array_equal
 from dgl.heterograph_index import create_unitgraph_from_coo
-from dgl.distributed import partition_graph, load_partition
+from dgl.distributed import partition_graph, partition_graph_streaming, load_partition
 from dgl import function as fn
 import backend as F
 import unittest
+import pytest
 import pickle
 import random
 import tempfile
@@ -122,6 +123,8 @@ def verify_hetero_graph(g, parts):
     # TODO(zhengda) this doesn't check 'part_id'
 
 def verify_graph_feats(g, gpb, part, node_feats, edge_feats):
+    typed_nids = {}
+    homo_nids = []
     for ntype in g.ntypes:
         ntype_id = g.get_ntype_id(ntype)
         inner_node_mask = _get_inner_node_mask(part, ntype_id)
@@ -130,6 +133,10 @@ def verify_graph_feats(g, gpb, part, node_feats, edge_feats):
         partid = gpb.nid2partid(inner_type_nids, ntype)
         assert np.all(F.asnumpy(ntype_ids) == ntype_id)
         assert np.all(F.asnumpy(partid) == gpb.partid)
+        assert np.all(F.asnumpy(gpb.map_to_homo_nid(inner_type_nids, ntype))
+                      == F.asnumpy(inner_nids))
+        typed_nids[ntype] = inner_type_nids
+        homo_nids.append(inner_nids)
 
         orig_id = F.boolean_mask(part.ndata['orig_id'], inner_node_mask)
         local_nids = gpb.nid2localnid(inner_type_nids, gpb.partid, ntype)
@@ -141,6 +148,10 @@ def verify_graph_feats(g, gpb, part, node_feats, edge_feats):
             ndata = F.gather_row(node_feats[ntype + '/' + name], local_nids)
             assert np.all(F.asnumpy(ndata == true_feats))
 
+    # Map all the node types in one call.
+    assert np.all(F.asnumpy(gpb.map_to_homo_nids(typed_nids))
+                  == F.asnumpy(F.cat(homo_nids, 0)))
+
     for etype in g.etypes:
         etype_id = g.get_etype_id(etype)
         inner_edge_mask = _get_inner_edge_mask(part, etype_id)
@@ -415,7 +426,81 @@ def test_hetero_partition():
     check_hetero_partition(hg, 'random')
 
 
+@unittest.skipIf(os.name == 'nt', reason='Do not support windows yet')
+def test_partition_streaming():
+    g = create_random_graph(1000)
+    src, dst = g.edges()
+    src, dst = F.asnumpy(src), F.asnumpy(dst)
+    nfeats = np.random.randn(g.number_of_nodes(), 10).astype(np.float32)
+    efeats = np.random.randn(g.number_of_edges(), 4).astype(np.float32)
+    num_parts = 4
+    node_parts = np.random.randint(0, num_parts, g.number_of_nodes())
+
+    with tempfile.TemporaryDirectory() as test_dir:
+        np.save(os.path.join(test_dir, 'src.npy'), src)
+        np.save(os.path.join(test_dir, 'dst.npy'), dst)
+        np.save(os.path.join(test_dir, 'efeats.npy'), efeats)
+        # Use a small chunk size so that the input is read in many chunks.
+        partition_graph_streaming((os.path.join(test_dir, 'src.npy'),
+                                   os.path.join(test_dir, 'dst.npy')),
+                                  g.number_of_nodes(), 'test', num_parts, test_dir,
+                                  node_feats={'feats': nfeats},
+                                  edge_feats={'feats': os.path.join(test_dir, 'efeats.npy')},
+                                  node_parts=node_parts, part_method='custom', chunk_size=100)
+        num_inner_edges = 0
+        for i in range(num_parts):
+            part_g, node_feats, edge_feats, gpb, _, ntypes, etypes = load_partition(
+                os.path.join(test_dir, 'test.json'), i)
+            assert gpb._num_nodes() == g.number_of_nodes()
+            assert gpb._num_edges() == g.number_of_edges()
+            assert ntypes == ['_N'] and etypes == ['_E']
+
+            inner_nodes = F.asnumpy(F.boolean_mask(part_g.ndata[dgl.NID],
+                                                   part_g.ndata['inner_node']))
+            assert_array_equal(inner_nodes, F.asnumpy(gpb.partid2nids(i)))
+            assert_array_equal(F.asnumpy(gpb.nid2localnid(F.tensor(inner_nodes), i)),
+                               np.arange(len(inner_nodes)))
+            inner_edges = F.asnumpy(F.boolean_mask(part_g.edata[dgl.EID],
+                                                   part_g.edata['inner_edge']))
+            assert_array_equal(inner_edges, F.asnumpy(gpb.partid2eids(i)))
+            num_inner_edges += len(inner_edges)
+
+            # Every node inside the partition comes from this partition.
+            orig_nids = F.asnumpy(part_g.ndata['orig_id'])
+            inner_mask = F.asnumpy(part_g.ndata['inner_node']) == 1
+            assert np.all(node_parts[orig_nids[inner_mask]] == i)
+            assert_array_equal(F.asnumpy(part_g.ndata['part_id']), node_parts[orig_nids])
+
+            # The edges map back to the edges of the original graph.
+            part_src, part_dst = part_g.edges()
+            orig_eids = F.asnumpy(part_g.edata['orig_id'])
+            assert_array_equal(orig_nids[F.asnumpy(part_src)], src[orig_eids])
+            assert_array_equal(orig_nids[F.asnumpy(part_dst)], dst[orig_eids])
+            inner_edge_mask = F.asnumpy(part_g.edata['inner_edge']) == 1
+            assert np.all(node_parts[dst[orig_eids[inner_edge_mask]]] == i)
+
+            assert_array_equal(F.asnumpy(node_feats['_N/feats']),
+                               nfeats[orig_nids[inner_mask]])
+            assert_array_equal(F.asnumpy(edge_feats['_E/feats']),
+                               efeats[orig_eids[inner_edge_mask]])
+            assert not any(name.startswith('.spill_')
+                           for name in os.listdir(os.path.join(test_dir, 'part' + str(i))))
+        assert num_inner_edges == g.number_of_edges()
+
+@pytest.mark.parametrize('use_table', [True, False])
+def test_range_index_bounds(monkeypatch, use_table):
+    from dgl.distributed import graph_partition_book as gpb
+    if not use_table:
+        monkeypatch.setattr(gpb, 'LOOKUP_TABLE_MAX_IDS', 0)
+    index = gpb._RangeIndex([3, 5, 10])
+    assert_array_equal(index(np.array([0, 2, 3, 4, 5, 9])), [0, 0, 1, 1, 2, 2])
+    assert len(index(np.array([], dtype=np.int64))) == 0
+    for ids in [[9, 10], [12], [-1, 0]]:
+        with pytest.raises(dgl.DGLError):
+            index(np.array(ids))
+
 if __name__ == '__main__':
     os.makedirs('/tmp/partition', exist_ok=True)
     test_partition()
     test_hetero_partition()
+    test_partition_streaming()
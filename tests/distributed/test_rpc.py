@@ -1,6 +1,7 @@
 import os
 import time
 import socket
+import numpy as np
 
 import dgl
 import backend as F
@@ -139,6 +140,8 @@ def start_server(num_clients, ip_config, server_id=0, keep_alive=False, num_serv
 
 def start_client(ip_config, group_id=0, num_servers=1, net_type='tensorpipe'):
     dgl.distributed.register_service(HELLO_SERVICE_ID, HelloRequest, HelloResponse)
+    dgl.distributed.register_service(
+        TIMEOUT_SERVICE_ID, TimeoutRequest, TimeoutResponse)
     dgl.distributed.connect_to_server(
         ip_config=ip_config, num_servers=num_servers, group_id=group_id, net_type=net_type)
     req = HelloRequest(STR, INTEGER, TENSOR, simple_func)
@@ -172,6 +175,30 @@ def start_client(ip_config, group_id=0, num_servers=1, net_type='tensorpipe'):
         assert res.hello_str == STR
         assert res.integer == INTEGER
         assert_array_equal(F.asnumpy(res.tensor), F.asnumpy(TENSOR))
+    # test batched requests of different services to the same machine
+    get_num_req = dgl.distributed.rpc.GetNumberClientsRequest(0)
+    target_and_requests = [(0, req), (0, get_num_req), (0, req)]
+    res_list = dgl.distributed.remote_call_batched_to_machine(target_and_requests)
+    assert len(res_list) == 3
+    assert res_list[1].num_client == dgl.distributed.get_num_client()
+    for res in [res_list[0], res_list[2]]:
+        assert res.hello_str == STR
+        assert res.integer == INTEGER
+        assert_array_equal(F.asnumpy(res.tensor), F.asnumpy(TENSOR))
+    # test batched requests whose trailing request has no response
+    no_res_req = TimeoutRequest(TIMEOUT_META, 0, response=False)
+    target_and_requests = [(0, req), (0, no_res_req)]
+    res_list = dgl.distributed.remote_call_batched_to_machine(target_and_requests)
+    assert len(res_list) == 2
+    assert res_list[0].hello_str == STR
+    assert res_list[1] is None
+    # test requests of non-batchable services are rejected before being sent
+    barrier_req = dgl.distributed.rpc.ClientBarrierRequest()
+    with pytest.raises(dgl.DGLError):
+        dgl.distributed.remote_call_batched_to_machine([(0, req), (0, barrier_req)])
+    res_list = dgl.distributed.remote_call_batched_to_machine([(0, req)])
+    assert len(res_list) == 1
+    assert res_list[0].hello_str == STR
 
 
 def start_client_timeout(ip_config, group_id=0, num_servers=1, net_type='tensorpipe'):
@@ -253,6 +280,41 @@ def test_serialize():
     res1 = deserialize_from_payload(MyResponse, data, tensors)
     assert res.x == res1.x
 
+def test_serialize_codec():
+    reset_envs()
+    os.environ['DGL_DIST_MODE'] = 'distributed'
+    from dgl.distributed.rpc import serialize_to_payload, deserialize_from_payload
+    from dgl.distributed.rpc import _deserialize_from_payload
+    ids = F.tensor(np.sort(np.random.randint(0, 1000000, (1000,))), F.int64)
+    feats = F.tensor(np.random.randn(1000, 16), F.float32)
+    for id_codec, feat_codec in [('delta_varint', 'fp16'), ('zlib', 'bf16'),
+                                 ('delta_varint', 'int8'), (None, 'zlib')]:
+        req = MyRequest()
+        req.z = ids
+        data, tensors = serialize_to_payload(req, (id_codec, feat_codec), (id_codec, None))
+        if id_codec == 'delta_varint':
+            assert sum(F.asnumpy(t).nbytes for t in tensors) < F.asnumpy(ids).nbytes
+        req1, accept_codecs = _deserialize_from_payload(MyRequest, data, tensors)
+        assert accept_codecs == (id_codec, None)
+        assert req.x == req1.x
+        assert F.array_equal(req.z, req1.z)
+
+        req.z = feats
+        data, tensors = serialize_to_payload(req, (id_codec, feat_codec))
+        req1 = deserialize_from_payload(MyRequest, data, tensors)
+        assert F.allclose(req.z, req1.z, rtol=0.02, atol=0.05)
+
+def test_bf16_codec_special_values():
+    from dgl.distributed.codec import BFloat16Codec
+    # Signaling, all-ones and quiet NaNs, infinities and finite values
+    bits = np.array([0x7F800001, 0xFFFFFFFF, 0x7FC00000, 0x7F800000, 0xFF800000,
+                     0x3F800000, 0x00000000], dtype=np.uint32)
+    arr = bits.view(np.float32)
+    meta, arrays = BFloat16Codec.encode(arr)
+    res = BFloat16Codec.decode(meta, arrays)
+    assert np.all(np.isnan(res[:3]))
+    assert_array_equal(res[3:], arr[3:])
+
 def test_rpc_msg():
     reset_envs()
     os.environ['DGL_DIST_MODE'] = 'distributed'
@@ -413,6 +475,7 @@ def test_multi_client_connect(net_type):
 
 if __name__ == '__main__':
     test_serialize()
+    test_serialize_codec()
     test_rpc_msg()
     test_rpc()
     test_multi_client('socket')
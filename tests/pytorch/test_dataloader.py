@@ -24,6 +24,44 @@ def test_graph_dataloader():
         assert isinstance(graph, dgl.DGLGraph)
         assert F.asnumpy(label).shape[0] == batch_size
 
+@pytest.mark.parametrize('num_workers', [0, 2])
+def test_packed_graph_dataloader(num_workers):
+    samples = []
+    for i in range(20):
+        num_nodes, num_edges = i % 5 + 1, i % 7
+        src = torch.randint(0, num_nodes, (num_edges,))
+        dst = torch.randint(0, num_nodes, (num_edges,))
+        g = dgl.graph((src, dst), num_nodes=num_nodes)
+        g.ndata['x'] = torch.randn(g.num_nodes(), 3)
+        g.edata['w'] = torch.randn(g.num_edges())
+        samples.append((g, torch.tensor(i)))
+    dataset = dgl.data.PackedGraphDataset(samples)
+    assert len(dataset) == 20
+
+    def check(bg, labels):
+        expected = dgl.batch([samples[i][0] for i in F.asnumpy(labels)])
+        assert F.array_equal(bg.batch_num_nodes(), expected.batch_num_nodes())
+        assert F.array_equal(bg.batch_num_edges(), expected.batch_num_edges())
+        for u, v in zip(bg.edges(), expected.edges()):
+            assert F.array_equal(u, v)
+        assert F.allclose(bg.ndata['x'], expected.ndata['x'])
+        assert F.allclose(bg.edata['w'], expected.edata['w'])
+
+    g, label = dataset[3]
+    check(dgl.batch([g]), label.view(1))
+    # contiguous and non-contiguous minibatches
+    check(*dataset[[4, 5, 6]])
+    check(*dataset[torch.tensor([7, 2, 2, 19])])
+
+    dataloader = dgl.dataloading.GraphDataLoader(
+        dataset, batch_size=6, shuffle=True, drop_last=True, num_workers=num_workers)
+    num_graphs = 0
+    for bg, labels in dataloader:
+        assert bg.batch_size == 6
+        check(bg, labels)
+        num_graphs += bg.batch_size
+    assert num_graphs == 18
+
 @unittest.skipIf(os.name == 'nt', reason='Do not support windows yet')
 @pytest.mark.parametrize('num_workers', [0, 4])
 def test_cluster_gcn(num_workers):
@@ -381,5 +419,177 @@ def test_edge_dataloader_excludes(exclude, always_exclude_flag):
         else:
             assert not np.isin(edges_to_exclude, block_eids).any()
 
+@pytest.mark.parametrize('policy', ['lru', 'lfu', 'static'])
+def test_cached_feature_storage(policy):
+    feat = torch.randn(100, 4)
+    cache = dgl.storages.CachedFeatureStorage(
+        feat, 100, 10, policy=policy,
+        preload_ids=torch.arange(10) if policy == 'static' else None)
+    for _ in range(5):
+        indices = torch.randint(0, 20, (30,))
+        result = cache.fetch(indices, torch.device('cpu'))
+        assert torch.equal(result, feat[indices])
+    stats = cache.stats()
+    assert stats['hits'] + stats['misses'] == 150
+    assert stats['hits'] > 0
+    assert stats['cached_rows'] == 10
+
+def test_cached_feature_storage_lfu_aging():
+    from dgl.storages.cache import LFU_AGING_PERIOD
+    feat = torch.randn(100, 4)
+    cache = dgl.storages.CachedFeatureStorage(feat, 100, 2, policy='lfu')
+    for _ in range(10):
+        cache.fetch(torch.tensor([0]), torch.device('cpu'))
+    # Rows requested once each; row 0 is never requested again.
+    for i in range(5 * LFU_AGING_PERIOD):
+        cache.fetch(torch.tensor([1 + i % 3]), torch.device('cpu'))
+    # The count of row 0 has decayed, so it has been evicted.
+    assert 0 not in cache._id_of.tolist()
+
+def test_cached_feature_storage_memory():
+    # The index must not allocate per row of the wrapped storage.
+    feat = torch.randn(100, 4)
+    cache = dgl.storages.CachedFeatureStorage(feat, 10 ** 12, 10)
+    for v in vars(cache).values():
+        if isinstance(v, torch.Tensor):
+            assert v.numel() <= 10
+    indices = torch.randint(0, 100, (50,))
+    for _ in range(2):
+        assert torch.equal(cache.fetch(indices, torch.device('cpu')), feat[indices])
+    assert cache.stats()['cached_rows'] == 10
+
+@pytest.mark.parametrize('policy', ['lru', 'static'])
+@pytest.mark.parametrize('num_workers', [0, 2])
+def test_dataloader_feature_cache(policy, num_workers):
+    g = dgl.graph(([0, 0, 0, 1, 1, 2, 3], [1, 2, 3, 3, 4, 4, 0]))
+    g.ndata['feat'] = torch.randn(5, 8)
+    sampler = dgl.dataloading.MultiLayerNeighborSampler([3], prefetch_node_feats=['feat'])
+    dataloader = dgl.dataloading.DataLoader(
+        g, torch.arange(5), sampler, batch_size=2, num_workers=num_workers,
+        feature_cache_size=3, feature_cache_policy=policy)
+    # The caches are built in the main process before the workers start.
+    it = iter(dataloader)
+    assert ('_N', 'feat') in dataloader._feature_caches
+    del it
+    for _ in range(2):
+        for input_nodes, output_nodes, blocks in dataloader:
+            assert torch.equal(blocks[0].srcdata['feat'], g.ndata['feat'][input_nodes])
+    stats = dataloader.feature_cache_stats()['_N']['feat']
+    assert stats['hits'] > 0
+
+@pytest.mark.parametrize('num_workers', [0, 2])
+def test_dataloader_overlap_epochs(num_workers):
+    g = dgl.graph(([0, 1, 2, 3, 4, 5, 6, 7], [1, 2, 3, 4, 5, 6, 7, 0]))
+    sampler = dgl.dataloading.MultiLayerNeighborSampler([2])
+
+    def run_epochs(seed):
+        torch.manual_seed(seed)
+        dataloader = dgl.dataloading.DataLoader(
+            g, torch.arange(8), sampler, batch_size=3, shuffle=True,
+            num_workers=num_workers, overlap_epochs=True)
+        orders = []
+        for _ in range(3):
+            orders.append(torch.cat([
+                output_nodes for _, output_nodes, _ in dataloader]))
+            # The next epoch has already started.
+            assert dataloader._next_epoch_it is not None
+        return orders
+
+    orders = run_epochs(0)
+    for order in orders:
+        assert torch.equal(torch.sort(order)[0], torch.arange(8))
+    # The shuffling order only depends on the seed and the epoch.
+    for order, order2 in zip(orders, run_epochs(0)):
+        assert torch.equal(order, order2)
+
+@pytest.mark.parametrize('num_threads', [1, 4])
+def test_numpy_storage(tmpdir, num_threads):
+    arr = np.memmap(os.path.join(tmpdir, 'feat.npy'), dtype='float32', mode='w+',
+                    shape=(5000, 16))
+    arr[:] = np.random.randn(5000, 16)
+    storage = dgl.storages.NumpyStorage(arr, num_threads=num_threads)
+    for indices in [torch.randint(0, 5000, (3000,)), torch.arange(1000, 4000),
+                    torch.arange(10)]:
+        result = storage.fetch(indices, torch.device('cpu')).wait()
+        assert np.array_equal(result.numpy(), arr[indices.numpy()])
+
+class _NumpyFetchDataset(torch.utils.data.Dataset):
+    def __init__(self, storage):
+        self.storage = storage
+
+    def __len__(self):
+        return 4
+
+    def __getitem__(self, i):
+        return self.storage.fetch(torch.arange(i, 5000, 2), torch.device('cpu')).wait()
+
+@unittest.skipIf(os.name == 'nt', reason='Fork is not available on Windows')
+def test_numpy_storage_after_fork(tmpdir):
+    arr = np.memmap(os.path.join(tmpdir, 'feat.npy'), dtype='float32', mode='w+',
+                    shape=(5000, 16))
+    arr[:] = np.random.randn(5000, 16)
+    storage = dgl.storages.NumpyStorage(arr, num_threads=4)
+    # Gather in parallel in the parent before the workers are forked.
+    storage.fetch(torch.arange(5000), torch.device('cpu')).wait()
+    dataloader = DataLoader(
+        _NumpyFetchDataset(storage), batch_size=None, num_workers=2,
+        multiprocessing_context='fork', timeout=30)
+    for i, result in enumerate(dataloader):
+        assert np.array_equal(result.numpy(), arr[i:5000:2])
+
+def test_threaded_future():
+    from dgl.storages import ThreadedFuture, FetchStats, FetchGroup
+    stats = FetchStats()
+    with FetchGroup() as group:
+        futures = [ThreadedFuture(target=lambda x: x * 2, args=(i,), stats=stats)
+                   for i in range(10)]
+    assert [f.wait() for f in futures] == [i * 2 for i in range(10)]
+    assert stats.count == 10
+    assert stats.as_dict()['mean_run_time'] >= 0
+    group.cancel()      # no-op on finished fetches
+    assert all(f.done() for f in futures)
+
+class _ThreadedFetchDataset(torch.utils.data.Dataset):
+    def __len__(self):
+        return 4
+
+    def __getitem__(self, i):
+        return dgl.storages.ThreadedFuture(target=lambda x: x * 2, args=(i,)).wait()
+
+@unittest.skipIf(os.name == 'nt', reason='Fork is not available on Windows')
+def test_threaded_future_after_fork():
+    # The shared executor is used in the parent before the workers are forked.
+    assert dgl.storages.ThreadedFuture(target=lambda x: x, args=(1,)).wait() == 1
+    dataloader = DataLoader(
+        _ThreadedFetchDataset(), batch_size=2, num_workers=2,
+        multiprocessing_context='fork', timeout=30)
+    assert torch.cat(list(dataloader)).tolist() == [0, 2, 4, 6]
+
+def test_staging_ring():
+    from dgl.storages import StagingBuffer, StagingRing
+    ring = StagingRing(2, pin_memory=False)
+    feats = torch.randn(100, 8)
+    labels = torch.arange(100)
+    for i in range(6):
+        buf = ring.next()
+        with buf:
+            assert StagingBuffer.current() is buf
+            idx = torch.randint(0, 100, (50,))
+            x = buf.empty((50, 8), torch.float32)
+            torch.index_select(feats, 0, idx, out=x)
+            y = buf.empty((50,), torch.int64)
+            torch.index_select(labels, 0, idx, out=y)
+            assert torch.equal(x, feats[idx])
+            assert torch.equal(y, idx)
+            # Fetches to CPU do not use the staging buffer.
+            z = dgl.storages.TensorStorage(feats).fetch(idx, torch.device('cpu'))
+            assert torch.equal(z, feats[idx])
+        assert StagingBuffer.current() is None
+        if i == 1:
+            num_allocations = ring.num_allocations
+    # The buffers are reused once they have grown to the minibatch size.
+    assert ring.num_allocations == num_allocations
+    assert ring.nbytes >= 2 * 50 * (8 * 4 + 8)
+
 if __name__ == '__main__':
     test_node_dataloader(F.int32, 'neighbor', None)
@@ -1185,6 +1185,49 @@ def test_hetero_conv(agg, idtype):
              {'user': uf, 'game': gf, 'store': sf[0:0]}))
     assert set(h.keys()) == {'user', 'game'}
 
+@parametrize_idtype
+@pytest.mark.parametrize('agg', ['sum', 'mean'])
+@pytest.mark.parametrize('out_feats', [3, 6])
+@pytest.mark.parametrize('mod_type', ['graphconv', 'sageconv', 'gatconv', 'mixed'])
+def test_hetero_conv_fused(agg, out_feats, mod_type, idtype):
+    g = dgl.heterograph({
+        ('user', 'follows', 'user'): ([0, 0, 2, 1], [1, 2, 1, 3]),
+        ('user', 'likes', 'user'): ([3, 1, 2], [0, 0, 1]),
+        ('user', 'plays', 'game'): ([0, 0, 0, 1, 2], [0, 2, 3, 0, 2]),
+        ('user', 'rates', 'game'): ([3, 3], [1, 2]),
+        ('store', 'sells', 'game'): ([0, 0, 1, 1], [0, 3, 1, 2])},
+        idtype=idtype, device=F.ctx())
+
+    def make_mod(i):
+        if mod_type == 'graphconv':
+            return nn.GraphConv(4, out_feats, norm=['both', 'right', 'left', 'none'][i % 4])
+        elif mod_type == 'sageconv':
+            return nn.SAGEConv(4, out_feats, 'mean')
+        elif mod_type == 'gatconv':
+            return nn.GATConv(4, out_feats, num_heads=2, residual=(i % 2 == 0))
+        # 'pool' is not fusable and is computed separately.
+        return [nn.GraphConv(4, out_feats), nn.SAGEConv(4, out_feats, 'mean'),
+                nn.SAGEConv(4, out_feats, 'pool')][i % 3]
+    conv = nn.HeteroGraphConv(
+        {etype: make_mod(i) for i, etype in enumerate(g.etypes)}, agg, fused=True)
+    conv = conv.to(F.ctx()).eval()
+    for param in conv.parameters():
+        th.nn.init.normal_(param)
+
+    feats = {'user': F.randn((4, 4)), 'game': F.randn((4, 4)), 'store': F.randn((2, 4))}
+    block = dgl.to_block(
+        g.to(F.cpu()), {'user': [0, 1], 'game': [0, 1, 2, 3], 'store': []}).to(F.ctx())
+    block_feats = {ntype: feats[ntype][block.srcnodes[ntype].data[dgl.NID].long()]
+                   for ntype in block.srctypes}
+    for graph, inputs in [(g, feats), (block, block_feats)]:
+        conv.fused = True
+        h_fused = conv(graph, inputs)
+        conv.fused = False
+        h = conv(graph, inputs)
+        assert set(h_fused.keys()) == set(h.keys())
+        for ntype in h:
+            assert F.allclose(h_fused[ntype], h[ntype], rtol=1e-4, atol=1e-4)
+
 @pytest.mark.parametrize('out_dim', [1, 2, 100])
 def test_hetero_linear(out_dim):
     in_feats = {